@@ -6,6 +6,8 @@ import pandas as pd
 RESULTS_DIR = "../results"
 OUTPUT_DIR = "."
 SUBDIRS = ["generation", "execution", "test_results", "static_analysis", "hallucination"]
+DURATION_COLUMNS = ["execution_duration", "net_execution_duration"]
+ALLOCATION_COLUMNS = ["alloc_bytes", "alloc_count", "peak_heap"]
 
 def merge_task_files(subdir_name):
     """
@@ -35,12 +37,113 @@ def merge_task_files(subdir_name):
         print(f"No valid files found in {subdir_path}")
         return pd.DataFrame()
 
+def summarize_test_results():
+    """
+    Average the per-case durations in test_results.ndjson for each task_id.
+    Returns columns mean_execution_duration and, for calibrated runs, mean_net_execution_duration,
+    plus mean_alloc_bytes, mean_alloc_count and mean_peak_heap for allocation-profiled runs.
+    Runtime-matrix runs are averaged over all runtimes here; see summarize_runtime_results
+    """
+    file_path = os.path.join(OUTPUT_DIR, "test_results.ndjson")
+    if not os.path.exists(file_path):
+        return pd.DataFrame()
+    
+    try:
+        df = pd.read_json(file_path, lines=True)
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return pd.DataFrame()
+    
+    columns = [col for col in DURATION_COLUMNS + ALLOCATION_COLUMNS if col in df.columns]
+    if "task_id" not in df.columns or not columns:
+        return pd.DataFrame()
+    
+    summary = df.groupby("task_id")[columns].mean()
+    summary.columns = [f"mean_{col}" for col in columns]
+    return summary.reset_index()
+
+def summarize_runtime_results():
+    """
+    Summarize test_results.ndjson per task_id and runtime_id for runtime-matrix runs.
+    Writes the test pass rate and mean durations of each solution under each runtime to
+    runtime_results.ndjson, with model, language, prompt_type and task_name from the task_id
+    """
+    file_path = os.path.join(OUTPUT_DIR, "test_results.ndjson")
+    if not os.path.exists(file_path):
+        return pd.DataFrame()
+    
+    try:
+        df = pd.read_json(file_path, lines=True)
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return pd.DataFrame()
+    
+    if "runtime_id" not in df.columns or df["runtime_id"].isna().all():
+        return pd.DataFrame()
+    
+    df = df.dropna(subset=["runtime_id"])
+    columns = [col for col in DURATION_COLUMNS if col in df.columns]
+    grouped = df.groupby(["task_id", "runtime_id"])
+    summary = grouped[columns].mean()
+    summary.columns = [f"mean_{col}" for col in columns]
+    summary["test_pass_rate"] = grouped["test_passed"].mean()
+    summary["test_count"] = grouped.size()
+    summary = summary.reset_index()
+    
+    parts = summary["task_id"].str.split("_", n=3, expand=True)
+    summary["language"], summary["model"], summary["prompt_type"], summary["task_name"] = parts[0], parts[1], parts[2], parts[3]
+    
+    output_file = os.path.join(OUTPUT_DIR, "runtime_results.ndjson")
+    summary.to_json(output_file, orient='records', lines=True)
+    print(f"Created {output_file} with {len(summary)} records")
+    return summary
+
+def summarize_phase_timings():
+    """
+    Aggregate the per-run phase timings in test_results.ndjson by stage.
+    Returns per-task mean seconds per stage (mean_phase_{stage}) and writes the overall
+    mean, median and total per language and stage to phase_timings.ndjson
+    """
+    file_path = os.path.join(OUTPUT_DIR, "test_results.ndjson")
+    if not os.path.exists(file_path):
+        return pd.DataFrame()
+    
+    try:
+        df = pd.read_json(file_path, lines=True)
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return pd.DataFrame()
+    
+    if "phase_timings" not in df.columns:
+        return pd.DataFrame()
+    
+    df = df[df["phase_timings"].apply(lambda value: isinstance(value, dict))]
+    if df.empty:
+        return pd.DataFrame()
+    
+    phases = pd.json_normalize(df["phase_timings"].tolist())
+    phases.insert(0, "task_id", df["task_id"].values)
+    stages = [col for col in phases.columns if col != "task_id"]
+    
+    long_df = phases.melt(id_vars="task_id", value_vars=stages, var_name="stage", value_name="seconds").dropna()
+    long_df["language"] = long_df["task_id"].str.split("_").str[0]
+    by_stage = long_df.groupby(["language", "stage"])["seconds"].agg(["mean", "median", "sum", "count"]).reset_index()
+    by_stage = by_stage.rename(columns={"sum": "total"})
+    output_file = os.path.join(OUTPUT_DIR, "phase_timings.ndjson")
+    by_stage.to_json(output_file, orient='records', lines=True)
+    print(f"Created {output_file} with {len(by_stage)} records")
+    
+    per_task = phases.groupby("task_id")[stages].mean()
+    per_task.columns = [f"mean_phase_{stage}" for stage in stages]
+    return per_task.reset_index()
+
 def merge_all_files():
     """
     Merge the consolidated files from each subdirectory into a single file
-    using task_id as the key. Excludes test_results data due to its different structure.
+    using task_id as the key. test_results has one record per test case, so only its
+    per-task mean durations and mean phase timings are merged.
     """
-    print("Merging all consolidated files (excluding test_results)...")
+    print("Merging all consolidated files (test_results as per-task mean durations and phase timings)...")
     merged_data = {}
     
     merge_subdirs = [s for s in SUBDIRS if s != "test_results"]
@@ -92,6 +195,13 @@ def merge_all_files():
                     if merged_data[task_id]["status"] != "invalid":
                         merged_data[task_id]["status"] = "invalid"
     
+    for summary in (summarize_test_results(), summarize_phase_timings()):
+        for _, row in summary.iterrows():
+            if row["task_id"] in merged_data:
+                for col in summary.columns:
+                    if col != "task_id":
+                        merged_data[row["task_id"]][col] = row[col]
+    
     final_df = pd.DataFrame(list(merged_data.values()))
     
     output_file = os.path.join(OUTPUT_DIR, "merged_results.ndjson")
@@ -106,6 +216,7 @@ def main():
         merge_task_files(subdir)
     
     merge_all_files()
+    summarize_runtime_results()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
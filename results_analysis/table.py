@@ -6,6 +6,41 @@ from metrics import (load_ndjson, filter_valid_tasks, calculate_functional_corre
                     calculate_readability, calculate_robustness, calculate_maintainability,
                     calculate_security, calculate_hallucination_rate)
 
+# Mean per-case durations in seconds; lower is better
+TIMING_COLUMNS = ['mean_execution_duration', 'mean_net_execution_duration']
+# Allocation metrics; lower is better. Each language's harness measures them differently,
+# so they are only ranked within a language
+MEMORY_COLUMNS = ['mean_alloc_bytes', 'mean_alloc_count', 'mean_peak_heap']
+
+
+def load_runtime_data(data_path, filters=None):
+    """
+    Load the per-runtime summary written by merge_data.py for runtime-matrix runs.
+
+    Args:
+        data_path: Path to runtime_results.ndjson.
+        filters: Dictionary of filter conditions {column_name: list of values}.
+
+    Returns:
+        The filtered DataFrame, or None if there is no data.
+    """
+    if not os.path.exists(data_path):
+        print(f"No runtime data at {data_path}; run merge_data.py after a runtime-matrix test run")
+        return None
+    print(f"Loading runtime data from: {data_path}")
+    df = load_ndjson(data_path)
+    
+    if filters:
+        for column, values in filters.items():
+            if column in df.columns and values:
+                df = df[df[column].isin(values)]
+    
+    print(f"Filtered data contains {len(df)} records")
+    if len(df) == 0:
+        return None
+    print(f"Runtimes: {df['runtime_id'].unique()}")
+    return df
+
 
 def load_and_process_data(data_path, filters=None):
     """
@@ -172,6 +207,11 @@ def load_and_process_data(data_path, filters=None):
     
     print(f"Final CQS: Min={result['cqs'].min():.2f}, Max={result['cqs'].max():.2f}, Mean={result['cqs'].mean():.2f}")
     
+    # Timing and allocation columns merged from test_results by merge_data.py
+    for col in TIMING_COLUMNS + MEMORY_COLUMNS:
+        if col in df.columns:
+            result = result.merge(df[['task_id', col]].drop_duplicates('task_id'), on='task_id', how='left')
+    
     return result
 
 
@@ -331,21 +371,39 @@ def create_pivot_table(df, index_cols, columns_col, values_col, agg_func='mean',
                 pivot = pivot[valid_cols + other_cols]
                 print(f"Columns reordered to: {valid_cols + other_cols}")
     
+    per_language = values_col in MEMORY_COLUMNS
+    if per_language and columns_col == 'language':
+        # One rank per language column instead of a rank of the average over languages
+        if add_rank:
+            for col in list(pivot.columns):
+                pivot[f'Rank ({col})'] = pivot[col].rank(ascending=True)
+        pivot = pivot.round(2)
+        if output_path:
+            print(f"Saving to {output_path}")
+            pivot.to_csv(output_path)
+        return pivot
+    
     # Average column
     if pivot.shape[1] > 1:  # If there are multiple columns
         pivot['Average'] = pivot.mean(axis=1)
     
+    if per_language and add_rank and 'Average' in pivot.columns:
+        # Rows of different languages are ranked separately
+        pivot['Rank'] = pivot.groupby(level='language')['Average'].rank(ascending=True)
+        if sort_by_rank:
+            pivot = pivot.reset_index().sort_values(['language', 'Rank']).set_index(index_cols)
+    
     # Rank column and sort
-    if add_rank and 'Average' in pivot.columns:
+    elif add_rank and 'Average' in pivot.columns:
         # Use different sort directions for different metrics
-        ascending = True if values_col == 'hallucination_rate' else False
+        ascending = True if values_col == 'hallucination_rate' or values_col in TIMING_COLUMNS + MEMORY_COLUMNS else False
         pivot['Rank'] = pivot['Average'].rank(ascending=ascending)
         
         if sort_by_rank:
             pivot = pivot.sort_values('Rank')
     
-    # Round to 2 decimal places
-    pivot = pivot.round(2)
+    # Round to 2 decimal places (durations are in seconds and need more)
+    pivot = pivot.round(4 if values_col in TIMING_COLUMNS else 2)
     
     if output_path:
         print(f"Saving to {output_path}")
@@ -361,6 +419,8 @@ def parse_arguments():
     # Basic parameters
     parser.add_argument('--data_path', type=str, default='merged_results.ndjson',
                       help='Path to the merged results data file')
+    parser.add_argument('--runtime_data_path', type=str, default='runtime_results.ndjson',
+                      help='Path to the per-runtime results, used when runtime_id is a row or column dimension')
     parser.add_argument('--output_dir', type=str, default='table_output',
                       help='Directory to save output files')
     parser.add_argument('--output_file', type=str, default='results_table.csv',
@@ -380,9 +440,13 @@ def parse_arguments():
     parser.add_argument('--index', type=str, nargs='+', default=['model'],
                       help='Column(s) to use as index (rows). Use "metrics" to use metrics as rows.')
     parser.add_argument('--columns', type=str, default='language',
-                      help='Column to use for pivot table columns. Use "metrics" to use metrics as columns.')
+                      help='Column to use for pivot table columns. Use "metrics" to use metrics as columns, '
+                           'or "runtime_id" to compare runtimes from a runtime-matrix run.')
     parser.add_argument('--values', type=str, default='cqs',
-                      help='Value to display in cells (functional_correctness, readability, robustness, maintainability, security, hallucination_rate, cqs)')
+                      help='Value to display in cells (functional_correctness, readability, robustness, maintainability, security, hallucination_rate, cqs, '
+                           'et = mean_execution_duration, net = mean_net_execution_duration, '
+                           'ab = mean_alloc_bytes, ac = mean_alloc_count, ph = mean_peak_heap, '
+                           'tpr = test_pass_rate (runtime_id tables only))')
     parser.add_argument('--agg_func', type=str, default='mean',
                       help='Aggregation function (mean, median, sum, count, min, max)')
     parser.add_argument('--column_order', type=str, nargs='+', default=None,
@@ -413,7 +477,11 @@ def main():
     if args.tasks is not None:
         filters['task_name'] = args.tasks
     
-    result_df = load_and_process_data(args.data_path, filters)
+    by_runtime = args.columns == 'runtime_id' or 'runtime_id' in args.index
+    if by_runtime:
+        result_df = load_runtime_data(args.runtime_data_path, filters)
+    else:
+        result_df = load_and_process_data(args.data_path, filters)
     
     if result_df is None or len(result_df) == 0:
         print("No data available after filtering. Check the filter criteria.")
@@ -426,7 +494,13 @@ def main():
             'rb': 'robustness',
             'm': 'maintainability',
             's': 'security',
-            'hr': 'hallucination_rate'
+            'hr': 'hallucination_rate',
+            'et': 'mean_execution_duration',
+            'net': 'mean_net_execution_duration',
+            'ab': 'mean_alloc_bytes',
+            'ac': 'mean_alloc_count',
+            'ph': 'mean_peak_heap',
+            'tpr': 'test_pass_rate'
         }
         
         requested_value = value_mapping.get(args.values, args.values)
@@ -435,10 +509,16 @@ def main():
         if requested_value not in result_df.columns:
             print(f"Warning: Requested value '{requested_value}' not found in data.")
             print(f"Available values: {', '.join(result_df.columns)}")
-            print("Using 'functional_correctness' as fallback.")
-            args.values = 'functional_correctness'
+            fallback = 'mean_execution_duration' if by_runtime else 'functional_correctness'
+            print(f"Using '{fallback}' as fallback.")
+            args.values = fallback
         else:
             args.values = requested_value
+        
+        if args.values in MEMORY_COLUMNS and 'language' not in args.index + [args.columns] and result_df['language'].nunique() > 1:
+            print(f"'{args.values}' is measured differently in each language and cannot be pooled across them.")
+            print("Use language as a row or column dimension (e.g. --columns language), or select one language with --languages.")
+            return
     
     pivot = create_pivot_table(
         result_df,
@@ -9,6 +9,7 @@ import logging
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from src.analyzer import analyze_tasks
+from src.dedup import get_dedup_settings
 from src.sonarqube import SonarQubeAnalyzer
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -49,7 +50,8 @@ def main():
         'tasks': config['task_names'],
         'completeness_levels': config['prompt_templates']['completeness_levels'],
         'models': {model: endpoint for model, endpoint in config['api_endpoints'].items()},
-        'base_output_dir': os.path.join(os.path.dirname(__file__), '..', 'codes')
+        'base_output_dir': os.path.join(os.path.dirname(__file__), '..', 'codes'),
+        'dedup': get_dedup_settings(config.get('runner', {}).get('dedup'))['enabled']
     }
     
     temp_dir = os.environ.get('TEMP_DIR')
@@ -64,6 +66,7 @@ def main():
     logger.info(f"Tasks: {test_params['tasks']}")
     logger.info(f"Completeness levels: {test_params['completeness_levels']}")
     logger.info(f"Models: {list(test_params['models'].keys())}")
+    logger.info(f"Dedup of identical files: {test_params['dedup']}")
     logger.info(f"Base output directory: {test_params['base_output_dir']}\n")
     
     success = analyze_tasks(**test_params)
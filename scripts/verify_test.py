@@ -2,53 +2,58 @@ import os
 import sys
 import glob
 import json
+import asyncio
+import argparse
 from datetime import datetime
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(BASE_DIR)
 
-from src.test_manager import execute_task, test_task
+from src.runner import precompile_go
+from src.calibration import calibrate_spawn_overhead, save_calibration, sequential_runs, threaded_runs
+from src.test_manager import execute_task, test_task, execute_task_async, test_task_async, save_results, get_task_components
+from src.workers import configure_workers, shutdown_workers
+from src.subinterpreters import configure_subinterpreters, shutdown_subinterpreters
+from src.go_suite import configure_go_suite, shutdown_go_suite
+from src.result_writer import configure_result_writer, close_result_writer
+from src.isolation import configure_isolation, isolated_concurrency
+from src.transport import configure_transport
+from src.runtimes import discover_runtimes, resolve_runtime
+from src.load_test import get_load_test_settings, load_test_task
+from src.parallel import get_parallel_settings, run_parallel, pool_runs
+from src.eval_cache import configure_eval_cache
+from src.dedup import get_dedup_settings, group_equivalent_solutions, save_equivalence_classes, fan_out
+
+LANGUAGE_EXTENSIONS = {
+    'python': '.py',
+    'javascript': '.js',
+    'go': '.go'
+}
 
 def load_config():
     config_path = os.path.join(BASE_DIR, 'config', 'config.json')
     with open(config_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def verify_test():
-    print(f"Starting verification at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    config = load_config()
-    
-    tasks = config.get('task_names', [])
-    languages = config.get('languages', [])
-    models = list(config.get('api_endpoints', {}).keys())
-    completeness_levels = config.get('prompt_templates', {}).get('completeness_levels', [])
-    
-    print(f"Configuration loaded:")
-    print(f"- Tasks: {tasks}")
-    print(f"- Languages: {languages}")
-    print(f"- Models: {models}")
-    print(f"- Completeness levels: {completeness_levels}")
-    
-    language_extensions = {
-        'python': '.py',
-        'javascript': '.js',
-        'go': '.go'
-    }
-    
-    results_dir = os.path.join(BASE_DIR, 'results')
-    os.makedirs(os.path.join(results_dir, 'execution'), exist_ok=True)
-    os.makedirs(os.path.join(results_dir, 'test_results'), exist_ok=True)
-    
+def get_resource_limits(runner_config, task_name):
+    """Merge the default resource limits with the overrides configured for a task."""
+    limits_config = runner_config.get('resource_limits', {})
+    limits = dict(limits_config.get('default', {}))
+    limits.update(limits_config.get(task_name, {}))
+    return limits
+
+def find_solutions(tasks, languages, models, completeness_levels):
+    """Return (task_name, language, file_path) for every solution in matrix order."""
+    solutions = []
     for task_name in tasks:
-        print(f"\n=== Testing task: {task_name} ===")
-        
         for language in languages:
-            if language not in language_extensions:
+            if language not in LANGUAGE_EXTENSIONS:
                 print(f"Warning: Unsupported language {language}, skipping")
                 continue
                 
-            ext = language_extensions[language]
+            ext = LANGUAGE_EXTENSIONS[language]
             
             for model in models:
                 for completeness in completeness_levels:
@@ -68,24 +73,337 @@ def verify_test():
                         print(f"Warning: No {language} file found for {model}/{completeness}/{task_name}")
                         continue
                     
-                    file_path = found_files[0]
-                    print(f"\nTesting {file_path}")
-                    
-                    try:
-                        # First execute the task
-                        execution_result = execute_task(file_path, language, task_name)
-                        print(f"Execution result: {execution_result['execution_status']}")
-                        
-                        # Then run all test cases
-                        test_task(file_path, language, task_name)
-                        print(f"Test results have been saved")
-                        
-                    except Exception as e:
-                        print(f"Error testing {file_path}: {str(e)}")
-                        continue
+                    solutions.append((task_name, language, found_files[0]))
+    return solutions
+
+def runtime_variants(task_options, runtimes, language, file_path):
+    """Run options for every runtime a solution is tested under; without a runtime matrix, just task_options."""
+    if runtimes is None:
+        return [task_options]
+    task_id = get_task_components(file_path, language)
+    variants = []
+    for runtime in runtimes.get(language, []):
+        resolved = resolve_runtime(runtime, task_id)
+        if resolved is None:
+            print(f"Skipping {runtime['runtime_id']} for {task_id}: no CPU profiles from a previous --profile run")
+            continue
+        variants.append(dict(task_options, executor='process', runtime=resolved))
+    return variants
+
+def is_evaluated(file_path, equivalence):
+    """Whether a solution is run itself, rather than sharing the records of an equivalent one."""
+    return equivalence is None or equivalence[file_path]['representative'] == file_path
+
+def save_equivalent_results(task_name, language, file_path, group, evaluated):
+    """Save copies of the records of the evaluated member of a solution's equivalence class."""
+    outcome = evaluated.get(group['representative'])
+    if outcome is None or isinstance(outcome, Exception):
+        print(f"Error testing {file_path}: equivalent to {group['representative']}, which could not be tested")
+        return
+    execution_result, test_results = outcome
+    task_id = get_task_components(file_path, language)
+    save_results('execution', task_name, fan_out([execution_result], task_id, group['class_id'], execution_result['task_id']))
+    save_results('test_results', task_name, fan_out(test_results, task_id, group['class_id'], execution_result['task_id']))
+    print(f"{file_path}: equivalent to {group['representative']}, records copied")
+
+def run_sequential(solutions, run_options, runner_config, benchmark=None, profile=None, allocations=False, runtimes=None, equivalence=None):
+    current_task = None
+    evaluated = {}
+    for task_name, language, file_path in solutions:
+        task_options = dict(run_options, limits=get_resource_limits(runner_config, task_name))
+        if task_name != current_task:
+            current_task = task_name
+            print(f"\n=== Testing task: {task_name} ===")
+        print(f"\nTesting {file_path}")
+        if not is_evaluated(file_path, equivalence):
+            save_equivalent_results(task_name, language, file_path, equivalence[file_path], evaluated)
+            continue
+        
+        try:
+            # First execute the task
+            execution_result = execute_task(file_path, language, task_name, run_options=task_options)
+            print(f"Execution result: {execution_result['execution_status']}")
+            
+            # Then run all test cases, once per runtime in runtime-matrix mode
+            test_results = []
+            for options in runtime_variants(task_options, runtimes, language, file_path):
+                test_results.extend(test_task(file_path, language, task_name, run_options=options, benchmark=benchmark, profile=profile, allocations=allocations))
+            evaluated[file_path] = (execution_result, test_results)
+            print(f"Test results have been saved")
+            
+        except Exception as e:
+            evaluated[file_path] = e
+            print(f"Error testing {file_path}: {str(e)}")
+            continue
+
+async def run_concurrent(solutions, run_options, runner_config, max_concurrency, benchmark=None, profile=None, allocations=False, runtimes=None, equivalence=None):
+    """Run every solution concurrently, with at most max_concurrency child processes at once.
+    
+    Records are saved after all runs finish, in the same order as the sequential mode.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Runs go through run_code on the default executor, so it needs a thread per run in flight
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max_concurrency))
+    
+    async def run_solution(task_name, language, file_path):
+        task_options = dict(run_options, limits=get_resource_limits(runner_config, task_name))
+        execution_result = await execute_task_async(file_path, language, task_name, task_options, semaphore)
+        variants = runtime_variants(task_options, runtimes, language, file_path)
+        runs = await asyncio.gather(*(
+            test_task_async(file_path, language, task_name, options, semaphore, benchmark, profile, allocations)
+            for options in variants
+        ))
+        return execution_result, [record for records in runs for record in records]
+    
+    evaluated_solutions = [solution for solution in solutions if is_evaluated(solution[2], equivalence)]
+    outcomes = await asyncio.gather(*(run_solution(*solution) for solution in evaluated_solutions), return_exceptions=True)
+    evaluated = {solution[2]: outcome for solution, outcome in zip(evaluated_solutions, outcomes)}
+    
+    for task_name, language, file_path in solutions:
+        if not is_evaluated(file_path, equivalence):
+            save_equivalent_results(task_name, language, file_path, equivalence[file_path], evaluated)
+            continue
+        outcome = evaluated[file_path]
+        if isinstance(outcome, Exception):
+            print(f"Error testing {file_path}: {str(outcome)}")
+            continue
+        execution_result, test_results = outcome
+        save_results('execution', task_name, [execution_result])
+        save_results('test_results', task_name, test_results)
+        passed = sum(1 for record in test_results if record['test_passed'])
+        print(f"{file_path}: execution {execution_result['execution_status']}, {passed}/{len(test_results)} tests passed")
+
+def run_parallel_stage(solutions, run_options, runner_config, parallel, suite_files=None, cpus=None, benchmark=None, profile=None, allocations=False, runtimes=None, equivalence=None):
+    """Run the (solution, case) pairs of every solution on a process pool.
+    
+    Records are saved as soon as a solution and every solution before it have finished,
+    in the same order as the sequential mode.
+    """
+    plans = []
+    for task_name, language, file_path in solutions:
+        if not is_evaluated(file_path, equivalence):
+            continue
+        task_options = dict(run_options, limits=get_resource_limits(runner_config, task_name))
+        plans.append((task_name, language, file_path, task_options, runtime_variants(task_options, runtimes, language, file_path)))
+    
+    evaluated = {}
+    next_solution = 0
+    for index, outcome in run_parallel(plans, parallel, runner_config, suite_files, cpus, benchmark, profile, allocations):
+        evaluated[plans[index][2]] = outcome
+        # Equivalent solutions are saved in matrix order once their evaluated member is done
+        while next_solution < len(solutions):
+            task_name, language, file_path = solutions[next_solution]
+            group = equivalence[file_path] if equivalence is not None else None
+            if (group['representative'] if group else file_path) not in evaluated:
+                break
+            next_solution += 1
+            if not is_evaluated(file_path, equivalence):
+                save_equivalent_results(task_name, language, file_path, group, evaluated)
+                continue
+            outcome = evaluated[file_path]
+            if isinstance(outcome, Exception):
+                print(f"Error testing {file_path}: {str(outcome)}")
+                continue
+            execution_result, test_results = outcome
+            save_results('execution', task_name, [execution_result])
+            save_results('test_results', task_name, test_results)
+            passed = sum(1 for record in test_results if record['test_passed'])
+            print(f"{file_path}: execution {execution_result['execution_status']}, {passed}/{len(test_results)} tests passed")
+
+def run_load_tests(solutions, load_test):
+    """Serve mode: load-test every solution as a local HTTP service, one solution at a time."""
+    for task_name, language, file_path in solutions:
+        print(f"\nLoad testing {file_path}")
+        try:
+            records = load_test_task(file_path, language, task_name, load_test)
+        except Exception as e:
+            print(f"Error load testing {file_path}: {str(e)}")
+            continue
+        save_results('load_test', task_name, records)
+        for record in records:
+            if not record.get('requests'):
+                print(f"- concurrency {record['concurrency']}: {record['load_test_error'] or 'no requests completed'}")
+                continue
+            p99 = f"{record['latency_p99'] * 1000:.1f} ms" if record['latency_p99'] is not None else 'n/a'
+            print(f"- concurrency {record['concurrency']}: {record['throughput']:.1f} req/s, "
+                  f"p99 {p99}, error rate {record['error_rate']:.1%}")
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Execute and test the generated solutions')
+    parser.add_argument('--profile', action='store_true',
+                        help='Also run each test case under the language profiler (cProfile, node --cpu-prof, pprof) '
+                             'and write profiles to results/profiles/{task_id}/{case}.prof')
+    parser.add_argument('--profile-top', type=int, default=10,
+                        help='Number of hotspots recorded per test case in profile mode (default: 10)')
+    parser.add_argument('--allocations', action='store_true',
+                        help='Also run each test case under an allocation harness (tracemalloc, V8 heap statistics, '
+                             'runtime.MemStats) and record alloc_bytes, alloc_count, peak_heap and, for Python, retained_bytes and retained_count')
+    parser.add_argument('--serve', action='store_true',
+                        help='Serve mode: instead of the test stage, wrap each solution in a local HTTP server, '
+                             'replay its test cases under load and write results/load_test/{task}.ndjson')
+    return parser.parse_args()
+
+def verify_test(profile=None, allocations=False, serve=False):
+    print(f"Starting verification at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    config = load_config()
+    
+    tasks = config.get('task_names', [])
+    languages = config.get('languages', [])
+    models = list(config.get('api_endpoints', {}).keys())
+    completeness_levels = config.get('prompt_templates', {}).get('completeness_levels', [])
+    runner_config = config.get('runner', {})
+    executor = runner_config.get('executor', 'process')
+    max_concurrency = runner_config.get('max_concurrency', 1)
+    parallel = get_parallel_settings(runner_config.get('parallel'))
+    run_options = {
+        'executor': executor,
+        'sample_peak_rss': runner_config.get('sample_peak_rss', False),
+        'capture_limits': runner_config.get('capture_limits')
+    }
+    configure_workers(
+        max_calls=runner_config.get('worker_max_calls'),
+        max_rss_mb=runner_config.get('worker_max_rss_mb')
+    )
+    transport = configure_transport(runner_config.get('input_transport'))
+    result_writer = configure_result_writer(runner_config.get('result_writer'))
+    
+    print(f"Configuration loaded:")
+    print(f"- Tasks: {tasks}")
+    print(f"- Languages: {languages}")
+    print(f"- Models: {models}")
+    print(f"- Completeness levels: {completeness_levels}")
+    print(f"- Executor: {executor}")
+    if executor == 'subinterpreter':
+        subinterpreters = configure_subinterpreters(runner_config.get('subinterpreters'))
+        if subinterpreters['python']:
+            print(f"- Subinterpreter host: {subinterpreters['python']} with {subinterpreters['threads']} threads")
+        else:
+            print("- Subinterpreter host: no Python 3.12+ found, Python solutions run in fresh processes")
+    if parallel['enabled']:
+        limits = ', '.join(f"{language} {limit}" for language, limit in parallel['language_limits'].items())
+        print(f"- Parallel test stage: {parallel['workers']} worker processes{f' (at most {limits})' if limits else ''}")
+    else:
+        print(f"- Max concurrency: {max_concurrency}")
+    print(f"- Input transport: {transport['mode']} (inputs from {transport['min_bytes']} bytes)")
+    print(f"- Result writer: flush every {result_writer['flush_records']} records or {result_writer['flush_seconds']}s"
+          f"{', fsync' if result_writer['fsync'] else ''}")
+    
+    results_dir = os.path.join(BASE_DIR, 'results')
+    os.makedirs(os.path.join(results_dir, 'execution'), exist_ok=True)
+    os.makedirs(os.path.join(results_dir, 'test_results'), exist_ok=True)
+    
+    solutions = find_solutions(tasks, languages, models, completeness_levels)
+    
+    equivalence = None
+    if get_dedup_settings(runner_config.get('dedup'))['enabled']:
+        equivalence = group_equivalent_solutions(solutions)
+        task_ids = {file_path: get_task_components(file_path, language) for _, language, file_path in solutions}
+        evaluated_count = sum(1 for _, _, file_path in solutions if is_evaluated(file_path, equivalence))
+        print(f"\nDedup: {len(solutions)} solutions in {evaluated_count} equivalence classes, "
+              f"classes saved to {save_equivalence_classes(equivalence, task_ids)}")
+    
+    go_files = [file_path for _, language, file_path in solutions if language == 'go']
+    suite_files = []
+    if go_files and executor == 'suite':
+        print(f"\nBuilding the Go suite binary for {len(go_files)} solutions...")
+        suite = configure_go_suite(go_files, runner_config.get('go_suite'))
+        if suite['success']:
+            print(f"Go suite {'reused' if suite['cached'] else 'built'}: {len(suite['solutions'])} solutions in one binary, "
+                  f"{suite['compile_duration']:.2f}s compile time")
+            if suite['benchtime']:
+                print(f"- In-process benchmark per test case: -benchtime {suite['benchtime']}")
+        else:
+            print(f"Go suite build failed, Go solutions run in fresh processes:\n{suite['error']}")
+        for file_path, reason in suite['excluded'].items():
+            print(f"- Runs in fresh processes ({reason}): {file_path}")
+        if suite['success']:
+            suite_files = go_files
+        # Only solutions outside the suite still need a binary of their own
+        go_files = [file_path for file_path in go_files if os.path.abspath(file_path) not in suite['solutions']]
+    if go_files:
+        print(f"\nPrecompiling {len(go_files)} Go solutions...")
+        builds = precompile_go(go_files, max_workers=runner_config.get('go_build_workers'))
+        failed = sum(1 for record in builds.values() if not record['success'])
+        total_compile = sum(record['compile_duration'] for record in builds.values())
+        print(f"Go builds finished: {len(builds) - failed} succeeded, {failed} failed, {total_compile:.2f}s total compile time")
+    
+    # Records of the Go suite depend on its benchtime, which is not part of the run options
+    eval_cache = configure_eval_cache(runner_config.get('eval_cache'), {'go_suite': runner_config.get('go_suite')} if suite_files else None)
+    if eval_cache['enabled']:
+        print("\nEvaluation cache enabled: unchanged cells re-emit their records from .cache/eval_cache/")
+    
+    # Pin after the parallel Go builds, which would otherwise share the harness cores
+    isolation = configure_isolation(runner_config.get('isolation'))
+    if isolation['enabled']:
+        print(f"\nIsolation mode: harness on CPUs {isolation['harness_cpus'] or 'unrestricted'}, runs pinned to CPUs {isolation['worker_cpus']}")
+        if parallel['enabled']:
+            # Each worker process pins its runs to a core of its own
+            parallel['workers'] = isolated_concurrency(parallel['workers'])
+            print(f"- Parallel workers capped at {parallel['workers']}")
+        else:
+            max_concurrency = isolated_concurrency(max_concurrency)
+            print(f"- Max concurrency capped at {max_concurrency}")
+    
+    if serve:
+        load_test = get_load_test_settings(runner_config.get('load_test'))
+        rate = f"{load_test['rate']} req/s (open loop)" if load_test['rate'] else 'closed loop'
+        print(f"\nServe mode: concurrency {load_test['concurrency']}, {rate}, {load_test['replicas']} server(s) per solution, "
+              f"{load_test['warmup_seconds']}s warm-up + {load_test['duration_seconds']}s measured per level")
+        run_load_tests(solutions, load_test)
+        close_result_writer()
+        print(f"\nLoad testing completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        return
+    
+    runtimes = None
+    runtime_matrix = runner_config.get('runtime_matrix', {})
+    if runtime_matrix.get('enabled'):
+        runtimes = discover_runtimes(languages, runtime_matrix)
+        print("\nRuntime matrix (each solution is tested under every runtime, in fresh processes):")
+        for language, language_runtimes in runtimes.items():
+            print(f"- {language}: {', '.join(runtime['runtime_id'] for runtime in language_runtimes) or 'none found'}")
+    
+    cpus = isolation['worker_cpus'] if isolation['enabled'] else None
+    calibration_config = runner_config.get('calibration', {})
+    if calibration_config.get('enabled', True):
+        # The baseline is measured on the engine whose durations it is subtracted from
+        if parallel['enabled']:
+            engine, engine_runs = 'parallel', pool_runs(parallel, runner_config, suite_files, cpus)
+        elif max_concurrency > 1:
+            engine, engine_runs = 'async', nullcontext(threaded_runs(max_concurrency))
+        else:
+            engine, engine_runs = 'sequential', nullcontext(sequential_runs)
+        print(f"\nCalibrating spawn overhead ({calibration_config.get('runs', 30)} no-op runs per language, {engine} engine)...")
+        with engine_runs as map_runs:
+            calibration = calibrate_spawn_overhead(languages, runs=calibration_config.get('runs', 30), run_options=run_options, runtimes=runtimes, engine=engine, map_runs=map_runs)
+        for name, summary in {**calibration['languages'], **calibration['runtimes']}.items():
+            print(f"- {name}: median {summary['median'] * 1000:.1f} ms, p95 {summary['p95'] * 1000:.1f} ms")
+        if not calibration['applied']:
+            print(f"- Executor '{executor}' does not spawn a process per case; net_execution_duration equals execution_duration")
+        print(f"Calibration saved to {save_calibration(calibration)}")
+    
+    benchmark = runner_config.get('benchmark')
+    if benchmark and benchmark.get('enabled'):
+        print(f"\nBenchmark mode: {benchmark.get('warmup_runs')} warm-up run(s) and {benchmark.get('repetitions')} measured repetitions per test case")
+    
+    if profile is not None:
+        print(f"\nProfile mode: profiles are written to results/profiles/, top {profile['top_n']} hotspots per test case")
+    if allocations:
+        print("\nAllocation mode: alloc_bytes, alloc_count and peak_heap (retained_bytes and retained_count for Python) are recorded per test case")
+    
+    if parallel['enabled']:
+        run_parallel_stage(solutions, run_options, runner_config, parallel, suite_files, cpus, benchmark, profile, allocations, runtimes, equivalence)
+    elif max_concurrency > 1:
+        asyncio.run(run_concurrent(solutions, run_options, runner_config, max_concurrency, benchmark, profile, allocations, runtimes, equivalence))
+    else:
+        run_sequential(solutions, run_options, runner_config, benchmark, profile, allocations, runtimes, equivalence)
     
+    shutdown_workers()
+    shutdown_subinterpreters()
+    shutdown_go_suite()
+    close_result_writer()
     print(f"\nVerification completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 if __name__ == '__main__':
-    verify_test() 
-    
\ No newline at end of file
+    args = parse_arguments()
+    verify_test(profile={'top_n': args.profile_top} if args.profile else None, allocations=args.allocations, serve=args.serve)
@@ -0,0 +1,84 @@
+"""
+Allocation Module:
+Opt-in allocation profiling of generated solutions during the test stage. Each test case
+is run once more under an allocation harness, so the measured run is not slowed down:
+
+    python      src/harness/python_alloc.py (tracemalloc)
+    javascript  node --require src/harness/node_alloc.js (V8 heap statistics per GC)
+    go          src/harness/go_alloc.go linked into the solution (runtime.MemStats)
+
+Each harness writes JSON to the file named by ALLOC_STATS_FILE, normalised into the
+alloc_bytes, alloc_count, peak_heap, retained_bytes and retained_count fields of the test
+result (bytes and blocks). alloc_bytes and alloc_count are totals over the run and are
+None for Python, whose retained_* fields count what is still live at exit instead.
+Every field is measured differently per language (peak_heap is exact for Python, taken
+at GC boundaries for JavaScript and sampled every millisecond for Go), so they are only
+comparable within a language.
+"""
+import os
+import sys
+import json
+import tempfile
+from typing import Optional, Dict, Any
+from src.workers import HARNESS_DIR
+from src.runner import build_go_with_harness, run_process
+
+PYTHON_ALLOC_HARNESS = os.path.join(HARNESS_DIR, 'python_alloc.py')
+NODE_ALLOC_HARNESS = os.path.join(HARNESS_DIR, 'node_alloc.js')
+GO_ALLOC_HARNESS = os.path.join(HARNESS_DIR, 'go_alloc.go')
+ALLOCATION_FIELDS = ('alloc_bytes', 'alloc_count', 'peak_heap', 'retained_bytes', 'retained_count')
+
+
+def empty_allocations(error: Optional[str] = None) -> Dict[str, Any]:
+    allocations = {field: None for field in ALLOCATION_FIELDS}
+    allocations['alloc_error'] = error
+    return allocations
+
+
+def measure_allocations(file_path: str, language: str, input_data: str, timeout: int = 30, limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Run one test case under the language's allocation harness.
+
+    Args:
+        file_path (str): Path to the code file
+        language (str): Programming language of the code
+        input_data (str): JSON input document passed via stdin
+        timeout (int): Maximum execution time in seconds
+        limits (dict, optional): Kernel resource limits, as for run_code
+
+    Returns:
+        dict: 'alloc_bytes', 'alloc_count', 'peak_heap', 'retained_bytes',
+              'retained_count' (None where the runtime does not report them) and
+              'alloc_error'
+    """
+    if language == 'python':
+        command = [sys.executable, PYTHON_ALLOC_HARNESS, os.path.abspath(file_path)]
+    elif language == 'javascript':
+        command = ['node', '--require', NODE_ALLOC_HARNESS, os.path.abspath(file_path)]
+    elif language == 'go':
+        record = build_go_with_harness(file_path, GO_ALLOC_HARNESS)
+        if not record['success']:
+            return empty_allocations(record['error'])
+        command = [record['binary']]
+    else:
+        return empty_allocations(f"Unsupported language: {language}")
+
+    descriptor, stats_file = tempfile.mkstemp(prefix='alloc_', suffix='.json')
+    os.close(descriptor)
+    try:
+        execution = run_process(command, input_data=input_data, timeout=timeout, limits=limits, env={'ALLOC_STATS_FILE': stats_file})
+        error = None
+        if execution['timed_out']:
+            error = f'Allocation run timed out after {timeout} seconds'
+        elif execution['exit_code'] != 0:
+            error = f"Allocation run exited with code {execution['exit_code']}"
+        try:
+            with open(stats_file, 'r', encoding='utf-8') as f:
+                stats = json.load(f)
+        except (OSError, ValueError):
+            return empty_allocations(error or 'No allocation statistics were written')
+    finally:
+        os.remove(stats_file)
+
+    allocations = {field: stats.get(field) for field in ALLOCATION_FIELDS}
+    allocations['alloc_error'] = error
+    return allocations
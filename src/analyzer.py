@@ -1,9 +1,10 @@
 import os
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 from src.sonarqube import SonarQubeAnalyzer, DEFAULT_TEMP_DIR
+from src.result_writer import get_result_writer
+from src.dedup import group_equivalent_solutions, source_fingerprint
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -15,7 +16,7 @@ os.makedirs(STATIC_ANALYSIS_DIR, exist_ok=True)
 
 STATIC_ANALYSIS_FILE = os.path.join(STATIC_ANALYSIS_DIR, '{task_name}.ndjson')
 
-def analyze_code(codes_dir=None, language=None, model=None, prompt_type=None, task_name=None, temp_dir=DEFAULT_TEMP_DIR):
+def analyze_code(codes_dir=None, language=None, model=None, prompt_type=None, task_name=None, temp_dir=DEFAULT_TEMP_DIR, dedup=False):
     """
     Analyze code using SonarQube and save results to NDJSON file
     
@@ -26,6 +27,8 @@ def analyze_code(codes_dir=None, language=None, model=None, prompt_type=None, ta
         prompt_type: Prompt type to analyze (default: all)
         task_name: Task name to analyze (e.g., 'task_1', 'task_2') (default: all)
         temp_dir: Temporary directory for SonarQube analysis
+        dedup: Analyze byte-identical files of the same task and language once, and save
+               a copy of the record for the others
         
     Returns:
         bool: True if analysis was successful, False otherwise
@@ -45,10 +48,26 @@ def analyze_code(codes_dir=None, language=None, model=None, prompt_type=None, ta
     
     logger.info(f"Found {len(code_files)} code files to analyze")
     
+    equivalence = None
+    if dedup:
+        # SonarQube measures comments and layout, so only identical sources share a record
+        equivalence = group_equivalent_solutions(
+            [(Path(file_path).parts[-2], Path(file_path).parts[-5], file_path) for file_path in code_files],
+            fingerprint=lambda source, language, task_name: source_fingerprint(source)
+        )
+    
     success_count = 0
+    analyzed = {}
     for file_path in code_files:
-        if analyze_file(analyzer, file_path, task_name, temp_dir):
+        if equivalence is not None and equivalence[file_path]['representative'] != file_path:
+            group = equivalence[file_path]
+            if save_equivalent_analysis(file_path, group, analyzed.get(group['representative']), task_name):
+                success_count += 1
+            continue
+        analyzed[file_path] = analyze_file(analyzer, file_path, task_name, temp_dir)
+        if analyzed[file_path]:
             success_count += 1
+    get_result_writer().flush()
     
     logger.info(f"Successfully analyzed {success_count} out of {len(code_files)} files")
     return success_count > 0
@@ -110,7 +129,7 @@ def analyze_file(analyzer, file_path, specified_task_name=None, temp_dir=None):
         temp_dir: Temporary directory for SonarQube analysis
         
     Returns:
-        bool: True if analysis was successful, False otherwise
+        dict: The saved record if analysis was successful, False otherwise
     """
     # Extract information from file path
     # Expected format: codes/{language}/{model}/{prompt_type}/task_{task_name}/Solution.*
@@ -157,18 +176,13 @@ def analyze_file(analyzer, file_path, specified_task_name=None, temp_dir=None):
         logger.warning(f"Failed to get SonarQube issues for {file_path}")
         issues = []
     
-    relative_path = file_path
-    codes_index = file_path.find('codes')
-    if codes_index != -1:
-        relative_path = file_path[codes_index:]
-    
     result = {
         "task_id": project_key.lower(),  # Full identifier
         "task_name": task_name,  # Keep the full "task_X" format
         "language": language,
         "model": model,
         "prompt_type": prompt_type,
-        "file_path": relative_path,
+        "file_path": relative_code_path(file_path),
         "cyclomatic_complexity": float(measures.get('complexity', 0)),
         "cognitive_complexity": float(measures.get('cognitive_complexity', 0)),
         "comment_coverage": float(measures.get('comment_lines_density', 0)),
@@ -206,19 +220,58 @@ def analyze_file(analyzer, file_path, specified_task_name=None, temp_dir=None):
         
         result["issues"] = issues_summary
     
-    output_task_name = specified_task_name if specified_task_name else task_name
-    
-    if output_task_name and not output_task_name.startswith('task_'):
-        output_task_name = f"task_{output_task_name}"
+    output_file = static_analysis_file(specified_task_name if specified_task_name else task_name)
     
-    output_file = STATIC_ANALYSIS_FILE.format(task_name=output_task_name)
+    get_result_writer().write(output_file, [result])
     
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    logger.info(f"Analysis completed for {file_path}, results saved to {output_file}")
+    return result
+
+def relative_code_path(file_path):
+    """Path of a code file from its 'codes' directory on, as recorded in static analysis results."""
+    codes_index = file_path.find('codes')
+    return file_path[codes_index:] if codes_index != -1 else file_path
+
+def static_analysis_file(task_name):
+    """Output file for a task name given as 'task_X' or 'X'."""
+    if task_name and not task_name.startswith('task_'):
+        task_name = f"task_{task_name}"
+    return STATIC_ANALYSIS_FILE.format(task_name=task_name)
+
+def save_equivalent_analysis(file_path, group, result, specified_task_name=None):
+    """
+    Save a copy of the static analysis record of an identical code file
     
-    with open(output_file, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(result) + '\n')
+    Args:
+        file_path: Path to the code file that was not analyzed itself
+        group: Its equivalence class, from group_equivalent_solutions
+        result: Record of the analyzed member of the class (False if its analysis failed)
+        specified_task_name: Task name specified by the user (for output file naming)
+        
+    Returns:
+        bool: True if a record was saved, False otherwise
+    """
+    if not result:
+        logger.warning(f"Skipping {file_path}: identical to {group['representative']}, whose analysis failed")
+        return False
     
-    logger.info(f"Analysis completed for {file_path}, results saved to {output_file}")
+    path_parts = Path(file_path).parts
+    language, model, prompt_type, task_folder = path_parts[-5], path_parts[-4], path_parts[-3], path_parts[-2]
+    record = dict(
+        result,
+        task_id=f"{language}_{model}_{prompt_type}_{task_folder}".lower(),
+        language=language,
+        model=model,
+        prompt_type=prompt_type,
+        file_path=relative_code_path(file_path),
+        equivalence_class=group['class_id'],
+        evaluated_task_id=result['task_id'],
+        timestamp=datetime.now().isoformat()
+    )
+    output_file = static_analysis_file(specified_task_name if specified_task_name else task_folder)
+    get_result_writer().write(output_file, [record])
+    
+    logger.info(f"{file_path} is identical to {group['representative']}, analysis record copied to {output_file}")
     return True
 
 def test_sonarqube():
@@ -228,7 +281,7 @@ def test_sonarqube():
     from src.sonarqube import test_sonarqube_connection
     return test_sonarqube_connection()
 
-def analyze_tasks(languages=None, tasks=None, completeness_levels=None, models=None, base_output_dir='codes', temp_dir=DEFAULT_TEMP_DIR):
+def analyze_tasks(languages=None, tasks=None, completeness_levels=None, models=None, base_output_dir='codes', temp_dir=DEFAULT_TEMP_DIR, dedup=False):
     """
     Analyze code for multiple tasks, languages, models, and completeness levels
     
@@ -239,6 +292,7 @@ def analyze_tasks(languages=None, tasks=None, completeness_levels=None, models=N
         models: Dictionary of models to analyze (keys are model names)
         base_output_dir: Base directory containing code files
         temp_dir: Temporary directory for SonarQube analysis
+        dedup: Analyze byte-identical code files once (see analyze_code)
         
     Returns:
         bool: True if all analyses were successful, False otherwise
@@ -262,7 +316,8 @@ def analyze_tasks(languages=None, tasks=None, completeness_levels=None, models=N
             model=list(models.keys())[0] if models and len(models) == 1 else None,
             prompt_type=completeness_levels[0] if completeness_levels and len(completeness_levels) == 1 else None,
             task_name=task_name,
-            temp_dir=temp_dir
+            temp_dir=temp_dir,
+            dedup=dedup
         )
         
         if task_success:
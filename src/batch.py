@@ -0,0 +1,286 @@
+"""
+Batch Module:
+Opt-in batched execution of all test cases of a solution in a single process.
+The runner streams every case as NDJSON to a thin per-language wrapper, which calls the
+solution once per line and answers with one framed result per case, so interpreter startup
+(or process spawn for Go) is paid once per solution instead of once per case.
+
+Wrappers:
+    python      src/harness/python_worker.py runs the script as a fresh __main__ module per case
+    javascript  src/harness/node_harness.js runs the script in a fresh vm context per case
+    go          src/harness/go_batch.go is linked into a copy of the solution whose main()
+                is renamed to solutionMain() and called once per case
+
+Go solutions that bind os.Stdin or os.Stdout at package level (see
+src.go_suite.binds_std_streams) would keep the first case's streams, so their cases run
+in fresh processes instead and are recorded with the process executor.
+
+Each case still gets its own timeout, measured from the previous frame. If a case times
+out or the wrapper dies before answering, the failure is attributed to that case and a new
+wrapper is started for the remaining cases.
+"""
+import os
+import sys
+import json
+import time
+import queue
+import threading
+import subprocess
+import psutil
+from contextlib import ExitStack
+from typing import Optional, List, Dict, Any
+from src.process_utils import kill_process_group, kill_stragglers
+from src.capture import CHUNK_SIZE, stderr_capture
+from src.isolation import acquire_cpu, release_cpu
+from src.transport import shared_input
+from src.workers import HARNESS_DIR, V8_CODE_CACHE_DIR
+from src.runner import (
+    BASE_DIR, PeakRssSampler, build_go_with_harness, elapsed, empty_resources, make_harness_request,
+    harness_result, spawn_child, parse_error_type, phase_timings, run_code
+)
+from src.go_suite import binds_std_streams
+
+GO_BATCH_HARNESS = os.path.join(HARNESS_DIR, 'go_batch.go')
+
+
+def build_go_batch(file_path: str) -> Dict[str, Any]:
+    """Build a Go solution linked with the batch wrapper, see build_go_with_harness."""
+    return build_go_with_harness(file_path, GO_BATCH_HARNESS)
+
+
+def get_batch_command(file_path: str, language: str) -> Dict[str, Any]:
+    """Return the wrapper command line for a solution, building it first for Go.
+
+    Returns:
+        dict: 'command' (None on failure), 'error' and 'compile_duration'
+    """
+    if language == 'python':
+        return {'command': [sys.executable, os.path.join(HARNESS_DIR, 'python_worker.py')], 'error': None, 'compile_duration': 0.0}
+    elif language == 'javascript':
+        return {'command': ['node', os.path.join(HARNESS_DIR, 'node_harness.js'), V8_CODE_CACHE_DIR], 'error': None, 'compile_duration': 0.0}
+    elif language == 'go':
+        record = build_go_batch(file_path)
+        return {
+            'command': [record['binary']] if record['success'] else None,
+            'error': record['error'],
+            'compile_duration': record['compile_duration']
+        }
+    return {'command': None, 'error': f"Unsupported language: {language}", 'compile_duration': 0.0}
+
+
+class BatchProcess:
+    """One wrapper process fed with a list of requests and read frame by frame."""
+
+    def __init__(self, command: List[str], requests: List[Dict[str, Any]], limits: Optional[Dict[str, Any]] = None, capture_limits: Optional[Dict[str, Any]] = None):
+        # In isolation mode the wrapper holds one worker core until it is closed
+        self.cpu = acquire_cpu()
+        self.process = spawn_child(
+            command,
+            limits,
+            self.cpu,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=BASE_DIR
+        )
+        self._frames = queue.Queue()
+        # stderr since the last frame, bounded like the stderr of a fresh process
+        self.capture_limits = capture_limits
+        self._stderr = stderr_capture(capture_limits)
+        self._stderr_lock = threading.Lock()
+        self._cpu_time = 0.0
+        self._stderr_reader = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_reader.start()
+        threading.Thread(target=self._write_requests, args=(requests,), daemon=True).start()
+        threading.Thread(target=self._read_frames, daemon=True).start()
+
+    def _write_requests(self, requests):
+        try:
+            for request in requests:
+                self.process.stdin.write((json.dumps(request) + '\n').encode('utf-8'))
+            self.process.stdin.close()
+        except (BrokenPipeError, OSError, ValueError):
+            pass
+
+    def _read_frames(self):
+        for line in self.process.stdout:
+            try:
+                self._frames.put(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        self._frames.put(None)
+
+    def _read_stderr(self):
+        read = self.process.stderr.read1
+        while True:
+            chunk = read(CHUNK_SIZE)
+            if not chunk:
+                break
+            with self._stderr_lock:
+                self._stderr.write(chunk)
+
+    def next_frame(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Wait for the next frame; None once the wrapper has exited.
+
+        Raises:
+            subprocess.TimeoutExpired: If no frame arrives within timeout
+        """
+        try:
+            frame = self._frames.get(timeout=timeout)
+        except queue.Empty:
+            raise subprocess.TimeoutExpired(self.process.args, timeout)
+        if frame is not None:
+            with self._stderr_lock:
+                self._stderr = stderr_capture(self.capture_limits)
+        return frame
+
+    def resources(self, frame: Dict[str, Any]) -> Dict[str, float]:
+        """Resources of the case answered by frame.
+
+        CPU time is the wrapper's own figure when it reports one, otherwise the CPU time
+        the wrapper process used since the previous frame. Memory is the wrapper's RSS
+        after the case and its high-water mark so far.
+        """
+        try:
+            process = psutil.Process(self.process.pid)
+            cpu_times = process.cpu_times()
+            rss_mb = process.memory_info().rss / (1024 * 1024)
+            peak_mb = PeakRssSampler._high_water_mark(process) / (1024 * 1024)
+        except psutil.Error:
+            return empty_resources()
+        total_cpu = cpu_times.user + cpu_times.system
+        cpu_time = frame.get('cpu_time', total_cpu - self._cpu_time)
+        self._cpu_time = total_cpu
+        return dict(empty_resources(), cpu_time=cpu_time, memory_usage=rss_mb, peak_memory_usage=peak_mb)
+
+    def crash_output(self) -> str:
+        """stderr the wrapper wrote after its last frame, once it has exited."""
+        self.process.wait()
+        kill_stragglers(self.process.pid)
+        self._stderr_reader.join()
+        return self._stderr.text()
+
+    @property
+    def stderr_truncated(self) -> bool:
+        return self._stderr.truncated
+
+    def close(self):
+        if self.process.poll() is None:
+            kill_process_group(self.process.pid, grace=0)
+        self.process.wait()
+        kill_stragglers(self.process.pid)
+        release_cpu(self.cpu)
+        self.cpu = None
+
+
+def _failure(error_type: str, message: str, duration: float = 0.0, exit_code: int = -1, compile_duration: float = 0.0) -> Dict[str, Any]:
+    return {
+        'success': False,
+        'error_type': error_type,
+        'error_message': message,
+        'duration': duration,
+        'compile_duration': compile_duration,
+        'stdout': '',
+        'stderr': message,
+        'exit_code': exit_code,
+        'resources': empty_resources(),
+        'executor': 'batch'
+    }
+
+
+def _binds_std_streams(file_path: str) -> bool:
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return binds_std_streams(f.read())
+    except OSError:
+        return False
+
+
+def run_code_batch(file_path: str, language: str, inputs: List[str], timeout: int = 30, limits: Optional[Dict[str, Any]] = None, capture_limits: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Execute a solution once per input inside a single wrapper process.
+
+    Args:
+        file_path (str): Path to the code file to execute
+        language (str): Programming language of the code
+        inputs (List[str]): JSON input document of every test case, in order
+        timeout (int): Maximum execution time of each case in seconds
+        limits (dict, optional): Kernel resource limits, as for run_code. They apply to the
+                                 wrapper process, so `cpu_seconds` covers all cases it ran
+        capture_limits (dict, optional): Byte caps for the output of each case, as for run_code
+
+    Returns:
+        List[dict]: One result per input, in the format of run_code
+    """
+    if language == 'go' and _binds_std_streams(file_path):
+        # The wrapper would keep the first case's os.Stdin / os.Stdout for every later case
+        return [
+            run_code(file_path, language, input_data=input_data, timeout=timeout, limits=limits, capture_limits=capture_limits)
+            for input_data in inputs
+        ]
+    start_time = time.perf_counter_ns()
+    try:
+        wrapper = get_batch_command(file_path, language)
+    except Exception as e:
+        return [_failure(type(e).__name__, str(e)) for _ in inputs]
+    compile_duration = wrapper['compile_duration']
+    if wrapper['command'] is None:
+        error_type = parse_error_type(wrapper['error'], language) if language == 'go' else 'CompilationError'
+        return [_failure(error_type, wrapper['error'], exit_code=1, compile_duration=compile_duration) for _ in inputs]
+
+    # Large inputs stay leased in the shared payload store until every case has run
+    with ExitStack() as payloads:
+        requests = []
+        for index, input_data in enumerate(inputs):
+            try:
+                payload = payloads.enter_context(shared_input(input_data))
+                request = make_harness_request(file_path, language, input_data, payload.path if payload is not None else None, capture_limits)
+                requests.append(dict(request, id=index))
+            except ValueError as e:
+                return [_failure('RuntimeError', str(e), elapsed(start_time)) for _ in inputs]
+
+        results = [None] * len(inputs)
+        cpus = [None] * len(inputs)
+        next_index = 0
+        while next_index < len(inputs):
+            batch = BatchProcess(wrapper['command'], requests[next_index:], limits, capture_limits)
+            try:
+                while next_index < len(inputs):
+                    case_start = time.perf_counter_ns()
+                    cpus[next_index] = batch.cpu
+                    try:
+                        frame = batch.next_frame(timeout)
+                    except subprocess.TimeoutExpired:
+                        results[next_index] = _failure('TimeoutError', f'Execution timed out after {timeout} seconds', timeout)
+                        next_index += 1
+                        break
+                    if frame is None:
+                        # The wrapper died while running this case
+                        stderr = batch.crash_output()
+                        exit_code = batch.process.returncode
+                        results[next_index] = dict(
+                            _failure(parse_error_type(stderr, language, exit_code, limits), stderr or None, elapsed(case_start), exit_code),
+                            stderr=stderr,
+                            stderr_truncated=batch.stderr_truncated
+                        )
+                        next_index += 1
+                        break
+                    if frame.get('id') != next_index:
+                        continue
+                    results[next_index] = harness_result(frame, language, batch.resources(frame), limits, capture_limits)
+                    # Wrapper start-up is charged to the first case the wrapper answers
+                    results[next_index]['phase_timings'] = phase_timings(
+                        first_output=None,
+                        execution=results[next_index]['duration'],
+                        drain=max(0.0, elapsed(case_start) - results[next_index]['duration'])
+                    )
+                    next_index += 1
+            finally:
+                batch.close()
+
+        for index, (result, cpu) in enumerate(zip(results, cpus)):
+            result['compile_duration'] = compile_duration
+            result['cpu_id'] = cpu
+            result['executor'] = 'batch'
+            # Like wrapper start-up, building the wrapper is charged to the first case
+            result.setdefault('phase_timings', phase_timings())['compile'] = compile_duration if index == 0 else 0.0
+    return results
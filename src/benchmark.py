@@ -0,0 +1,68 @@
+"""
+Benchmark Module:
+Statistics for the repeated-run timing mode of the test stage. Each test case is run a
+few times untimed to warm caches, then K measured times; the records keep the median,
+p95, minimum and dispersion of those repetitions instead of a single noisy sample.
+"""
+import statistics
+from typing import Dict, Any, List, Optional
+
+DEFAULT_BENCHMARK = {
+    'enabled': False,
+    'warmup_runs': 1,
+    'repetitions': 5,
+    'cv_threshold': 0.1
+}
+
+
+def get_benchmark_settings(benchmark: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge configured benchmark settings over the defaults; null entries keep the default."""
+    settings = dict(DEFAULT_BENCHMARK)
+    settings.update({key: value for key, value in (benchmark or {}).items() if value is not None})
+    return settings
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def summarize_durations(durations: List[float]) -> Dict[str, float]:
+    """Distribution summary of a list of durations in seconds."""
+    ordered = sorted(durations)
+    return {
+        'runs': len(ordered),
+        'min': ordered[0],
+        'median': statistics.median(ordered),
+        'mean': statistics.fmean(ordered),
+        'p95': percentile(ordered, 0.95),
+        'max': ordered[-1],
+        'stdev': statistics.stdev(ordered) if len(ordered) > 1 else 0.0
+    }
+
+
+def summarize_repetitions(results: List[Dict[str, Any]], cv_threshold: float = DEFAULT_BENCHMARK['cv_threshold']) -> Dict[str, Any]:
+    """Timing statistics over the measured repetitions of one test case.
+
+    Args:
+        results (List[Dict[str, Any]]): run_code results of the measured repetitions
+        cv_threshold (float): Coefficient of variation (stdev / mean) above which the
+                              case is flagged as high variance
+
+    Returns:
+        dict: Fields merged into the test_results record
+    """
+    summary = summarize_durations([result['duration'] for result in results])
+    cv = summary['stdev'] / summary['mean'] if summary['mean'] else 0.0
+    resources = [result.get('resources', {}) for result in results]
+    return {
+        'repetitions': summary['runs'],
+        'execution_duration_median': summary['median'],
+        'execution_duration_p95': summary['p95'],
+        'execution_duration_min': summary['min'],
+        'execution_duration_stdev': summary['stdev'],
+        'execution_duration_cv': cv,
+        'cpu_time_median': statistics.median(r.get('cpu_time', 0.0) for r in resources),
+        'memory_usage_median': statistics.median(r.get('memory_usage', 0.0) for r in resources),
+        'high_variance': cv > cv_threshold
+    }
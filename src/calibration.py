@@ -0,0 +1,154 @@
+"""
+Calibration Module:
+Measures the spawn overhead of each language before testing by running a no-op program
+(src/harness/noop/) many times through the same execution path as the solutions.
+The median of that baseline is subtracted from each test case's execution_duration
+to give net_execution_duration, which makes cross-language timings comparable.
+
+The no-op runs go through the same engine as the test stage: one after another, on
+max_concurrency threads for the asyncio engine, or on a worker pool for the parallel
+stage (see src/parallel.py), so the baseline includes the same contention at spawn and
+reap time as the durations it is subtracted from.
+"""
+import os
+import json
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+from src.runner import BASE_DIR, run_code
+from src.benchmark import summarize_durations
+
+NOOP_DIR = os.path.join(BASE_DIR, 'src', 'harness', 'noop')
+NOOP_FILES = {
+    'python': 'Noop.py',
+    'javascript': 'Noop.js',
+    'go': 'Noop.go'
+}
+DEFAULT_CALIBRATION_RUNS = 30
+
+# Executors that start a fresh process per test case; only their durations include spawn overhead
+SPAWNING_EXECUTORS = ('process',)
+
+_BASELINES = {}
+
+
+def run_noop(noop_file: str, language: str, run_options: Dict[str, Any]) -> Dict[str, Any]:
+    return run_code(noop_file, language, input_data='{}', **run_options)
+
+
+def sequential_runs(noop_file: str, language: str, run_options: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+    """Run the no-op program count times, one after another (the sequential engine)."""
+    return [run_noop(noop_file, language, run_options) for _ in range(count)]
+
+
+def threaded_runs(max_concurrency: int):
+    """Run the no-op program on max_concurrency threads at once, as the asyncio engine
+    runs its cases."""
+    def map_runs(noop_file: str, language: str, run_options: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            return list(pool.map(run_noop, [noop_file] * count, [language] * count, [run_options] * count))
+
+    return map_runs
+
+
+def _calibrate(noop_file: str, language: str, runs: int, run_options: Dict[str, Any], map_runs) -> Optional[Dict[str, Any]]:
+    # The first run pays for Go builds and cold file caches
+    run_noop(noop_file, language, run_options)
+    durations = [result['duration'] for result in map_runs(noop_file, language, run_options, runs) if result['success']]
+    if not durations:
+        return None
+    summary = summarize_durations(durations)
+    summary['samples'] = durations
+    return summary
+
+
+def calibrate_spawn_overhead(languages: List[str], runs: int = DEFAULT_CALIBRATION_RUNS, run_options: Optional[Dict[str, Any]] = None, runtimes: Optional[Dict[str, List[Dict[str, Any]]]] = None, engine: str = 'sequential', map_runs=sequential_runs) -> Dict[str, Any]:
+    """Time a no-op program per language and remember the median as its spawn baseline.
+
+    Args:
+        languages (List[str]): Languages to calibrate
+        runs (int): Number of timed runs per language, after one untimed warm-up run
+        run_options (Dict[str, Any], optional): Keyword arguments passed to run_code, so the
+                                                baseline uses the same executor and limits
+        runtimes (Dict[str, List[Dict[str, Any]]], optional): Runtime matrix per language
+                                                              (see src/runtimes.py); each
+                                                              runtime gets its own baseline
+        engine (str): Engine of the test stage ('sequential', 'async' or 'parallel'),
+                      recorded in the metadata
+        map_runs: Function of (noop_file, language, run_options, count) that runs the
+                  no-op program count times on that engine and returns the results, e.g.
+                  sequential_runs, threaded_runs(max_concurrency) or
+                  src.parallel.pool_runs
+
+    Returns:
+        dict: Calibration metadata with the duration distribution of each language and,
+              under 'runtimes', of each runtime id
+    """
+    run_options = dict(run_options or {})
+    executor = run_options.get('executor', 'process')
+    run_options['executor'] = executor if executor in SPAWNING_EXECUTORS else 'process'
+
+    metadata = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'executor': executor,
+        'engine': engine,
+        'applied': executor in SPAWNING_EXECUTORS,
+        'languages': {},
+        'runtimes': {}
+    }
+    for language in languages:
+        if language not in NOOP_FILES:
+            continue
+        noop_file = os.path.join(NOOP_DIR, NOOP_FILES[language])
+        summary = _calibrate(noop_file, language, runs, run_options, map_runs)
+        if summary is None:
+            print(f"Warning: Calibration of {language} failed, no baseline recorded")
+            continue
+        metadata['languages'][language] = summary
+        _BASELINES[language] = summary['median'] if metadata['applied'] else 0.0
+
+        # Runtime matrix runs always spawn a fresh process; PGO builds need profiles of the
+        # no-op program, so they share the language baseline
+        for runtime in (runtimes or {}).get(language, []):
+            if runtime.get('pgo'):
+                continue
+            summary = _calibrate(noop_file, language, runs, dict(run_options, executor='process', runtime=runtime), map_runs)
+            if summary is None:
+                print(f"Warning: Calibration of {runtime['runtime_id']} failed, the {language} baseline is used")
+                continue
+            metadata['runtimes'][runtime['runtime_id']] = summary
+            _BASELINES[runtime['runtime_id']] = summary['median']
+    return metadata
+
+
+def get_spawn_baseline(language: str, runtime_id: Optional[str] = None) -> float:
+    """Median no-op duration of a runtime, else of its language, or 0.0 if neither has been calibrated."""
+    if runtime_id in _BASELINES:
+        return _BASELINES[runtime_id]
+    return _BASELINES.get(language, 0.0)
+
+
+def get_spawn_baselines() -> Dict[str, float]:
+    """Every calibrated baseline by language or runtime id, e.g. to hand to a worker process."""
+    return dict(_BASELINES)
+
+
+def set_spawn_baselines(baselines: Dict[str, float]):
+    """Use baselines calibrated by another process (see get_spawn_baselines)."""
+    _BASELINES.clear()
+    _BASELINES.update(baselines)
+
+
+def net_duration(duration: float, baseline: float) -> float:
+    """Execution duration with the spawn baseline removed, never below zero."""
+    return max(0.0, duration - baseline)
+
+
+def save_calibration(metadata: Dict[str, Any]) -> str:
+    """Write calibration metadata to results/metadata/calibration.json and return its path."""
+    metadata_dir = os.path.join(BASE_DIR, 'results', 'metadata')
+    os.makedirs(metadata_dir, exist_ok=True)
+    metadata_file = os.path.join(metadata_dir, 'calibration.json')
+    with open(metadata_file, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, indent=2)
+    return metadata_file
@@ -0,0 +1,116 @@
+"""
+Capture Module:
+Bounded capture of child process output. stdout is kept in full up to a byte cap;
+stderr keeps its head and a ring buffer of its tail, which is where tracebacks end.
+Bytes past the caps are drained and counted but not stored, so memory stays flat
+however much a solution prints.
+"""
+import time
+from typing import Optional, Dict, Any
+
+CHUNK_SIZE = 64 * 1024
+
+DEFAULT_CAPTURE_LIMITS = {
+    'stdout_bytes': 8 * 1024 * 1024,
+    'stderr_head_bytes': 16 * 1024,
+    'stderr_tail_bytes': 64 * 1024
+}
+
+
+def get_capture_limits(capture_limits: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+    """Merge configured capture limits over the defaults; null entries keep the default."""
+    limits = dict(DEFAULT_CAPTURE_LIMITS)
+    limits.update({key: value for key, value in (capture_limits or {}).items() if value is not None})
+    return limits
+
+
+class OutputCapture:
+    """Keeps the first `limit` bytes written and counts the rest."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.total = 0
+        self.first_write_ns = None
+        self._data = bytearray()
+
+    def write(self, data: bytes):
+        if self.first_write_ns is None:
+            self.first_write_ns = time.perf_counter_ns()
+        self.total += len(data)
+        room = self.limit - len(self._data)
+        if room > 0:
+            self._data += data[:room]
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > self.limit
+
+    def getvalue(self) -> bytes:
+        return bytes(self._data)
+
+    def text(self) -> str:
+        return self.getvalue().decode('utf-8', errors='replace')
+
+
+class HeadTailCapture:
+    """Keeps the first `head` bytes and the last `tail` bytes written."""
+
+    def __init__(self, head: int, tail: int):
+        self.head = head
+        self.tail = tail
+        self.total = 0
+        self.first_write_ns = None
+        self._head = bytearray()
+        self._tail = bytearray()
+
+    def write(self, data: bytes):
+        if self.first_write_ns is None:
+            self.first_write_ns = time.perf_counter_ns()
+        self.total += len(data)
+        room = self.head - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if data and self.tail > 0:
+            self._tail += data[-self.tail:]
+            if len(self._tail) > self.tail:
+                del self._tail[:len(self._tail) - self.tail]
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > self.head + self.tail
+
+    def getvalue(self) -> bytes:
+        if not self.truncated:
+            return bytes(self._head + self._tail)
+        omitted = self.total - len(self._head) - len(self._tail)
+        return bytes(self._head) + f"\n... [{omitted} bytes truncated] ...\n".encode('utf-8') + bytes(self._tail)
+
+    def text(self) -> str:
+        return self.getvalue().decode('utf-8', errors='replace')
+
+
+def stdout_capture(capture_limits: Optional[Dict[str, Any]] = None) -> OutputCapture:
+    return OutputCapture(get_capture_limits(capture_limits)['stdout_bytes'])
+
+
+def stderr_capture(capture_limits: Optional[Dict[str, Any]] = None) -> HeadTailCapture:
+    limits = get_capture_limits(capture_limits)
+    return HeadTailCapture(limits['stderr_head_bytes'], limits['stderr_tail_bytes'])
+
+
+def drain(stream, capture):
+    """Read a binary stream to EOF in chunks, feeding each chunk to capture."""
+    read = getattr(stream, 'read1', stream.read)
+    while True:
+        chunk = read(CHUNK_SIZE)
+        if not chunk:
+            break
+        capture.write(chunk)
+    stream.close()
+
+
+def bound_text(text: str, capture) -> str:
+    """Pass already-collected text through a capture, e.g. output reported by a harness."""
+    capture.write((text or '').encode('utf-8'))
+    return capture.text()
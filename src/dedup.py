@@ -0,0 +1,258 @@
+"""
+Dedup Module:
+Groups solutions that behave the same, so the test stage runs each group once. Models
+and completeness levels often produce near-identical code (e.g. the minimal and partial
+variants), which would otherwise be executed and tested once per task_id.
+
+The fingerprint of a solution canonicalises what cannot change its behaviour:
+
+    - Python: the `ast` of the module without docstrings, comments or formatting, and
+      with the names the solution binds itself (variables, functions, parameters,
+      import aliases) renamed in order of first use. Names that can leak into output are
+      kept: attributes, keyword arguments, class members, dunders, names passed to
+      getattr() and friends, and every name of a module that uses globals(), locals(),
+      eval() or __name__-style introspection. The task's entry point (see
+      src.workers.get_entry_point) keeps its name too, since callers look it up by name.
+    - JavaScript and Go: the token stream without comments and indentation, with
+      multi-character operators (`++`, `--`, `<-`, ...) kept whole so that spacing
+      between operators still counts. Line breaks are kept as one token, since both
+      languages insert semicolons at them. Identifiers
+      are not renamed: object keys and exported Go struct fields end up in the output.
+
+Solutions of the same task and language with the same fingerprint form an equivalence
+class; the first one in matrix order is evaluated, and its records are copied to the
+other members with `equivalence_class` and `evaluated_task_id` recorded. Tracebacks in
+error messages quote the source of the evaluated member.
+
+Static analysis measures comments and layout, so it only shares results between
+byte-identical sources (see source_fingerprint).
+"""
+import os
+import re
+import ast
+import json
+import hashlib
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple, Iterable
+from src.workers import get_entry_point
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Multi-character operators of JavaScript and Go, matched as one token so that e.g.
+# `a - -b` and `a--b` or `i++ + j` and `i + ++j` do not tokenize alike
+OPERATORS = (
+    '>>>=', '...', '===', '!==', '**=', '<<=', '>>=', '>>>', '&&=', '||=', '??=', '&^=',
+    '++', '--', '+=', '-=', '*=', '/=', '%=', '&=', '|=', '^=', '==', '!=', '<=', '>=',
+    '&&', '||', '<<', '>>', '**', '??', '?.', '=>', '->', '<-', ':=', '&^'
+)
+TOKEN_PATTERN = re.compile(r'''
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)
+  | (?P<newline>\n)
+  | (?P<space>[ \t\r\f\v]+)
+  | (?P<token>\w+|%s|\S)
+''' % '|'.join(re.escape(operator) for operator in sorted(OPERATORS, key=len, reverse=True)), re.VERBOSE | re.DOTALL)
+
+# Calls and attributes that expose the names of a module at run time
+INTROSPECTION_NAMES = {'globals', 'locals', 'vars', 'eval', 'exec', 'dir', '__import__'}
+INTROSPECTION_ATTRIBUTES = {'__name__', '__qualname__', '__code__', '__dict__', '__globals__'}
+# Calls that take a name as a string
+NAME_LOOKUP_CALLS = {'getattr', 'setattr', 'hasattr', 'delattr'}
+
+DEFAULT_DEDUP = {
+    'enabled': False
+}
+
+
+def get_dedup_settings(dedup: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge the configured dedup section over the defaults; null entries keep the default."""
+    settings = dict(DEFAULT_DEDUP)
+    settings.update({key: value for key, value in (dedup or {}).items() if value is not None})
+    return settings
+
+
+def _strip_docstrings(tree: ast.AST):
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            body = node.body
+            if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant) and isinstance(body[0].value.value, str):
+                node.body = body[1:] or [ast.Pass()]
+
+
+def _renameable_names(tree: ast.AST, keep: Iterable[str] = ()) -> set:
+    """Names bound by the module itself that can be renamed without changing its behaviour."""
+    bound, kept = set(), set(keep)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if node.id in INTROSPECTION_NAMES:
+                return set()
+            if isinstance(node.ctx, (ast.Store, ast.Del)):
+                bound.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            if node.attr in INTROSPECTION_ATTRIBUTES:
+                return set()
+            kept.add(node.attr)
+        elif isinstance(node, ast.arg):
+            bound.add(node.arg)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            bound.add(node.name)
+        elif isinstance(node, ast.ClassDef):
+            # Class names show up in reprs, and names bound in a class body are attributes
+            kept.add(node.name)
+            for statement in node.body:
+                if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    kept.add(statement.name)
+                for target in ast.walk(statement) if isinstance(statement, (ast.Assign, ast.AnnAssign, ast.AugAssign)) else []:
+                    if isinstance(target, ast.Name):
+                        kept.add(target.id)
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, ast.alias):
+            if node.asname:
+                bound.add(node.asname)
+            else:
+                kept.add(node.name.split('.')[0])
+        elif isinstance(node, ast.keyword) and node.arg:
+            kept.add(node.arg)
+        elif isinstance(node, ast.Call) and getattr(node.func, 'id', getattr(node.func, 'attr', None)) in NAME_LOOKUP_CALLS:
+            kept.update(
+                argument.value for argument in node.args
+                if isinstance(argument, ast.Constant) and isinstance(argument.value, str)
+            )
+        elif isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name:
+            bound.add(node.name)
+        elif isinstance(node, ast.MatchMapping) and node.rest:
+            bound.add(node.rest)
+    return {name for name in bound - kept if not (name.startswith('__') and name.endswith('__'))}
+
+
+def python_fingerprint(source: str, keep: Iterable[str] = ()) -> str:
+    """Canonical dump of a Python module's ast, with the names in keep never renamed
+    (raises SyntaxError)."""
+    tree = ast.parse(source)
+    _strip_docstrings(tree)
+    names = _renameable_names(tree, keep)
+    # Placeholders are not identifiers, so no name left as it is can collide with one
+    mapping = {}
+
+    def rename(name):
+        if name not in names:
+            return name
+        return mapping.setdefault(name, f'<v{len(mapping)}>')
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            node.id = rename(node.id)
+        elif isinstance(node, ast.arg):
+            node.arg = rename(node.arg)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            node.name = rename(node.name)
+        elif isinstance(node, ast.ExceptHandler) and node.name:
+            node.name = rename(node.name)
+        elif isinstance(node, ast.alias) and node.asname:
+            node.asname = rename(node.asname)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            node.names = [rename(name) for name in node.names]
+        elif isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name:
+            node.name = rename(node.name)
+        elif isinstance(node, ast.MatchMapping) and node.rest:
+            node.rest = rename(node.rest)
+    return ast.dump(tree, annotate_fields=False, include_attributes=False)
+
+
+def token_fingerprint(source: str) -> str:
+    """Token stream of C-like source without comments and indentation; runs of line
+    breaks (including those inside block comments) become one newline token."""
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(source):
+        kind = match.lastgroup
+        if kind == 'space' or (kind == 'comment' and '\n' not in match.group()):
+            continue
+        if kind in ('newline', 'comment'):
+            if tokens and tokens[-1] != '\n':
+                tokens.append('\n')
+            continue
+        tokens.append(match.group())
+    while tokens and tokens[-1] == '\n':
+        tokens.pop()
+    return '\x1f'.join(tokens)
+
+
+def source_fingerprint(source: str) -> str:
+    """SHA-256 of the source itself, with line endings normalised."""
+    return hashlib.sha256(source.replace('\r\n', '\n').encode('utf-8')).hexdigest()
+
+
+def behaviour_fingerprint(source: str, language: str, task_name: Optional[str] = None) -> str:
+    """SHA-256 of the canonical form of a solution; Python that does not parse falls
+    back to source_fingerprint. The entry point of task_name is not renamed."""
+    if language == 'python':
+        entry_point = get_entry_point(language, task_name) if task_name else None
+        try:
+            canonical = python_fingerprint(source, [entry_point] if entry_point else ())
+        except (SyntaxError, ValueError):
+            return source_fingerprint(source)
+    else:
+        canonical = token_fingerprint(source)
+    return hashlib.sha256(f'{language}\0{canonical}'.encode('utf-8')).hexdigest()
+
+
+def group_equivalent_solutions(solutions: List[Tuple[str, str, str]], fingerprint=behaviour_fingerprint) -> Dict[str, Dict[str, Any]]:
+    """Equivalence class of every solution.
+
+    Args:
+        solutions (List[Tuple]): (task_name, language, file_path) in matrix order
+        fingerprint: Function of (source, language, task_name) to compare solutions by
+
+    Returns:
+        dict: file_path -> {'class_id', 'representative' (file_path of the member that is
+              evaluated), 'members' (file_paths, shared by every member of the class)}
+    """
+    classes = {}
+    equivalence = {}
+    for task_name, language, file_path in solutions:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            digest = fingerprint(f.read(), language, task_name)
+        key = (task_name, language, digest)
+        if key not in classes:
+            classes[key] = {'class_id': digest[:16], 'representative': file_path, 'members': []}
+        classes[key]['members'].append(file_path)
+        equivalence[file_path] = classes[key]
+    return equivalence
+
+
+def fan_out(records: List[Dict[str, Any]], task_id: str, class_id: str, evaluated_task_id: str) -> List[Dict[str, Any]]:
+    """Copies of the records of a class's evaluated member for another member."""
+    return [
+        dict(record, task_id=task_id, equivalence_class=class_id, evaluated_task_id=evaluated_task_id)
+        for record in records
+    ]
+
+
+def save_equivalence_classes(equivalence: Dict[str, Dict[str, Any]], task_ids: Dict[str, str]) -> str:
+    """Write every class with more than one member to results/metadata/dedup.json and
+    return its path.
+
+    Args:
+        equivalence (Dict[str, Dict[str, Any]]): Result of group_equivalent_solutions
+        task_ids (Dict[str, str]): task_id of every file_path
+    """
+    classes = {id(group): group for group in equivalence.values() if len(group['members']) > 1}
+    metadata = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'solutions': len(equivalence),
+        'classes': len({id(group) for group in equivalence.values()}),
+        'shared': [
+            {
+                'equivalence_class': group['class_id'],
+                'evaluated_task_id': task_ids[group['representative']],
+                'task_ids': [task_ids[member] for member in group['members']]
+            }
+            for group in classes.values()
+        ]
+    }
+    metadata_dir = os.path.join(BASE_DIR, 'results', 'metadata')
+    os.makedirs(metadata_dir, exist_ok=True)
+    path = os.path.join(metadata_dir, 'dedup.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, indent=2)
+    return path
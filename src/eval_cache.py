@@ -0,0 +1,160 @@
+"""
+Evaluation Cache Module:
+Content-addressed cache of execution and test records. The key of a cell (the execution
+run of a solution, or one of its test cases) is the hash of:
+
+    - the solution source
+    - the test case JSON and the input rendered for it from test_cases/input_data.json,
+      so editing one case or its template entry only invalidates the cells that use it
+    - the runtime id (interpreter or Go toolchain version), the path of the interpreter
+      and the digest of a Go PGO profile, which its -pgo flag only names by path
+    - the run options
+    - the harness version: every source file under src/, including src/harness/
+    - the benchmark, profile and allocation settings, and any salt the caller configured
+
+A hit re-emits the stored records with 'cached': true instead of running the cell again.
+Records of runs that timed out are not stored, since a timeout says as much about the
+host as about the solution.
+
+Entries are JSON files in .cache/eval_cache/{key[:2]}/{key}.json, written atomically, so
+the worker processes of the parallel test stage can share the cache.
+"""
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from typing import Optional, List, Dict, Any
+from src.runner import BASE_DIR
+from src.runtimes import runtime_id_of, interpreter_of
+
+EVAL_CACHE_DIR = os.path.join(BASE_DIR, '.cache', 'eval_cache')
+HARNESS_SOURCE_DIR = os.path.join(BASE_DIR, 'src')
+
+DEFAULT_EVAL_CACHE = {
+    'enabled': False
+}
+
+_SETTINGS = {'enabled': False, 'salt': None, 'harness': None}
+_DIGESTS = {}
+_DIGESTS_LOCK = threading.Lock()
+
+
+def get_eval_cache_settings(eval_cache: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge the configured eval_cache section over the defaults; null entries keep the default."""
+    settings = dict(DEFAULT_EVAL_CACHE)
+    settings.update({key: value for key, value in (eval_cache or {}).items() if value is not None})
+    return settings
+
+
+def configure_eval_cache(eval_cache: Optional[Dict[str, Any]] = None, salt: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Enable or disable the cache from now on and return its settings.
+
+    Args:
+        eval_cache (Dict[str, Any], optional): The eval_cache section ('enabled')
+        salt (Dict[str, Any], optional): Settings outside the run options that change the
+                                         records (e.g. the go_suite section); mixed into
+                                         every key
+    """
+    settings = get_eval_cache_settings(eval_cache)
+    _SETTINGS.update(enabled=bool(settings['enabled']), salt=salt, harness=None)
+    return settings
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file, remembered while its size and mtime stay the same."""
+    stat = os.stat(path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+    with _DIGESTS_LOCK:
+        cached = _DIGESTS.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    with _DIGESTS_LOCK:
+        _DIGESTS[path] = (signature, digest)
+    return digest
+
+
+def harness_version() -> str:
+    """Hash over every source file of the harness (src/ and src/harness/, without caches),
+    computed once per configure_eval_cache."""
+    if _SETTINGS['harness'] is not None:
+        return _SETTINGS['harness']
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(HARNESS_SOURCE_DIR):
+        dirs[:] = sorted(name for name in dirs if name != '__pycache__')
+        for name in sorted(files):
+            if name.endswith(('.pyc', '.pyo')):
+                continue
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, HARNESS_SOURCE_DIR).encode('utf-8'))
+            digest.update(file_digest(path).encode('utf-8'))
+    _SETTINGS['harness'] = digest.hexdigest()
+    return _SETTINGS['harness']
+
+
+def cell_key(kind: str, file_path: str, language: str, item: Dict[str, Any], run_options: Optional[Dict[str, Any]] = None, extra: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """Cache key of one cell, or None while the cache is disabled.
+
+    Args:
+        kind (str): 'execution' or 'test'
+        file_path (str): Path to the solution
+        language (str): Programming language of the solution
+        item (Dict[str, Any]): Entry of load_case_bundle ('case' and 'input_data')
+        run_options (Dict[str, Any], optional): Keyword arguments passed to run_code
+        extra (Dict[str, Any], optional): Further settings that change the records
+    """
+    if not _SETTINGS['enabled']:
+        return None
+    run_options = run_options or {}
+    runtime = run_options.get('runtime')
+    document = {
+        'kind': kind,
+        'language': language,
+        'source': file_digest(os.path.abspath(file_path)),
+        'case': item['case'],
+        'input': hashlib.sha256(item['input_data'].encode('utf-8')).hexdigest(),
+        'runtime_id': runtime_id_of(language, runtime, run_options.get('executor')),
+        'interpreter': interpreter_of(language, runtime, run_options.get('executor')),
+        'pgo_digest': (runtime or {}).get('pgo_digest'),
+        'run_options': run_options,
+        'extra': extra,
+        'salt': _SETTINGS['salt'],
+        'harness': harness_version()
+    }
+    return hashlib.sha256(json.dumps(document, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(EVAL_CACHE_DIR, key[:2], f'{key}.json')
+
+
+def lookup_records(key: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+    """Cached records of a cell, marked 'cached', or None on a miss or with the cache off."""
+    if key is None:
+        return None
+    try:
+        with open(_entry_path(key), 'r', encoding='utf-8') as f:
+            records = json.load(f)['records']
+    except (OSError, ValueError, KeyError):
+        return None
+    return [dict(record, cached=True) for record in records]
+
+
+def store_records(key: Optional[str], records: List[Dict[str, Any]], result: Optional[Dict[str, Any]] = None):
+    """Store the records of a cell, unless the cache is off or its run (result) timed out."""
+    if key is None or (result is not None and result.get('error_type') == 'TimeoutError'):
+        return
+    path = _entry_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'records': records}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
@@ -0,0 +1,367 @@
+"""
+Go Suite Module:
+Execution backend that links every Go solution into one binary. The generator copies each
+solution to its own package, named after its source hash, with `package main` and main()
+renamed, and builds them together with src/harness/go_suite.go and a generated dispatch
+table. The resulting binary stays up and runs any solution by id, so Go evaluation pays
+for one link step and one process start instead of one per solution. With a `benchtime`,
+each run is also timed in-process with testing.Benchmark (ns/op, allocs/op, bytes/op).
+
+Layout of a suite, in .cache/go_suite/{hash}/:
+    go.mod                    module gosuite
+    main.go                   copy of src/harness/go_suite.go
+    dispatch.go               suiteSolutions: package id -> Main
+    solutions/{id}/solution.go
+    suite                     the binary, plus manifest.json listing what it contains
+
+Solutions that do not compile, or that bind os.Stdin / os.Stdout in package-level
+variables (which would read the protocol stream), are left out of the suite; the runner
+runs them in fresh processes as before.
+"""
+import os
+import re
+import sys
+import json
+import time
+import queue
+import hashlib
+import threading
+import subprocess
+import psutil
+from typing import Optional, List, Dict, Any
+from src.process_utils import NEW_SESSION_KWARGS, kill_process_group, kill_stragglers
+from src.capture import CHUNK_SIZE, stderr_capture
+from src.workers import BASE_DIR, HARNESS_DIR
+
+GO_SUITE_HARNESS = os.path.join(HARNESS_DIR, 'go_suite.go')
+GO_SUITE_DIR = os.path.join(BASE_DIR, '.cache', 'go_suite')
+GO_SUITE_CACHE_DIR = os.path.join(GO_SUITE_DIR, 'gocache')
+GO_SUITE_MODULE = 'gosuite'
+
+PACKAGE_PATTERN = re.compile(r'^package\s+main\b', re.MULTILINE)
+MAIN_FUNC_PATTERN = re.compile(r'^func\s+main\s*\(\s*\)', re.MULTILINE)
+FAILED_PACKAGE_PATTERN = re.compile(r'\bsolutions/(s[0-9a-f]{16})\b')
+STD_STREAM_PATTERN = re.compile(r'\bos\.Std(?:in|out)\b')
+LITERAL_PATTERN = re.compile(r'"(?:\\.|[^"\\])*"|`[^`]*`|\'(?:\\.|[^\'\\])*\'|//[^\n]*')
+
+DEFAULT_GO_SUITE = {
+    'benchtime': None
+}
+
+_SUITE = {'binary': None, 'solutions': {}, 'benchtime': None, 'process': None}
+_SUITE_LOCK = threading.Lock()
+
+
+def get_go_suite_settings(go_suite: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge the configured go_suite section over the defaults; null entries keep the default."""
+    settings = dict(DEFAULT_GO_SUITE)
+    settings.update({key: value for key, value in (go_suite or {}).items() if value is not None})
+    return settings
+
+
+def get_go_language_version() -> Optional[str]:
+    """Language version of the toolchain for go.mod (e.g. '1.21'), so the packages
+    compile with the same semantics as a standalone `go build Solution.go`."""
+    try:
+        version = subprocess.run(['go', 'env', 'GOVERSION'], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return None
+    match = re.match(r'go(\d+\.\d+)', version)
+    return match.group(1) if match else None
+
+
+def binds_std_streams(source: str) -> bool:
+    """Whether os.Stdin or os.Stdout appear outside function bodies, where they would be
+    read once at program start instead of on every run."""
+    depth = 0
+    for line in LITERAL_PATTERN.sub('""', source).splitlines():
+        if depth == 0 and STD_STREAM_PATTERN.search(line):
+            return True
+        depth += line.count('{') - line.count('}')
+    return False
+
+
+def package_id(source: str) -> str:
+    """Package name of a solution in the suite; identical sources share one package."""
+    return 's' + hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+
+
+def write_dispatch(suite_dir: str, packages: List[str]):
+    imports = ''.join(f'\t"{GO_SUITE_MODULE}/solutions/{package}"\n' for package in packages)
+    entries = ''.join(f'\t"{package}": {package}.Main,\n' for package in packages)
+    with open(os.path.join(suite_dir, 'dispatch.go'), 'w', encoding='utf-8') as f:
+        f.write(f"// Code generated by src/go_suite.py. DO NOT EDIT.\npackage main\n\nimport (\n{imports})\n\n"
+                f"var suiteSolutions = map[string]func(){{\n{entries}}}\n")
+
+
+def build_go_suite(file_paths: List[str]) -> Dict[str, Any]:
+    """Generate and build the multi-solution binary for a set of Go solutions.
+
+    The suite directory is keyed by the hash of every included source, the harness and
+    the toolchain, so an unchanged set of solutions reuses the binary built last time.
+
+    Args:
+        file_paths (List[str]): Paths to Solution.go files
+
+    Returns:
+        dict: 'success', 'binary', 'solutions' (absolute path -> package id of every
+              solution in the binary), 'excluded' (path -> reason), 'error',
+              'compile_duration' and 'cached'
+    """
+    with open(GO_SUITE_HARNESS, 'r', encoding='utf-8') as f:
+        harness = f.read()
+    language_version = get_go_language_version()
+    record = {'success': False, 'binary': None, 'solutions': {}, 'excluded': {}, 'error': None, 'compile_duration': 0.0, 'cached': False}
+    if language_version is None:
+        record['error'] = 'Go toolchain not found'
+        return record
+
+    sources = {}
+    candidates = {}
+    for file_path in file_paths:
+        file_path = os.path.abspath(file_path)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        if not PACKAGE_PATTERN.search(source) or not MAIN_FUNC_PATTERN.search(source):
+            record['excluded'][file_path] = 'not a main package with func main()'
+        elif binds_std_streams(source):
+            record['excluded'][file_path] = 'binds os.Stdin or os.Stdout at package level'
+        else:
+            package = package_id(source)
+            sources[package] = source
+            candidates[file_path] = package
+
+    digest = hashlib.sha256(harness.encode('utf-8'))
+    digest.update(language_version.encode('utf-8'))
+    for package in sorted(sources):
+        digest.update(package.encode('utf-8'))
+    suite_dir = os.path.join(GO_SUITE_DIR, digest.hexdigest())
+    binary = os.path.join(suite_dir, 'suite.exe' if sys.platform == 'win32' else 'suite')
+    manifest_file = os.path.join(suite_dir, 'manifest.json')
+
+    if os.path.exists(binary) and os.path.exists(manifest_file):
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            failed = set(json.load(f)['failed'])
+        record['cached'] = True
+    else:
+        os.makedirs(suite_dir, exist_ok=True)
+        os.makedirs(GO_SUITE_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(suite_dir, 'go.mod'), 'w', encoding='utf-8') as f:
+            f.write(f"module {GO_SUITE_MODULE}\n\ngo {language_version}\n")
+        with open(os.path.join(suite_dir, 'main.go'), 'w', encoding='utf-8') as f:
+            f.write(harness)
+        for package, source in sources.items():
+            package_dir = os.path.join(suite_dir, 'solutions', package)
+            os.makedirs(package_dir, exist_ok=True)
+            source = PACKAGE_PATTERN.sub(f'package {package}', source, count=1)
+            with open(os.path.join(package_dir, 'solution.go'), 'w', encoding='utf-8') as f:
+                f.write(MAIN_FUNC_PATTERN.sub('func Main()', source, count=1))
+
+        # A package that fails to compile is dropped and the link retried, so one broken
+        # solution does not take the whole suite down with it
+        failed = set()
+        env = dict(os.environ, GOCACHE=GO_SUITE_CACHE_DIR)
+        temp_binary = f"{binary}.{os.getpid()}.tmp"
+        start_time = time.perf_counter()
+        while True:
+            write_dispatch(suite_dir, sorted(package for package in sources if package not in failed))
+            process = subprocess.run(['go', 'build', '-o', temp_binary, '.'], capture_output=True, text=True, env=env, cwd=suite_dir)
+            if process.returncode == 0:
+                break
+            newly_failed = set(FAILED_PACKAGE_PATTERN.findall(process.stderr)) - failed
+            if not newly_failed:
+                record['error'] = process.stderr
+                record['compile_duration'] = time.perf_counter() - start_time
+                return record
+            failed |= newly_failed
+        record['compile_duration'] = time.perf_counter() - start_time
+        os.replace(temp_binary, binary)
+        with open(manifest_file, 'w', encoding='utf-8') as f:
+            json.dump({'failed': sorted(failed)}, f)
+
+    for file_path, package in candidates.items():
+        if package in failed:
+            record['excluded'][file_path] = 'does not compile'
+        else:
+            record['solutions'][file_path] = package
+    record.update(success=True, binary=binary)
+    return record
+
+
+class GoSuiteProcess:
+    """The running suite binary; runs one request at a time, since runs redirect os.Stdin."""
+
+    def __init__(self, binary: str):
+        self.binary = binary
+        self.process = None
+        self._frames = None
+        self._stderr = None
+        self._stderr_lock = threading.Lock()
+        self._stderr_reader = None
+        self._cpu_time = 0.0
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def start(self, capture_limits: Optional[Dict[str, Any]] = None):
+        self.process = subprocess.Popen(
+            [self.binary],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=BASE_DIR,
+            **NEW_SESSION_KWARGS
+        )
+        self._cpu_time = 0.0
+        self._frames = queue.Queue()
+        self._stderr = stderr_capture(capture_limits)
+        self._stderr_reader = threading.Thread(target=self._read_stderr, args=(self.process,), daemon=True)
+        self._stderr_reader.start()
+        threading.Thread(target=self._read_frames, args=(self.process, self._frames), daemon=True).start()
+
+    @staticmethod
+    def _read_frames(process, frames):
+        for line in process.stdout:
+            try:
+                frames.put(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        frames.put(None)
+
+    def _read_stderr(self, process):
+        read = process.stderr.read1
+        while True:
+            chunk = read(CHUNK_SIZE)
+            if not chunk:
+                break
+            with self._stderr_lock:
+                self._stderr.write(chunk)
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def _take_stderr(self, capture_limits: Optional[Dict[str, Any]]) -> str:
+        """stderr written since the previous request; what solutions wrote to os.Stderr."""
+        with self._stderr_lock:
+            stderr, self._stderr = self._stderr, stderr_capture(capture_limits)
+        return stderr.text()
+
+    def resources(self) -> Dict[str, float]:
+        """CPU time since the previous request, RSS and high-water mark of the suite process."""
+        try:
+            process = psutil.Process(self.process.pid)
+            cpu_times = process.cpu_times()
+            rss_mb = process.memory_info().rss / (1024 * 1024)
+            with open(f'/proc/{self.process.pid}/status', 'r') as f:
+                peak_mb = next((int(line.split()[1]) / 1024 for line in f if line.startswith('VmHWM:')), 0.0)
+        except (psutil.Error, OSError):
+            return {'cpu_time': 0.0, 'memory_usage': 0.0, 'peak_memory_usage': 0.0}
+        total_cpu = cpu_times.user + cpu_times.system
+        cpu_time, self._cpu_time = total_cpu - self._cpu_time, total_cpu
+        return {'cpu_time': cpu_time, 'memory_usage': rss_mb, 'peak_memory_usage': peak_mb}
+
+    def call(self, request: Dict[str, Any], timeout: float, capture_limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run one request and return the harness response with 'resources' added.
+
+        If the suite exits while running it (os.Exit in the solution, a crash), the
+        response carries the exit code and stderr, as a fresh process would, and the
+        suite is restarted on the next call.
+
+        Raises:
+            subprocess.TimeoutExpired: If no response arrives within timeout; the suite
+                                       is killed and restarted on the next call
+        """
+        with self._lock:
+            if not self.is_alive():
+                self.start(capture_limits)
+            else:
+                self._take_stderr(capture_limits)
+                self.resources()
+            self._next_id += 1
+            request = dict(request, id=self._next_id)
+            start_time = time.perf_counter()
+            try:
+                self.process.stdin.write((json.dumps(request) + '\n').encode('utf-8'))
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError):
+                pass
+
+            while True:
+                try:
+                    frame = self._frames.get(timeout=timeout)
+                except queue.Empty:
+                    self.stop()
+                    raise subprocess.TimeoutExpired([self.binary], timeout)
+                if frame is None or frame.get('id') == request['id']:
+                    break
+
+            if frame is None:
+                exit_code = self.process.wait()
+                kill_stragglers(self.process.pid)
+                self._stderr_reader.join()
+                self.process = None
+                return {
+                    'id': request['id'],
+                    'ok': False,
+                    'stdout': '',
+                    'stderr': self._take_stderr(capture_limits),
+                    'exit_code': exit_code,
+                    'duration': time.perf_counter() - start_time,
+                    'benchmark': None,
+                    'resources': {'cpu_time': 0.0, 'memory_usage': 0.0, 'peak_memory_usage': 0.0}
+                }
+            frame['resources'] = self.resources()
+            frame['stderr'] = self._take_stderr(capture_limits) + (frame.get('stderr') or '')
+            return frame
+
+    def stop(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        if self.process.poll() is None:
+            kill_process_group(self.process.pid, grace=0)
+        self.process.wait()
+        self.process = None
+
+    def close(self):
+        with self._lock:
+            self.stop()
+
+
+def configure_go_suite(file_paths: List[str], go_suite: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build the suite for file_paths and route their runs to it from now on.
+
+    Returns:
+        dict: Build record of build_go_suite plus the 'benchtime' in use
+    """
+    settings = get_go_suite_settings(go_suite)
+    shutdown_go_suite()
+    record = build_go_suite(file_paths)
+    with _SUITE_LOCK:
+        _SUITE.update(
+            binary=record['binary'],
+            solutions=record['solutions'],
+            benchtime=settings['benchtime'],
+            process=GoSuiteProcess(record['binary']) if record['success'] else None
+        )
+    return dict(record, benchtime=settings['benchtime'])
+
+
+def get_go_suite(file_path: str) -> Optional[Dict[str, Any]]:
+    """The suite process, package id and benchtime for a solution; None if the solution
+    is not part of the configured suite."""
+    with _SUITE_LOCK:
+        package = _SUITE['solutions'].get(os.path.abspath(file_path))
+        if package is None or _SUITE['process'] is None:
+            return None
+        return {'process': _SUITE['process'], 'solution': package, 'benchtime': _SUITE['benchtime']}
+
+
+def shutdown_go_suite():
+    """Stop the suite process, if one is running."""
+    with _SUITE_LOCK:
+        process = _SUITE['process']
+    if process is not None:
+        process.close()
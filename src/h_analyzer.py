@@ -2,6 +2,7 @@ import os
 import json
 from datetime import datetime
 import logging
+from src.result_writer import get_result_writer
 
 def generate_explicit_hallucinations(execution_data):
     if execution_data["execution_status"] != "failure":
@@ -86,6 +87,7 @@ def process_all_tasks(target_languages=None, target_tasks=None, target_prompt_ty
     logger = logging.getLogger(__name__)
     
     os.makedirs(os.path.join("results", "hallucination"), exist_ok=True)
+    writer = get_result_writer()
     
     if not target_tasks:
         logger.error("No tasks specified in config.json!")
@@ -116,44 +118,45 @@ def process_all_tasks(target_languages=None, target_tasks=None, target_prompt_ty
                     })
         
         processed_count = 0
-        with open(output_file, "w") as f:
-            for task in combinations:
-                task_id = task["task_id"]
-                language = task["language"]
-                model = task["model"]
-                prompt_type = task["prompt_type"]
-                
-                if not check_generation_exists(task_id, task_name):
-                    logger.warning(f"No generation record for {task_id}, skipping")
-                    continue
-                
-                execution_data = load_execution_data(task_id, task_name)
-                
-                test_results_data = load_test_results_data(task_id, task_name)
-                
-                explicit_hallucinations = generate_explicit_hallucinations(execution_data)
-                
-                test_passed_count = sum(1 for test in test_results_data if test.get("test_passed", False))
-                test_total_count = len(test_results_data)
-                
-                hallucination_result = {
-                    "task_id": task_id,
-                    "task_name": task_name,
-                    "language": language,
-                    "model": model,
-                    "prompt_type": prompt_type,
-                    "explicit_hallucinations": explicit_hallucinations,
-                    "test_passed_count": test_passed_count,
-                    "test_total_count": test_total_count,
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-                f.write(json.dumps(hallucination_result) + "\n")
-                processed_count += 1
-                total_processed += 1
+        writer.truncate(output_file)
+        for task in combinations:
+            task_id = task["task_id"]
+            language = task["language"]
+            model = task["model"]
+            prompt_type = task["prompt_type"]
+            
+            if not check_generation_exists(task_id, task_name):
+                logger.warning(f"No generation record for {task_id}, skipping")
+                continue
+            
+            execution_data = load_execution_data(task_id, task_name)
+            
+            test_results_data = load_test_results_data(task_id, task_name)
+            
+            explicit_hallucinations = generate_explicit_hallucinations(execution_data)
+            
+            test_passed_count = sum(1 for test in test_results_data if test.get("test_passed", False))
+            test_total_count = len(test_results_data)
+            
+            hallucination_result = {
+                "task_id": task_id,
+                "task_name": task_name,
+                "language": language,
+                "model": model,
+                "prompt_type": prompt_type,
+                "explicit_hallucinations": explicit_hallucinations,
+                "test_passed_count": test_passed_count,
+                "test_total_count": test_total_count,
+                "timestamp": datetime.now().isoformat()
+            }
+            
+            writer.write(output_file, [hallucination_result])
+            processed_count += 1
+            total_processed += 1
         
         logger.info(f"Processed {processed_count} combinations for task {task_name}")
     
+    writer.flush()
     logger.info(f"Hallucination analysis completed. Processed {total_processed} tasks.")
     return total_processed > 0
 
@@ -0,0 +1,76 @@
+// Go Allocation Harness:
+// Linked into a copy of a Go solution whose main() has been renamed to solutionMain()
+// (see build_go_with_harness in src/runner.py). Runs solutionMain once and writes its
+// runtime.MemStats deltas as JSON to the file named by ALLOC_STATS_FILE:
+//
+//   {"peak_heap": int, "alloc_bytes": int, "alloc_count": int}
+//
+// alloc_bytes and alloc_count come from TotalAlloc and Mallocs. MemStats has no peak, so
+// live heap bytes are sampled every millisecond through runtime/metrics, which does not
+// stop the world. The statistics are only written if solutionMain returns or panics; a
+// call to os.Exit skips them.
+package main
+
+import (
+	"encoding/json"
+	"os"
+	"runtime"
+	"runtime/metrics"
+	"sync/atomic"
+	"time"
+)
+
+const allocHarnessHeapMetric = "/memory/classes/heap/objects:bytes"
+
+func allocHarnessHeapBytes(sample []metrics.Sample) uint64 {
+	metrics.Read(sample)
+	if sample[0].Value.Kind() != metrics.KindUint64 {
+		return 0
+	}
+	return sample[0].Value.Uint64()
+}
+
+func allocHarnessWrite(before *runtime.MemStats, peak uint64) {
+	var after runtime.MemStats
+	runtime.ReadMemStats(&after)
+	if after.HeapAlloc > peak {
+		peak = after.HeapAlloc
+	}
+	if peak < before.HeapAlloc {
+		peak = before.HeapAlloc
+	}
+	data, _ := json.Marshal(map[string]uint64{
+		"peak_heap":   peak - before.HeapAlloc,
+		"alloc_bytes": after.TotalAlloc - before.TotalAlloc,
+		"alloc_count": after.Mallocs - before.Mallocs,
+	})
+	os.WriteFile(os.Getenv("ALLOC_STATS_FILE"), data, 0644)
+}
+
+func main() {
+	var before runtime.MemStats
+	runtime.ReadMemStats(&before)
+	var peak atomic.Uint64
+	peak.Store(before.HeapAlloc)
+	done := make(chan struct{})
+	go func() {
+		sample := []metrics.Sample{{Name: allocHarnessHeapMetric}}
+		ticker := time.NewTicker(time.Millisecond)
+		defer ticker.Stop()
+		for {
+			select {
+			case <-done:
+				return
+			case <-ticker.C:
+				if current := allocHarnessHeapBytes(sample); current > peak.Load() {
+					peak.Store(current)
+				}
+			}
+		}
+	}()
+	defer func() {
+		close(done)
+		allocHarnessWrite(&before, peak.Load())
+	}()
+	solutionMain()
+}
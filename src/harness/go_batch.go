@@ -0,0 +1,154 @@
+// Go Batch Harness:
+// Linked into a copy of a Go solution whose main() has been renamed to solutionMain()
+// (see build_go_with_harness in src/runner.py). Runs solutionMain once per request, with
+// os.Stdin and os.Stdout redirected to the case's input and output. os.Stderr is left
+// alone, so a message written just before os.Exit still reaches the runner.
+//
+// Protocol (one JSON document per line):
+//   request:  {"id": int, "input": str, "stdout_limit": int}
+//             (or "input_path": str, a shared file that becomes os.Stdin directly)
+//   response: {"id": int, "ok": bool, "stdout": str, "stderr": str, "exit_code": int,
+//              "duration": float, "stdout_truncated": bool}
+//
+// stdout past "stdout_limit" bytes (0: no limit) is drained but not kept.
+//
+// A call to os.Exit or a panic in another goroutine ends the process; the runner
+// attributes the crash to the case that was in flight.
+package main
+
+import (
+	"bufio"
+	"encoding/json"
+	"fmt"
+	"io"
+	"os"
+	"runtime/debug"
+	"time"
+)
+
+type batchHarnessRequest struct {
+	ID          int    `json:"id"`
+	Input       string `json:"input"`
+	InputPath   string `json:"input_path"`
+	StdoutLimit int64  `json:"stdout_limit"`
+}
+
+type batchHarnessResponse struct {
+	ID              int     `json:"id"`
+	OK              bool    `json:"ok"`
+	Stdout          string  `json:"stdout"`
+	Stderr          string  `json:"stderr"`
+	ExitCode        int     `json:"exit_code"`
+	Duration        float64 `json:"duration"`
+	StdoutTruncated bool    `json:"stdout_truncated"`
+}
+
+// batchHarnessRedirect points *target at a pipe and returns a function that restores it
+// and yields the first limit bytes written in between (all of them when limit is 0),
+// and whether more was written.
+func batchHarnessRedirect(target **os.File, limit int64) (func() (string, bool), error) {
+	r, w, err := os.Pipe()
+	if err != nil {
+		return nil, err
+	}
+	original := *target
+	*target = w
+	var data []byte
+	var discarded int64
+	done := make(chan struct{})
+	go func() {
+		if limit > 0 {
+			data, _ = io.ReadAll(io.LimitReader(r, limit))
+			discarded, _ = io.Copy(io.Discard, r)
+		} else {
+			data, _ = io.ReadAll(r)
+		}
+		r.Close()
+		close(done)
+	}()
+	return func() (string, bool) {
+		*target = original
+		w.Close()
+		<-done
+		return string(data), discarded > 0
+	}, nil
+}
+
+func batchHarnessStdin(input string) (*os.File, error) {
+	r, w, err := os.Pipe()
+	if err != nil {
+		return nil, err
+	}
+	go func() {
+		io.WriteString(w, input)
+		w.Close()
+	}()
+	return r, nil
+}
+
+func batchHarnessCall() (exitCode int, panicMessage string) {
+	defer func() {
+		if recovered := recover(); recovered != nil {
+			exitCode = 2
+			panicMessage = fmt.Sprintf("panic: %v\n\n%s", recovered, debug.Stack())
+		}
+	}()
+	solutionMain()
+	return 0, ""
+}
+
+func batchHarnessRun(request batchHarnessRequest) batchHarnessResponse {
+	response := batchHarnessResponse{ID: request.ID, ExitCode: 1}
+	var stdin *os.File
+	var err error
+	if request.InputPath != "" {
+		stdin, err = os.Open(request.InputPath)
+	} else {
+		stdin, err = batchHarnessStdin(request.Input)
+	}
+	if err != nil {
+		response.Stderr = err.Error()
+		return response
+	}
+	originalStdin := os.Stdin
+	os.Stdin = stdin
+	defer func() {
+		os.Stdin = originalStdin
+		stdin.Close()
+	}()
+	restoreStdout, err := batchHarnessRedirect(&os.Stdout, request.StdoutLimit)
+	if err != nil {
+		response.Stderr = err.Error()
+		return response
+	}
+
+	startTime := time.Now()
+	exitCode, panicMessage := batchHarnessCall()
+	response.Duration = time.Since(startTime).Seconds()
+
+	response.Stdout, response.StdoutTruncated = restoreStdout()
+	response.Stderr = panicMessage
+	response.ExitCode = exitCode
+	response.OK = exitCode == 0
+	return response
+}
+
+func main() {
+	reader := bufio.NewReaderSize(os.Stdin, 1<<20)
+	writer := bufio.NewWriter(os.Stdout)
+	encoder := json.NewEncoder(writer)
+	encoder.SetEscapeHTML(false)
+	for {
+		line, err := reader.ReadBytes('\n')
+		if len(line) > 0 {
+			var request batchHarnessRequest
+			if json.Unmarshal(line, &request) == nil {
+				encoder.Encode(batchHarnessRun(request))
+				writer.Flush()
+			}
+		}
+		if err != nil {
+			return
+		}
+	}
+}
@@ -0,0 +1,24 @@
+// Go Profile Harness:
+// Linked into a copy of a Go solution whose main() has been renamed to solutionMain()
+// (see build_go_with_harness in src/runner.py). Runs solutionMain once under the CPU
+// profiler and writes a pprof profile to the path in GO_CPU_PROFILE.
+//
+// The profile is only written if solutionMain returns or panics; a call to os.Exit
+// skips it. Go samples at 100 Hz, so runs shorter than ~10ms yield an empty profile.
+package main
+
+import (
+	"os"
+	"runtime/pprof"
+)
+
+func main() {
+	profileFile, err := os.Create(os.Getenv("GO_CPU_PROFILE"))
+	if err == nil && pprof.StartCPUProfile(profileFile) == nil {
+		defer func() {
+			pprof.StopCPUProfile()
+			profileFile.Close()
+		}()
+	}
+	solutionMain()
+}
@@ -0,0 +1,133 @@
+// Go Server Harness:
+// HTTP front end for serve mode (src/load_test.py), linked into a copy of a Go solution
+// whose main() has been renamed to solutionMain() (see build_go_with_harness in
+// src/runner.py). Each POST body is a request in the format of go_batch.go and is
+// answered with the same response document.
+//
+// solutionMain runs with os.Stdin and os.Stdout redirected to the request's input and
+// response, so requests are run one at a time. A call to os.Exit or a panic in another
+// goroutine ends the server; serve mode reports it as a crash.
+//
+// Binds an ephemeral port on 127.0.0.1 and prints "listening {port}" once ready.
+package main
+
+import (
+	"encoding/json"
+	"fmt"
+	"io"
+	"net"
+	"net/http"
+	"os"
+	"runtime/debug"
+	"strconv"
+	"sync"
+	"time"
+)
+
+type serverHarnessRequest struct {
+	ID        int    `json:"id"`
+	Input     string `json:"input"`
+	InputPath string `json:"input_path"`
+}
+
+type serverHarnessResponse struct {
+	ID       int     `json:"id"`
+	OK       bool    `json:"ok"`
+	Stdout   string  `json:"stdout"`
+	Stderr   string  `json:"stderr"`
+	ExitCode int     `json:"exit_code"`
+	Duration float64 `json:"duration"`
+}
+
+var serverHarnessLock sync.Mutex
+
+func serverHarnessStdin(request serverHarnessRequest) (*os.File, error) {
+	if request.InputPath != "" {
+		return os.Open(request.InputPath)
+	}
+	r, w, err := os.Pipe()
+	if err != nil {
+		return nil, err
+	}
+	go func() {
+		io.WriteString(w, request.Input)
+		w.Close()
+	}()
+	return r, nil
+}
+
+func serverHarnessCall() (exitCode int, panicMessage string) {
+	defer func() {
+		if recovered := recover(); recovered != nil {
+			exitCode = 2
+			panicMessage = fmt.Sprintf("panic: %v\n\n%s", recovered, debug.Stack())
+		}
+	}()
+	solutionMain()
+	return 0, ""
+}
+
+func serverHarnessRun(request serverHarnessRequest) serverHarnessResponse {
+	response := serverHarnessResponse{ID: request.ID, ExitCode: 1}
+	stdin, err := serverHarnessStdin(request)
+	if err != nil {
+		response.Stderr = err.Error()
+		return response
+	}
+	r, w, err := os.Pipe()
+	if err != nil {
+		stdin.Close()
+		response.Stderr = err.Error()
+		return response
+	}
+	collected := make(chan string)
+	go func() {
+		data, _ := io.ReadAll(r)
+		r.Close()
+		collected <- string(data)
+	}()
+
+	originalStdin, originalStdout := os.Stdin, os.Stdout
+	os.Stdin, os.Stdout = stdin, w
+	startTime := time.Now()
+	exitCode, panicMessage := serverHarnessCall()
+	response.Duration = time.Since(startTime).Seconds()
+	os.Stdin, os.Stdout = originalStdin, originalStdout
+	stdin.Close()
+	w.Close()
+
+	response.Stdout = <-collected
+	response.Stderr = panicMessage
+	response.ExitCode = exitCode
+	response.OK = exitCode == 0
+	return response
+}
+
+func serverHarnessHandle(w http.ResponseWriter, r *http.Request) {
+	var request serverHarnessRequest
+	status := http.StatusOK
+	var response serverHarnessResponse
+	if err := json.NewDecoder(r.Body).Decode(&request); err != nil {
+		status = http.StatusBadRequest
+		response = serverHarnessResponse{ExitCode: 1, Stderr: err.Error()}
+	} else {
+		serverHarnessLock.Lock()
+		response = serverHarnessRun(request)
+		serverHarnessLock.Unlock()
+	}
+	body, _ := json.Marshal(response)
+	w.Header().Set("Content-Type", "application/json")
+	w.Header().Set("Content-Length", strconv.Itoa(len(body)))
+	w.WriteHeader(status)
+	w.Write(body)
+}
+
+func main() {
+	listener, err := net.Listen("tcp", "127.0.0.1:0")
+	if err != nil {
+		fmt.Fprintln(os.Stderr, err)
+		os.Exit(1)
+	}
+	fmt.Fprintf(os.Stdout, "listening %d\n", listener.Addr().(*net.TCPAddr).Port)
+	http.Serve(listener, http.HandlerFunc(serverHarnessHandle))
+}
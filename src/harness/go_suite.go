@@ -0,0 +1,231 @@
+// Go Suite Harness:
+// main package of the multi-solution binary generated by src/go_suite.py. Every Go
+// solution is compiled as its own package, with main() renamed to Main(), and the
+// generated dispatch.go maps each package id to its Main in suiteSolutions. One binary
+// therefore serves every solution without a link step or process start per solution.
+//
+// Each request runs the solution once with os.Stdin and os.Stdout redirected, like
+// go_batch.go. With "benchtime" set (a Go -benchtime value such as "200ms" or "100x"),
+// the solution is then timed in-process with testing.Benchmark on the same input, with
+// its output discarded, and ns/op, allocs/op and bytes/op are reported.
+//
+// Protocol (one JSON document per line):
+//   request:  {"id": int, "solution": str, "input": str, "benchtime": str,
+//             "stdout_limit": int}
+//             (or "input_path": str, a shared file that becomes os.Stdin directly)
+//   response: {"id": int, "ok": bool, "stdout": str, "stderr": str, "exit_code": int,
+//              "duration": float, "stdout_truncated": bool, "benchmark": {"iterations":
+//              int, "ns_per_op": int, "allocs_per_op": int, "bytes_per_op": int} or null}
+//
+// stdout past "stdout_limit" bytes (0: no limit) is drained but not kept.
+//
+// Solutions share the process: a call to os.Exit or a panic in another goroutine ends
+// it, and package-level state of a solution persists between its runs.
+package main
+
+import (
+	"bufio"
+	"encoding/json"
+	"flag"
+	"fmt"
+	"io"
+	"os"
+	"runtime/debug"
+	"testing"
+	"time"
+)
+
+type suiteHarnessRequest struct {
+	ID          int    `json:"id"`
+	Solution    string `json:"solution"`
+	Input       string `json:"input"`
+	InputPath   string `json:"input_path"`
+	Benchtime   string `json:"benchtime"`
+	StdoutLimit int64  `json:"stdout_limit"`
+}
+
+type suiteHarnessBenchmark struct {
+	Iterations  int   `json:"iterations"`
+	NsPerOp     int64 `json:"ns_per_op"`
+	AllocsPerOp int64 `json:"allocs_per_op"`
+	BytesPerOp  int64 `json:"bytes_per_op"`
+}
+
+type suiteHarnessResponse struct {
+	ID              int                    `json:"id"`
+	OK              bool                   `json:"ok"`
+	Stdout          string                 `json:"stdout"`
+	Stderr          string                 `json:"stderr"`
+	ExitCode        int                    `json:"exit_code"`
+	Duration        float64                `json:"duration"`
+	StdoutTruncated bool                   `json:"stdout_truncated"`
+	Benchmark       *suiteHarnessBenchmark `json:"benchmark"`
+}
+
+// suiteHarnessInput returns a seekable file holding the request's input, so benchmark
+// iterations can rewind it instead of writing the input again.
+func suiteHarnessInput(request suiteHarnessRequest) (*os.File, func(), error) {
+	if request.InputPath != "" {
+		file, err := os.Open(request.InputPath)
+		if err != nil {
+			return nil, nil, err
+		}
+		return file, func() { file.Close() }, nil
+	}
+	file, err := os.CreateTemp("", "go-suite-input-*")
+	if err != nil {
+		return nil, nil, err
+	}
+	cleanup := func() {
+		file.Close()
+		os.Remove(file.Name())
+	}
+	if _, err := io.WriteString(file, request.Input); err != nil {
+		cleanup()
+		return nil, nil, err
+	}
+	if _, err := file.Seek(0, io.SeekStart); err != nil {
+		cleanup()
+		return nil, nil, err
+	}
+	return file, cleanup, nil
+}
+
+func suiteHarnessCall(solutionMain func()) (exitCode int, panicMessage string) {
+	defer func() {
+		if recovered := recover(); recovered != nil {
+			exitCode = 2
+			panicMessage = fmt.Sprintf("panic: %v\n\n%s", recovered, debug.Stack())
+		}
+	}()
+	solutionMain()
+	return 0, ""
+}
+
+// suiteHarnessRedirect points os.Stdout at a pipe and returns a function that restores
+// it and yields the first limit bytes written in between (all of them when limit is 0),
+// and whether more was written.
+func suiteHarnessRedirect(limit int64) (func() (string, bool), error) {
+	r, w, err := os.Pipe()
+	if err != nil {
+		return nil, err
+	}
+	original := os.Stdout
+	os.Stdout = w
+	var data []byte
+	var discarded int64
+	done := make(chan struct{})
+	go func() {
+		if limit > 0 {
+			data, _ = io.ReadAll(io.LimitReader(r, limit))
+			discarded, _ = io.Copy(io.Discard, r)
+		} else {
+			data, _ = io.ReadAll(r)
+		}
+		r.Close()
+		close(done)
+	}()
+	return func() (string, bool) {
+		os.Stdout = original
+		w.Close()
+		<-done
+		return string(data), discarded > 0
+	}, nil
+}
+
+func suiteHarnessBench(solutionMain func(), stdin *os.File, benchtime string) (*suiteHarnessBenchmark, error) {
+	if err := flag.Set("test.benchtime", benchtime); err != nil {
+		return nil, err
+	}
+	sink, err := os.OpenFile(os.DevNull, os.O_WRONLY, 0)
+	if err != nil {
+		return nil, err
+	}
+	defer sink.Close()
+	originalStdout := os.Stdout
+	os.Stdout = sink
+	defer func() { os.Stdout = originalStdout }()
+
+	failure := ""
+	result := testing.Benchmark(func(b *testing.B) {
+		b.ReportAllocs()
+		for i := 0; i < b.N; i++ {
+			stdin.Seek(0, io.SeekStart)
+			if exitCode, panicMessage := suiteHarnessCall(solutionMain); exitCode != 0 {
+				failure = panicMessage
+				b.FailNow()
+			}
+		}
+	})
+	if failure != "" {
+		return nil, fmt.Errorf("benchmark run failed: %s", failure)
+	}
+	return &suiteHarnessBenchmark{
+		Iterations:  result.N,
+		NsPerOp:     result.NsPerOp(),
+		AllocsPerOp: result.AllocsPerOp(),
+		BytesPerOp:  result.AllocedBytesPerOp(),
+	}, nil
+}
+
+func suiteHarnessRun(request suiteHarnessRequest) suiteHarnessResponse {
+	response := suiteHarnessResponse{ID: request.ID, ExitCode: 1}
+	solutionMain, found := suiteSolutions[request.Solution]
+	if !found {
+		response.Stderr = fmt.Sprintf("unknown solution %q", request.Solution)
+		return response
+	}
+	stdin, cleanup, err := suiteHarnessInput(request)
+	if err != nil {
+		response.Stderr = err.Error()
+		return response
+	}
+	defer cleanup()
+	originalStdin := os.Stdin
+	os.Stdin = stdin
+	defer func() { os.Stdin = originalStdin }()
+	restoreStdout, err := suiteHarnessRedirect(request.StdoutLimit)
+	if err != nil {
+		response.Stderr = err.Error()
+		return response
+	}
+
+	startTime := time.Now()
+	exitCode, panicMessage := suiteHarnessCall(solutionMain)
+	response.Duration = time.Since(startTime).Seconds()
+
+	response.Stdout, response.StdoutTruncated = restoreStdout()
+	response.Stderr = panicMessage
+	response.ExitCode = exitCode
+	response.OK = exitCode == 0
+	if response.OK && request.Benchtime != "" {
+		benchmark, err := suiteHarnessBench(solutionMain, stdin, request.Benchtime)
+		if err != nil {
+			response.Stderr = err.Error()
+		}
+		response.Benchmark = benchmark
+	}
+	return response
+}
+
+func main() {
+	// Registers -test.benchtime, which testing.Benchmark reads
+	testing.Init()
+	reader := bufio.NewReaderSize(os.Stdin, 1<<20)
+	writer := bufio.NewWriter(os.Stdout)
+	encoder := json.NewEncoder(writer)
+	encoder.SetEscapeHTML(false)
+	for {
+		line, err := reader.ReadBytes('\n')
+		if len(line) > 0 {
+			var request suiteHarnessRequest
+			if json.Unmarshal(line, &request) == nil {
+				encoder.Encode(suiteHarnessRun(request))
+				writer.Flush()
+			}
+		}
+		if err != nil {
+			return
+		}
+	}
+}
@@ -0,0 +1,38 @@
+'use strict';
+/**
+ * Node Allocation Harness:
+ * Preloaded with `node --require node_alloc.js Solution.js`. Records V8 heap statistics
+ * around every garbage collection (v8.GCProfiler) while the solution runs and, on exit,
+ * writes its allocation statistics as JSON to the file named by ALLOC_STATS_FILE.
+ *
+ *   {"peak_heap": int, "alloc_bytes": int, "alloc_count": null}
+ *
+ * alloc_bytes is the growth of used_heap_size plus everything each collection freed;
+ * peak_heap is the largest used_heap_size seen, less the size at startup. V8 does not
+ * count allocations, so alloc_count is null.
+ */
+const fs = require('fs');
+const v8 = require('v8');
+
+const statsFile = process.env.ALLOC_STATS_FILE;
+const initial = v8.getHeapStatistics().used_heap_size;
+const profiler = new v8.GCProfiler();
+profiler.start();
+
+process.on('exit', () => {
+    const final = v8.getHeapStatistics().used_heap_size;
+    const collections = (profiler.stop() || {}).statistics || [];
+    let freed = 0;
+    let peak = final;
+    for (const collection of collections) {
+        const before = collection.beforeGC.heapStatistics.usedHeapSize;
+        const after = collection.afterGC.heapStatistics.usedHeapSize;
+        freed += Math.max(before - after, 0);
+        peak = Math.max(peak, before);
+    }
+    fs.writeFileSync(statsFile, JSON.stringify({
+        peak_heap: Math.max(peak - initial, 0),
+        alloc_bytes: Math.max(final - initial + freed, 0),
+        alloc_count: null
+    }));
+});
@@ -0,0 +1,232 @@
+'use strict';
+/**
+ * Node Harness:
+ * Long-lived child process used by the warm executor in src/workers.py.
+ * Compiles each generated Solution.js once (reusing V8's code cache on disk) and runs it
+ * in a fresh vm context per input, with stdin, stdout and process.exit redirected.
+ *
+ * Protocol (one JSON document per line):
+ *   request:  {"id": int, "file_path": str, "input": str, "stdout_limit": int}
+ *             (or "input_path": str, a shared file holding the input)
+ *   response: {"id": int, "ok": bool, "stdout": str, "stderr": str, "exit_code": int,
+ *              "error_type": str, "duration": float, "cpu_time": float,
+ *              "stdout_truncated": bool}
+ *
+ * stdout past "stdout_limit" bytes is counted but not kept.
+ *
+ * Usage: node node_harness.js [code_cache_dir]
+ */
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const crypto = require('crypto');
+const readline = require('readline');
+const Module = require('module');
+const { Console } = require('console');
+const { Readable, Writable } = require('stream');
+
+const codeCacheDir = process.argv[2] || null;
+const scripts = new Map();
+let currentCase = null;
+
+class ExitSignal extends Error {
+    constructor(code) {
+        super(`process.exit(${code})`);
+        this.exitCode = code;
+    }
+}
+
+function loadScript(filePath) {
+    if (scripts.has(filePath)) {
+        return scripts.get(filePath);
+    }
+    const source = fs.readFileSync(filePath, 'utf8').replace(/^#!.*/, '');
+    const wrapped = Module.wrap(source);
+    let cacheFile = null;
+    let cachedData;
+    if (codeCacheDir) {
+        const hash = crypto.createHash('sha256').update(process.version).update(wrapped).digest('hex');
+        cacheFile = path.join(codeCacheDir, `${hash}.bin`);
+        if (fs.existsSync(cacheFile)) {
+            cachedData = fs.readFileSync(cacheFile);
+        }
+    }
+    const script = new vm.Script(wrapped, { filename: filePath, cachedData });
+    if (cacheFile && (!cachedData || script.cachedDataRejected)) {
+        fs.mkdirSync(codeCacheDir, { recursive: true });
+        fs.writeFileSync(cacheFile, script.createCachedData());
+    }
+    scripts.set(filePath, script);
+    return script;
+}
+
+// Keeps the first `limit` bytes written to its stream and counts the rest
+function collector(limit = Infinity) {
+    const sink = {
+        chunks: [],
+        size: 0,
+        total: 0,
+        push(data) {
+            sink.total += data.length;
+            const room = limit - sink.size;
+            if (room > 0) {
+                const kept = data.length > room ? Buffer.from(data.subarray(0, room)) : data;
+                sink.chunks.push(kept);
+                sink.size += kept.length;
+            }
+        },
+        text() {
+            return Buffer.concat(sink.chunks).toString();
+        }
+    };
+    sink.stream = new Writable({
+        write(chunk, encoding, callback) {
+            sink.push(Buffer.isBuffer(chunk) ? chunk : Buffer.from(chunk, encoding));
+            callback();
+        }
+    });
+    return sink;
+}
+
+function isStdinPath(file) {
+    return file === 0 || file === '/dev/stdin';
+}
+
+function runCase(request) {
+    return new Promise((resolve) => {
+        const stdoutSink = collector(request.stdout_limit == null ? Infinity : request.stdout_limit);
+        const stderrSink = collector();
+        const stdout = stdoutSink.stream;
+        const stderr = stderrSink.stream;
+        const input = request.input_path ? fs.readFileSync(request.input_path, 'utf8') : (request.input || '');
+        const stdin = new Readable({ read() {} });
+        stdin.push(input);
+        stdin.push(null);
+
+        const startTime = process.hrtime.bigint();
+        const startCpu = process.cpuUsage();
+        let settled = false;
+
+        const finish = (exitCode, error) => {
+            if (settled) {
+                return;
+            }
+            settled = true;
+            currentCase = null;
+            let errorType = null;
+            if (error && !(error instanceof ExitSignal)) {
+                stderrSink.push(Buffer.from(`${error && error.stack ? error.stack : String(error)}\n`));
+                errorType = error && error.name ? error.name : 'Error';
+            }
+            const cpu = process.cpuUsage(startCpu);
+            resolve({
+                id: request.id,
+                ok: exitCode === 0,
+                stdout: stdoutSink.text(),
+                stderr: stderrSink.text(),
+                exit_code: exitCode,
+                error_type: errorType,
+                duration: Number(process.hrtime.bigint() - startTime) / 1e9,
+                cpu_time: (cpu.user + cpu.system) / 1e6,
+                stdout_truncated: stdoutSink.total > stdoutSink.size
+            });
+        };
+
+        const sandboxProcess = Object.create(process, {
+            argv: { value: [process.argv[0], request.file_path] },
+            stdin: { value: stdin },
+            stdout: { value: stdout },
+            stderr: { value: stderr },
+            exitCode: { value: undefined, writable: true },
+            exit: { value: (code) => { throw new ExitSignal(code === undefined ? (sandboxProcess.exitCode || 0) : code); } }
+        });
+        const fsShim = Object.create(fs, {
+            readFileSync: {
+                value: (file, options, ...rest) => {
+                    if (!isStdinPath(file)) {
+                        return fs.readFileSync(file, options, ...rest);
+                    }
+                    const encoding = typeof options === 'string' ? options : options && options.encoding;
+                    return encoding ? input : Buffer.from(input);
+                }
+            }
+        });
+        const solutionRequire = Module.createRequire(request.file_path);
+        const sandboxRequire = (id) => {
+            if (id === 'fs') {
+                return fsShim;
+            }
+            if (id === 'process') {
+                return sandboxProcess;
+            }
+            return solutionRequire(id);
+        };
+        const sandboxModule = { exports: {}, filename: request.file_path, id: '.', loaded: false };
+        sandboxRequire.main = sandboxModule;
+        const context = vm.createContext({
+            process: sandboxProcess,
+            console: new Console({ stdout, stderr }),
+            Buffer,
+            URL,
+            TextEncoder,
+            TextDecoder,
+            setTimeout,
+            setInterval,
+            setImmediate,
+            clearTimeout,
+            clearInterval,
+            clearImmediate,
+            queueMicrotask
+        });
+
+        currentCase = { finish };
+        try {
+            const wrapper = loadScript(request.file_path).runInContext(context);
+            wrapper.call(
+                sandboxModule.exports,
+                sandboxModule.exports,
+                sandboxRequire,
+                sandboxModule,
+                request.file_path,
+                path.dirname(request.file_path)
+            );
+        } catch (error) {
+            finish(error instanceof ExitSignal ? error.exitCode : 1, error);
+            return;
+        }
+
+        // Solutions reading stdin asynchronously finish after the stream ends;
+        // two event-loop turns let 'end'/'close' handlers and pending promises settle.
+        const settle = () => setImmediate(() => setImmediate(() => finish(sandboxProcess.exitCode || 0)));
+        if (stdin.listenerCount('data') || stdin.listenerCount('readable') || stdin.listenerCount('end')) {
+            stdin.once('close', settle);
+        } else {
+            settle();
+        }
+    });
+}
+
+process.on('uncaughtException', (error) => {
+    if (currentCase) {
+        currentCase.finish(error instanceof ExitSignal ? error.exitCode : 1, error);
+    } else {
+        process.stderr.write(`${error && error.stack ? error.stack : String(error)}\n`);
+    }
+});
+
+async function main() {
+    const lines = readline.createInterface({ input: process.stdin, crlfDelay: Infinity });
+    for await (const line of lines) {
+        if (!line.trim()) {
+            continue;
+        }
+        const response = await runCase(JSON.parse(line));
+        process.stdout.write(`${JSON.stringify(response)}\n`);
+    }
+}
+
+module.exports = { runCase };
+
+if (require.main === module) {
+    main();
+}
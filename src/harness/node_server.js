@@ -0,0 +1,41 @@
+'use strict';
+/**
+ * Node Server Harness:
+ * HTTP front end of node_harness.js for serve mode (src/load_test.py). Each POST body is
+ * a harness request and is answered with the harness response document.
+ *
+ * runCase tracks a single in-flight case for uncaught exceptions, so requests are run one
+ * at a time in arrival order.
+ *
+ * Usage: node node_server.js [code_cache_dir]
+ * Binds an ephemeral port on 127.0.0.1 and prints "listening {port}" once ready.
+ */
+const http = require('http');
+const { runCase } = require('./node_harness');
+
+let pending = Promise.resolve();
+
+function reply(res, status, response) {
+    const body = JSON.stringify(response);
+    res.writeHead(status, { 'Content-Type': 'application/json', 'Content-Length': Buffer.byteLength(body) });
+    res.end(body);
+}
+
+const server = http.createServer((req, res) => {
+    const chunks = [];
+    req.on('data', (chunk) => chunks.push(chunk));
+    req.on('end', () => {
+        let request;
+        try {
+            request = JSON.parse(Buffer.concat(chunks).toString('utf8'));
+        } catch (error) {
+            reply(res, 400, { ok: false, error_type: error.name, stderr: String(error) });
+            return;
+        }
+        pending = pending.then(async () => reply(res, 200, await runCase(request)));
+    });
+});
+
+server.listen(0, '127.0.0.1', () => {
+    process.stdout.write(`listening ${server.address().port}\n`);
+});
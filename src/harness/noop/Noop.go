@@ -0,0 +1,14 @@
+package main
+
+import (
+	"encoding/json"
+	"fmt"
+	"os"
+)
+
+func main() {
+	var input map[string]interface{}
+	json.NewDecoder(os.Stdin).Decode(&input)
+	output, _ := json.Marshal(map[string]interface{}{})
+	fmt.Println(string(output))
+}
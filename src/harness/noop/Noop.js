@@ -0,0 +1,4 @@
+const fs = require('fs');
+
+JSON.parse(fs.readFileSync(0, 'utf8') || '{}');
+console.log(JSON.stringify({}));
@@ -0,0 +1,6 @@
+import sys
+import json
+
+if __name__ == '__main__':
+    json.loads(sys.stdin.read() or '{}')
+    print(json.dumps({}))
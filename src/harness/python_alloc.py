@@ -0,0 +1,58 @@
+"""
+Python Allocation Harness:
+Runs a generated Solution.py as __main__ under tracemalloc and writes its allocation
+statistics as JSON to the file named by ALLOC_STATS_FILE.
+
+    {"peak_heap": int, "alloc_bytes": null, "alloc_count": null,
+     "retained_bytes": int, "retained_count": int}
+
+peak_heap is the tracemalloc peak. tracemalloc has no cumulative counter, so the totals
+allocated during the run (alloc_bytes and alloc_count in the other languages) are not
+known. retained_bytes and retained_count are the blocks allocated by the solution that
+are still live when it finishes, taken before its module namespace is released.
+
+Usage: python python_alloc.py Solution.py
+"""
+import os
+import sys
+import json
+import tracemalloc
+
+
+def write_stats(stats_file):
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__)
+    ])
+    statistics = snapshot.statistics('filename')
+    tracemalloc.stop()
+    with open(stats_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'peak_heap': peak,
+            'alloc_bytes': None,
+            'alloc_count': None,
+            'retained_bytes': sum(stat.size for stat in statistics),
+            'retained_count': sum(stat.count for stat in statistics)
+        }, f)
+
+
+def main():
+    file_path = os.path.abspath(sys.argv[1])
+    stats_file = os.environ['ALLOC_STATS_FILE']
+    sys.argv = sys.argv[1:]
+    sys.path[0] = os.path.dirname(file_path)
+    with open(file_path, 'rb') as f:
+        code = compile(f.read(), file_path, 'exec')
+    namespace = {'__name__': '__main__', '__file__': file_path, '__builtins__': __builtins__}
+
+    tracemalloc.start()
+    try:
+        exec(code, namespace)
+    finally:
+        sys.stdout.flush()
+        write_stats(stats_file)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Python Server Harness:
+HTTP front end of python_worker.py for serve mode (src/load_test.py). Each POST body is
+a worker request and is answered with the worker's response document.
+
+handle_request redirects the process-wide stdin, stdout and stderr while a solution runs,
+so requests are served one at a time; concurrent connections wait for the lock.
+
+Usage: python python_server.py
+Binds an ephemeral port on 127.0.0.1 and prints "listening {port}" once ready.
+"""
+import os
+import sys
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from python_worker import handle_request, encode_response
+
+_LOCK = threading.Lock()
+
+
+class SolutionHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; without TCP_NODELAY, Nagle's algorithm and
+    # delayed ACKs add about 40ms to every response
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            self.reply(400, json.dumps({'ok': False, 'error_type': type(e).__name__, 'error_message': str(e)}))
+            return
+        with _LOCK:
+            payload = encode_response(handle_request(request))
+        self.reply(200, payload)
+
+    def reply(self, status, payload):
+        data = payload.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SolutionHandler)
+    server.daemon_threads = True
+    sys.stdout.write(f"listening {server.server_address[1]}\n")
+    sys.stdout.flush()
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,260 @@
+"""
+Python Subinterpreter Harness:
+Long-lived host process used by the subinterpreter executor in src/subinterpreters.py.
+Runs every request as a script (a fresh __main__ module with stdin and stdout
+redirected, like `python Solution.py`) in an isolated subinterpreter with its own GIL, on
+one of N threads, so up to N solutions run in parallel inside this one process with
+separate module state. Needs Python 3.12+ (_xxsubinterpreters) or 3.13+ (_interpreters).
+
+Creating an interpreter costs more than spawning a process, so interpreters are reused:
+each solution keeps its own (later runs of it only re-execute the script), and threads
+create spare interpreters for new solutions between requests.
+
+Protocol (one JSON document per line; responses may arrive out of order):
+    request:  {"id": int, "file_path": str, "input": str, "stdout_limit": int}
+              (or "input_path": str, a shared file holding the input)
+    response: {"id": int, "ok": bool, "stdout": str, "stderr": str, "exit_code": int,
+               "duration": float, "cpu_time": float, "stdout_truncated": bool,
+               "fallback": bool}
+
+stdout past "stdout_limit" bytes is counted but not kept.
+
+"fallback" is set when the solution failed because something it uses does not work in
+an isolated subinterpreter (an extension module without multi-phase init, fork, exec),
+so the runner repeats the run in a fresh process.
+
+Usage: python python_subinterpreters.py [threads]
+"""
+import os
+import sys
+import json
+import queue
+import threading
+from collections import OrderedDict
+
+try:
+    import _interpreters as interpreters
+except ImportError:
+    import _xxsubinterpreters as interpreters
+
+PRELUDE_SCRIPT = '''
+import io, os, sys, json, time, runpy, pkgutil, traceback
+
+class _BoundedBuffer(io.BytesIO):
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+        self.total = 0
+
+    def write(self, data):
+        size = len(data)
+        self.total += size
+        if self.limit is None:
+            return super().write(data)
+        room = self.limit - self.tell()
+        if room > 0:
+            super().write(bytes(data[:room]))
+        return size
+
+def _run(file_path, input_data, input_path, stdout_limit):
+    if input_path is not None:
+        with open(input_path, 'rb') as f:
+            stdin_bytes = f.read()
+    else:
+        stdin_bytes = input_data.encode('utf-8')
+    stdout_buffer, stderr_buffer = _BoundedBuffer(stdout_limit), io.BytesIO()
+    sys.stdin = io.TextIOWrapper(io.BytesIO(stdin_bytes), encoding='utf-8')
+    sys.stdout = io.TextIOWrapper(stdout_buffer, encoding='utf-8', write_through=True)
+    sys.stderr = io.TextIOWrapper(stderr_buffer, encoding='utf-8', write_through=True)
+    sys.argv = [file_path]
+    if sys.path[0] != os.path.dirname(file_path):
+        sys.path.insert(0, os.path.dirname(file_path))
+    exit_code, fallback = 0, False
+    start_time, start_cpu = time.perf_counter(), time.thread_time()
+    try:
+        runpy.run_path(file_path, run_name='__main__')
+    except SystemExit as e:
+        if isinstance(e.code, int) or e.code is None:
+            exit_code = e.code or 0
+        else:
+            sys.stderr.write(f"{e.code}\\n")
+            exit_code = 1
+    except BaseException as e:
+        traceback.print_exc()
+        exit_code = 1
+        fallback = 'subinterpreter' in str(e)
+    duration, cpu_time = time.perf_counter() - start_time, time.thread_time() - start_cpu
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            pass
+    return {
+        'ok': exit_code == 0,
+        'stdout': stdout_buffer.getvalue().decode('utf-8', errors='replace'),
+        'stderr': stderr_buffer.getvalue().decode('utf-8', errors='replace'),
+        'exit_code': exit_code,
+        'duration': duration,
+        'cpu_time': cpu_time,
+        'stdout_truncated': stdout_limit is not None and stdout_buffer.total > stdout_limit,
+        'fallback': fallback
+    }
+
+def _respond(response_fd, file_path, input_data, input_path, stdout_limit):
+    # The host owns response_fd and closes it once the script has returned
+    view = memoryview(json.dumps(_run(file_path, input_data, input_path, stdout_limit)).encode('utf-8'))
+    while view:
+        view = view[os.write(response_fd, view):]
+'''
+
+RUN_SCRIPT = '_respond(response_fd, file_path, input_data, input_path, stdout_limit)'
+
+
+def create_interpreter():
+    """A new isolated interpreter with the stdlib modules of a run already imported."""
+    interpreter = interpreters.create()
+    interpreters.run_string(interpreter, PRELUDE_SCRIPT)
+    return interpreter
+
+
+class InterpreterCache:
+    """Idle interpreters by solution, plus spares for solutions not seen yet.
+
+    At most max_idle interpreters are kept idle; the least recently used are destroyed.
+    """
+
+    def __init__(self, spares, max_idle):
+        self.target_spares = spares
+        self.max_idle = max_idle
+        self._idle = OrderedDict()
+        self._spares = []
+        self._lock = threading.Lock()
+
+    def acquire(self, file_path):
+        with self._lock:
+            idle = self._idle.get(file_path)
+            if idle:
+                interpreter = idle.pop()
+                if not idle:
+                    del self._idle[file_path]
+                return interpreter
+            if self._spares:
+                return self._spares.pop()
+        return create_interpreter()
+
+    def release(self, file_path, interpreter):
+        evicted = []
+        with self._lock:
+            self._idle.setdefault(file_path, []).append(interpreter)
+            self._idle.move_to_end(file_path)
+            while sum(len(idle) for idle in self._idle.values()) > self.max_idle:
+                oldest, idle = next(iter(self._idle.items()))
+                evicted.append(idle.pop(0))
+                if not idle:
+                    del self._idle[oldest]
+        for old in evicted:
+            interpreters.destroy(old)
+
+    def replenish(self):
+        with self._lock:
+            if len(self._spares) >= self.target_spares:
+                return
+        interpreter = create_interpreter()
+        with self._lock:
+            self._spares.append(interpreter)
+
+    def close(self):
+        with self._lock:
+            remaining = self._spares + [interpreter for idle in self._idle.values() for interpreter in idle]
+            self._spares, self._idle = [], OrderedDict()
+        for interpreter in remaining:
+            interpreters.destroy(interpreter)
+
+
+def read_all(fd, chunks):
+    with os.fdopen(fd, 'rb') as f:
+        chunks.append(f.read())
+
+
+def run_in_subinterpreter(request, cache):
+    """Run one request in the solution's subinterpreter and return its response document."""
+    response = {'id': request.get('id')}
+    file_path = os.path.abspath(request['file_path'])
+    read_fd, write_fd = os.pipe()
+    chunks = []
+    # The response is read while the script runs, so large output cannot fill the pipe
+    reader = threading.Thread(target=read_all, args=(read_fd, chunks))
+    reader.start()
+    interpreter = None
+    try:
+        interpreter = cache.acquire(file_path)
+        failure = interpreters.run_string(interpreter, RUN_SCRIPT, {
+            'file_path': file_path,
+            'input_data': request.get('input') or '',
+            'input_path': request.get('input_path'),
+            'stdout_limit': request.get('stdout_limit'),
+            'response_fd': write_fd
+        })
+    except Exception as e:
+        failure = e
+    finally:
+        os.close(write_fd)
+    reader.join()
+    try:
+        response.update(json.loads(chunks[0]))
+    except (IndexError, ValueError):
+        response.update({
+            'ok': False,
+            'stdout': '',
+            'stderr': f"Subinterpreter run failed: {failure}",
+            'exit_code': 1,
+            'duration': 0.0,
+            'cpu_time': 0.0,
+            'fallback': True
+        })
+    if interpreter is not None:
+        # An interpreter a run could not use is not reused; its imports may be half done
+        if response['fallback']:
+            interpreters.destroy(interpreter)
+        else:
+            cache.release(file_path, interpreter)
+    return response
+
+
+def serve(requests, protocol_out, lock, cache):
+    while True:
+        try:
+            request = requests.get_nowait()
+        except queue.Empty:
+            # Prepare an interpreter for the next new solution while there is nothing to do
+            cache.replenish()
+            request = requests.get()
+        if request is None:
+            return
+        payload = json.dumps(run_in_subinterpreter(request, cache))
+        with lock:
+            protocol_out.write(payload + '\n')
+            protocol_out.flush()
+
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    protocol_in, protocol_out = sys.stdin, sys.stdout
+    requests = queue.Queue()
+    lock = threading.Lock()
+    cache = InterpreterCache(spares=threads, max_idle=4 * threads)
+    workers = [threading.Thread(target=serve, args=(requests, protocol_out, lock, cache)) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for line in protocol_in:
+        if line.strip():
+            requests.put(json.loads(line))
+    for _ in workers:
+        requests.put(None)
+    for worker in workers:
+        worker.join()
+    cache.close()
+
+
+if __name__ == '__main__':
+    main()
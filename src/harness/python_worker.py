@@ -0,0 +1,167 @@
+"""
+Python Worker Harness:
+Long-lived child process used by the warm executor in src/workers.py.
+Compiles each generated Solution.py once and runs it as a script for every request: a
+fresh __main__ module with stdin, stdout, stderr and sys.argv redirected, as in
+`python Solution.py`. Only interpreter start-up and the compilation are saved, so a
+solution reads its input and prints its output exactly as it does in a fresh process.
+
+Protocol (one JSON document per line):
+    request:  {"id": int, "file_path": str, "input": str, "stdout_limit": int}
+              (or "input_path": str, a shared file holding the input)
+    response: {"id": int, "ok": bool, "stdout": str, "stderr": str, "exit_code": int,
+               "duration": float, "cpu_time": float, "stdout_truncated": bool}
+
+stdout past "stdout_limit" bytes is counted but not kept, so a solution that prints a lot
+does not grow the worker (or the runner decoding the response).
+"""
+import io
+import os
+import sys
+import json
+import time
+import types
+import builtins
+import traceback
+
+_CODE = {}
+
+
+class BoundedBuffer(io.BytesIO):
+    """BytesIO that keeps the first `limit` bytes written (all of them when limit is None)."""
+
+    def __init__(self, limit=None):
+        super().__init__()
+        self.limit = limit
+        self.total = 0
+
+    def write(self, data):
+        size = len(data)
+        self.total += size
+        if self.limit is None:
+            return super().write(data)
+        room = self.limit - self.tell()
+        if room > 0:
+            super().write(bytes(data[:room]))
+        return size
+
+    @property
+    def truncated(self):
+        return self.limit is not None and self.total > self.limit
+
+
+def load_code(file_path):
+    """Compile a solution file once and cache the code object by its absolute path."""
+    code = _CODE.get(file_path)
+    if code is None:
+        with open(file_path, 'rb') as f:
+            code = compile(f.read(), file_path, 'exec')
+        _CODE[file_path] = code
+    return code
+
+
+def load_input(request):
+    """stdin of a request, read from its shared input file if it has one."""
+    if 'input_path' in request:
+        with open(request['input_path'], 'rb') as f:
+            return f.read()
+    return (request.get('input') or '').encode('utf-8')
+
+
+def run_script(file_path, stdin_bytes, stdout_limit=None):
+    """Run a solution as __main__ and return (exit_code, stdout, stderr, stdout_truncated)."""
+    stdout_buffer, stderr_buffer = BoundedBuffer(stdout_limit), io.BytesIO()
+    saved = (sys.stdin, sys.stdout, sys.stderr, sys.argv, sys.modules['__main__'])
+    module = types.ModuleType('__main__')
+    module.__file__ = file_path
+    module.__builtins__ = builtins
+    # The wrappers close their buffers when collected, so they are kept until the output is read
+    streams = (
+        io.TextIOWrapper(io.BytesIO(stdin_bytes), encoding='utf-8'),
+        io.TextIOWrapper(stdout_buffer, encoding='utf-8', write_through=True),
+        io.TextIOWrapper(stderr_buffer, encoding='utf-8', write_through=True)
+    )
+    sys.stdin, sys.stdout, sys.stderr = streams
+    sys.argv = [file_path]
+    sys.modules['__main__'] = module
+    if sys.path[0] != os.path.dirname(file_path):
+        sys.path.insert(0, os.path.dirname(file_path))
+    exit_code = 0
+    try:
+        exec(load_code(file_path), module.__dict__)
+    except SystemExit as e:
+        if isinstance(e.code, int) or e.code is None:
+            exit_code = e.code or 0
+        else:
+            sys.stderr.write(f"{e.code}\n")
+            exit_code = 1
+    except KeyboardInterrupt:
+        raise
+    except BaseException as e:
+        # Leave this frame out, so the traceback starts in the solution as it would in `python Solution.py`
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        exit_code = 1
+    finally:
+        for stream in streams[1:]:
+            try:
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+        sys.stdin, sys.stdout, sys.stderr, sys.argv, sys.modules['__main__'] = saved
+    return (
+        exit_code,
+        stdout_buffer.getvalue().decode('utf-8', errors='replace'),
+        stderr_buffer.getvalue().decode('utf-8', errors='replace'),
+        stdout_buffer.truncated
+    )
+
+
+def handle_request(request):
+    """Run the requested solution on the request's input and build the response document."""
+    response = {'id': request.get('id')}
+    try:
+        file_path = os.path.abspath(request['file_path'])
+        stdin_bytes = load_input(request)
+        load_code(file_path)
+    except (OSError, ValueError, SyntaxError) as e:
+        response.update({
+            'ok': False,
+            'stdout': '',
+            'stderr': ''.join(traceback.format_exception_only(type(e), e)),
+            'exit_code': 1,
+            'duration': 0.0,
+            'cpu_time': 0.0
+        })
+        return response
+    start_time = time.perf_counter()
+    start_cpu = time.process_time()
+    exit_code, stdout, stderr, stdout_truncated = run_script(file_path, stdin_bytes, request.get('stdout_limit'))
+    response.update({
+        'ok': exit_code == 0,
+        'stdout': stdout,
+        'stderr': stderr,
+        'exit_code': exit_code,
+        'duration': time.perf_counter() - start_time,
+        'cpu_time': time.process_time() - start_cpu,
+        'stdout_truncated': stdout_truncated
+    })
+    return response
+
+
+def encode_response(response):
+    """Serialise a response as one line of the protocol."""
+    return json.dumps(response)
+
+
+def main():
+    protocol_in, protocol_out = sys.stdin, sys.stdout
+    for line in protocol_in:
+        if not line.strip():
+            continue
+        payload = encode_response(handle_request(json.loads(line)))
+        protocol_out.write(payload + '\n')
+        protocol_out.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+"""
+Isolation Module:
+Benchmark-isolation mode for the runner. The harness process is pinned to a few reserved
+cores, and every child runs pinned to a dedicated worker core (one logical CPU per
+physical core, so hyperthread siblings do not share caches between runs). A core is
+held for the lifetime of the child and returned to the pool when it exits.
+
+Every test record also carries the CPU id, load average and frequency governor of its
+run (host_conditions), so timings from different sessions can be compared.
+"""
+import os
+import queue
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any
+
+CPU_SYSFS_DIR = '/sys/devices/system/cpu'
+
+DEFAULT_ISOLATION = {
+    'enabled': False,
+    'reserved_cores': 1,
+    'physical_cores_only': True
+}
+
+_STATE = {'enabled': False, 'harness_cpus': [], 'worker_cpus': [], 'free': None}
+
+
+def get_isolation_settings(isolation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge configured isolation settings over the defaults; null entries keep the default."""
+    settings = dict(DEFAULT_ISOLATION)
+    settings.update({key: value for key, value in (isolation or {}).items() if value is not None})
+    return settings
+
+
+def _read_sysfs(cpu: int, name: str) -> Optional[str]:
+    try:
+        with open(os.path.join(CPU_SYSFS_DIR, f'cpu{cpu}', name), 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def physical_core_cpus(cpus: List[int]) -> List[int]:
+    """Keep the first logical CPU of each physical core; CPUs without topology are kept as is."""
+    seen = set()
+    selected = []
+    for cpu in sorted(cpus):
+        package = _read_sysfs(cpu, 'topology/physical_package_id')
+        core = _read_sysfs(cpu, 'topology/core_id')
+        key = (package, core) if core is not None else ('cpu', cpu)
+        if key not in seen:
+            seen.add(key)
+            selected.append(cpu)
+    return selected
+
+
+def configure_isolation(isolation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Split the CPUs this process may use into harness and worker cores and pin the harness.
+
+    Args:
+        isolation (Dict[str, Any], optional): 'enabled', 'reserved_cores' (cores kept for
+                                              the harness) and 'physical_cores_only'
+
+    Returns:
+        dict: 'enabled', 'harness_cpus' and 'worker_cpus'
+    """
+    settings = get_isolation_settings(isolation)
+    if not settings['enabled'] or not hasattr(os, 'sched_setaffinity'):
+        _STATE.update(enabled=False, harness_cpus=[], worker_cpus=[], free=None)
+        return {'enabled': False, 'harness_cpus': [], 'worker_cpus': []}
+
+    allowed = sorted(os.sched_getaffinity(0))
+    cores = physical_core_cpus(allowed) if settings['physical_cores_only'] else allowed
+    reserved = int(settings['reserved_cores'] or 0)
+    if reserved >= len(cores):
+        print(f"Warning: Cannot reserve {reserved} of {len(cores)} cores for the harness, none reserved")
+        reserved = 0
+    harness_cpus, worker_cpus = cores[:reserved], cores[reserved:]
+    if harness_cpus:
+        os.sched_setaffinity(0, harness_cpus)
+
+    free = queue.Queue()
+    for cpu in worker_cpus:
+        free.put(cpu)
+    _STATE.update(enabled=True, harness_cpus=harness_cpus, worker_cpus=worker_cpus, free=free)
+    return {'enabled': True, 'harness_cpus': harness_cpus, 'worker_cpus': worker_cpus}
+
+
+def assign_worker_cpus(worker_cpus: List[int]) -> Dict[str, Any]:
+    """Pin the runs of this process to worker_cpus, leaving its own affinity alone.
+
+    Used by a process that was handed some of the worker cores configure_isolation set
+    aside in its parent, such as a worker of the parallel test stage.
+    """
+    free = queue.Queue()
+    for cpu in worker_cpus:
+        free.put(cpu)
+    _STATE.update(enabled=True, harness_cpus=[], worker_cpus=list(worker_cpus), free=free)
+    return {'enabled': True, 'harness_cpus': [], 'worker_cpus': list(worker_cpus)}
+
+
+def isolated_concurrency(max_concurrency: int) -> int:
+    """Cap concurrency at the number of worker cores while isolation is enabled."""
+    if not _STATE['enabled']:
+        return max_concurrency
+    return max(1, min(max_concurrency, len(_STATE['worker_cpus'])))
+
+
+def acquire_cpu(block: bool = True) -> Optional[int]:
+    """Take a worker core from the pool, or None when isolation is off (or, without
+    blocking, when every core is busy)."""
+    if not _STATE['enabled']:
+        return None
+    try:
+        return _STATE['free'].get(block=block)
+    except queue.Empty:
+        return None
+
+
+def release_cpu(cpu: Optional[int]):
+    if cpu is not None and _STATE['enabled']:
+        _STATE['free'].put(cpu)
+
+
+@contextmanager
+def pinned_cpu(block: bool = True):
+    """Hold a worker core for the duration of the block."""
+    cpu = acquire_cpu(block)
+    try:
+        yield cpu
+    finally:
+        release_cpu(cpu)
+
+
+def _affinity(cpu: Optional[int]) -> Optional[List[int]]:
+    if not _STATE['enabled']:
+        return None
+    # Without a dedicated core a child still stays off the harness cores
+    return [cpu] if cpu is not None else _STATE['worker_cpus']
+
+
+@contextmanager
+def spawn_affinity(cpu: Optional[int]):
+    """Pin the calling thread to the child's cores while it spawns the child.
+
+    A new process inherits the affinity of the thread that forks it, so the child runs on
+    its worker core from its first instruction without a preexec_fn (which is unsafe while
+    the harness runs threads, and forces fork over vfork). Other threads of the harness
+    keep their affinity, and the thread's own is restored when the block ends.
+    """
+    affinity = _affinity(cpu)
+    if not affinity:
+        yield
+        return
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, affinity)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+def pin_process(pid: int, cpu: Optional[int]):
+    """Pin every thread of an already running process, e.g. a persistent worker."""
+    affinity = _affinity(cpu)
+    if not affinity:
+        return
+    try:
+        threads = [int(tid) for tid in os.listdir(f'/proc/{pid}/task')]
+    except OSError:
+        threads = [pid]
+    for tid in threads:
+        try:
+            os.sched_setaffinity(tid, affinity)
+        except OSError:
+            continue
+
+
+def host_conditions(cpu_id: Optional[int] = None) -> Dict[str, Any]:
+    """CPU id, load average and frequency governor of a run.
+
+    The governor is read for the pinned core, or for CPU 0 when the run was not pinned.
+    It is None where cpufreq is not exposed (e.g. most virtual machines).
+    """
+    try:
+        load_average = [round(load, 2) for load in os.getloadavg()]
+    except (AttributeError, OSError):
+        load_average = None
+    return {
+        'cpu_id': cpu_id,
+        'load_average': load_average,
+        'cpu_governor': _read_sysfs(cpu_id if cpu_id is not None else 0, 'cpufreq/scaling_governor')
+    }
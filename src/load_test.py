@@ -0,0 +1,373 @@
+"""
+Load Test Module:
+Serve mode. Each solution is wrapped in a small local HTTP server and replayed with its
+test-case inputs under concurrent load, to see how it behaves as a service rather than
+in a single cold run.
+
+Servers (one POST per call, bodies in the protocol of the warm and batch harnesses):
+    python      src/harness/python_server.py runs the script as a fresh __main__ module
+    javascript  src/harness/node_server.js runs the script in a fresh vm context
+    go          src/harness/go_server.go is linked into a copy of the solution whose main()
+                is renamed to solutionMain()
+
+Each server runs one call at a time, since solutions read stdin and write stdout; more
+`replicas` give more parallel capacity. For every concurrency level the load generator
+keeps `concurrency` keep-alive connections busy (closed loop) or, with a target `rate`,
+sends requests at fixed intervals and measures latency from the scheduled send time, so
+queueing behind a slow server is not hidden (open loop).
+"""
+import os
+import sys
+import json
+import asyncio
+import threading
+import subprocess
+from datetime import datetime
+from collections import Counter
+from typing import Optional, List, Dict, Any
+from src.process_utils import NEW_SESSION_KWARGS, kill_process_group
+from src.capture import CHUNK_SIZE, stderr_capture
+from src.benchmark import percentile
+from src.workers import HARNESS_DIR, V8_CODE_CACHE_DIR
+from src.runner import BASE_DIR, build_go_with_harness, make_harness_request
+from src.test_manager import load_case_bundle, get_task_components
+
+GO_SERVER_HARNESS = os.path.join(HARNESS_DIR, 'go_server.go')
+SERVER_START_TIMEOUT = 30
+
+DEFAULT_LOAD_TEST = {
+    'concurrency': [1, 4, 16],
+    'rate': None,
+    'duration_seconds': 10,
+    'warmup_seconds': 2,
+    'replicas': 1,
+    'request_timeout': 30
+}
+
+
+def get_load_test_settings(load_test: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge configured load test settings over the defaults; null entries keep the default."""
+    settings = dict(DEFAULT_LOAD_TEST)
+    settings.update({key: value for key, value in (load_test or {}).items() if value is not None})
+    if isinstance(settings['concurrency'], int):
+        settings['concurrency'] = [settings['concurrency']]
+    return settings
+
+
+def get_server_command(file_path: str, language: str) -> Dict[str, Any]:
+    """Return the server command line for a solution, building it first for Go.
+
+    Returns:
+        dict: 'command' (None on failure) and 'error'
+    """
+    if language == 'python':
+        return {'command': [sys.executable, os.path.join(HARNESS_DIR, 'python_server.py')], 'error': None}
+    elif language == 'javascript':
+        return {'command': ['node', os.path.join(HARNESS_DIR, 'node_server.js'), V8_CODE_CACHE_DIR], 'error': None}
+    elif language == 'go':
+        record = build_go_with_harness(file_path, GO_SERVER_HARNESS)
+        return {'command': [record['binary']] if record['success'] else None, 'error': record['error']}
+    return {'command': None, 'error': f"Unsupported language: {language}"}
+
+
+class SolutionServer:
+    """One server process listening on an ephemeral local port."""
+
+    def __init__(self, command: List[str]):
+        self.command = command
+        self.process = None
+        self.port = None
+        self._stderr = None
+
+    def start(self):
+        """Start the server and wait for its "listening {port}" line.
+
+        Raises:
+            RuntimeError: If the server exits or stays silent for SERVER_START_TIMEOUT seconds
+        """
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=BASE_DIR,
+            **NEW_SESSION_KWARGS
+        )
+        self._stderr = stderr_capture()
+        threading.Thread(target=self._read_stderr, args=(self.process, self._stderr), daemon=True).start()
+        ready = threading.Event()
+        threading.Thread(target=self._read_port, args=(ready,), daemon=True).start()
+        if not ready.wait(SERVER_START_TIMEOUT) or self.port is None:
+            self.stop()
+            raise RuntimeError(f"Server did not start: {self.stderr_text().strip() or 'no output'}")
+
+    def _read_port(self, ready: threading.Event):
+        stdout = self.process.stdout
+        for line in stdout:
+            fields = line.decode('utf-8', errors='replace').split()
+            if len(fields) == 2 and fields[0] == 'listening':
+                self.port = int(fields[1])
+                break
+        ready.set()
+        # Keep draining, so a solution printing outside the redirect cannot block the server
+        for _ in stdout:
+            pass
+
+    @staticmethod
+    def _read_stderr(process, capture):
+        read = process.stderr.read1
+        while True:
+            chunk = read(CHUNK_SIZE)
+            if not chunk:
+                break
+            capture.write(chunk)
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def stderr_text(self) -> str:
+        return self._stderr.text() if self._stderr is not None else ''
+
+    def stop(self):
+        if self.process is None:
+            return
+        if self.process.poll() is None:
+            kill_process_group(self.process.pid)
+        self.process.wait()
+        self.process = None
+
+
+class HttpConnection:
+    """Minimal HTTP/1.1 keep-alive client for the local servers (Content-Length bodies only)."""
+
+    def __init__(self, port: int):
+        self.port = port
+        self._reader = None
+        self._writer = None
+
+    async def post(self, body: bytes) -> tuple:
+        """Send one POST and return (status, response body)."""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection('127.0.0.1', self.port)
+        self._writer.write(
+            b'POST / HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Type: application/json\r\n'
+            b'Content-Length: %d\r\n\r\n' % len(body) + body
+        )
+        await self._writer.drain()
+        status_line = await self._reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Server closed the connection")
+        status = int(status_line.split()[1])
+        length = 0
+        keep_alive = True
+        while True:
+            line = await self._reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            name = name.strip().lower()
+            if name == 'content-length':
+                length = int(value)
+            elif name == 'connection' and value.strip().lower() == 'close':
+                keep_alive = False
+        payload = await self._reader.readexactly(length)
+        if not keep_alive:
+            self.close()
+        return status, payload
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader, self._writer = None, None
+
+
+def response_error(status: int, payload: bytes) -> Optional[str]:
+    """Error type of a server response, or None if the call succeeded."""
+    if status != 200:
+        return f'HTTP{status}'
+    response = json.loads(payload)
+    if response.get('ok'):
+        return None
+    return response.get('error_type') or f"ExitCode{response.get('exit_code', 1)}"
+
+
+async def run_load_level(servers: List[SolutionServer], bodies: List[bytes], concurrency: int, rate: Optional[float] = None, duration: float = 10, warmup: float = 2, timeout: float = 30) -> Dict[str, Any]:
+    """Drive the servers at one concurrency level and summarise the measured window.
+
+    Args:
+        servers (List[SolutionServer]): Running replicas; connections are spread over them
+        bodies (List[bytes]): Pre-encoded request bodies, replayed round robin
+        concurrency (int): Number of connections (requests in flight at most)
+        rate (float, optional): Target requests per second (open loop); None keeps every
+                                connection busy (closed loop)
+        duration (float): Length of the measured window in seconds
+        warmup (float): Seconds of load before the window, not recorded
+        timeout (float): Per-request timeout in seconds
+
+    Returns:
+        dict: Request counts, error rate, throughput and latency percentiles
+    """
+    loop = asyncio.get_running_loop()
+    connections = [HttpConnection(servers[i % len(servers)].port) for i in range(concurrency)]
+    latencies = []
+    errors = Counter()
+    counters = {'requests': 0, 'next': 0, 'last_finish': None}
+    stop = asyncio.Event()
+    start = loop.time()
+    window_start = start + warmup
+    window_end = window_start + duration
+
+    def next_body() -> bytes:
+        body = bodies[counters['next'] % len(bodies)]
+        counters['next'] += 1
+        return body
+
+    async def measure(connection: HttpConnection, body: bytes, sent_at: float):
+        error = None
+        try:
+            status, payload = await asyncio.wait_for(connection.post(body), timeout)
+            error = response_error(status, payload)
+        except asyncio.TimeoutError:
+            # A late response would be read as the answer to the next request
+            connection.close()
+            error = 'Timeout'
+        except (OSError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+            connection.close()
+            error = type(e).__name__
+            if not all(server.is_alive() for server in servers):
+                stop.set()
+        if window_start <= sent_at < window_end:
+            counters['requests'] += 1
+            counters['last_finish'] = loop.time()
+            if error is None:
+                latencies.append(loop.time() - sent_at)
+            else:
+                errors[error] += 1
+
+    async def closed_loop(connection: HttpConnection):
+        while loop.time() < window_end and not stop.is_set():
+            await measure(connection, next_body(), loop.time())
+
+    async def open_loop():
+        idle = asyncio.Queue()
+        for connection in connections:
+            idle.put_nowait(connection)
+
+        async def send(body: bytes, scheduled: float):
+            connection = await idle.get()
+            try:
+                await measure(connection, body, scheduled)
+            finally:
+                idle.put_nowait(connection)
+
+        pending = []
+        for index in range(int((warmup + duration) * rate)):
+            scheduled = start + index / rate
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if stop.is_set():
+                break
+            pending.append(asyncio.create_task(send(next_body(), scheduled)))
+        await asyncio.gather(*pending)
+
+    if rate:
+        await open_loop()
+    else:
+        await asyncio.gather(*(closed_loop(connection) for connection in connections))
+    for connection in connections:
+        connection.close()
+
+    # Requests sent in the window may finish after it; throughput counts until the last one
+    # did, so an overloaded server is not credited with the offered rate
+    window = max((counters['last_finish'] or window_start) - window_start, 1e-9)
+    ordered = sorted(latencies)
+    requests = counters['requests']
+    error_count = sum(errors.values())
+    return {
+        'duration': window,
+        'requests': requests,
+        'successes': len(ordered),
+        'errors': error_count,
+        'error_rate': error_count / requests if requests else None,
+        'error_types': dict(errors),
+        'throughput': len(ordered) / window,
+        'latency_mean': sum(ordered) / len(ordered) if ordered else None,
+        'latency_p50': percentile(ordered, 0.50) if ordered else None,
+        'latency_p95': percentile(ordered, 0.95) if ordered else None,
+        'latency_p99': percentile(ordered, 0.99) if ordered else None,
+        'latency_max': ordered[-1] if ordered else None,
+        'server_crashed': stop.is_set()
+    }
+
+
+def load_test_task(file_path: str, language: str, task_name: str, load_test: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Load-test one solution at every configured concurrency level.
+
+    Args:
+        file_path (str): Path to the code file
+        language (str): Programming language of the code
+        task_name (str): Name of the task
+        load_test (Dict[str, Any], optional): 'concurrency' (list of levels), 'rate',
+                                              'duration_seconds', 'warmup_seconds',
+                                              'replicas' and 'request_timeout'
+
+    Returns:
+        List[Dict[str, Any]]: One record per concurrency level for
+                              results/load_test/{task_name}.ndjson
+    """
+    settings = get_load_test_settings(load_test)
+    task_id = get_task_components(file_path, language)
+    bodies = [
+        json.dumps(make_harness_request(file_path, language, item['input_data'])).encode('utf-8')
+        for item in load_case_bundle(task_name)
+    ]
+
+    def record(concurrency: int, summary: Dict[str, Any], error: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            'task_id': task_id,
+            'language': language,
+            'concurrency': concurrency,
+            'target_rate': settings['rate'],
+            'replicas': settings['replicas'],
+            'test_case_count': len(bodies),
+            **summary,
+            'load_test_error': error,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+
+    server_command = get_server_command(file_path, language)
+    if server_command['command'] is None:
+        return [record(level, {}, server_command['error']) for level in settings['concurrency']]
+
+    servers = [SolutionServer(server_command['command']) for _ in range(max(1, int(settings['replicas'])))]
+    records = []
+    try:
+        for level in settings['concurrency']:
+            try:
+                # Replicas that crashed at the previous level are replaced
+                for server in servers:
+                    if not server.is_alive():
+                        server.stop()
+                        server.start()
+            except RuntimeError as e:
+                records.append(record(level, {}, str(e)))
+                continue
+            summary = asyncio.run(run_load_level(
+                servers,
+                bodies,
+                level,
+                rate=settings['rate'],
+                duration=settings['duration_seconds'],
+                warmup=settings['warmup_seconds'],
+                timeout=settings['request_timeout']
+            ))
+            error = None
+            if summary['server_crashed']:
+                stderr = ' '.join(server.stderr_text().strip() for server in servers if not server.is_alive())
+                error = f"Server exited during the load test: {stderr or 'no output'}"
+            records.append(record(level, summary, error))
+    finally:
+        for server in servers:
+            server.stop()
+    return records
@@ -0,0 +1,231 @@
+"""
+Parallel Module:
+Process-pool test stage. Every solution is split into jobs: its execution run and one job
+per (runtime, test case) pair, or one per runtime with the batch executor, whose cases
+share a process anyway. Jobs go to a pool of `workers` worker processes, and at most
+`language_limits[language]` jobs of a language run at once, so e.g. memory-hungry Go
+builds or the JIT warm-up of node can be kept to a few slots while Python fills the rest.
+
+Workers are started with spawn, not fork: each configures its own persistent workers,
+subinterpreter host, Go suite process and input transport from the runner section, and
+inherits no threads or pipes from the harness. With isolation enabled, each worker is
+handed one of the worker cores and pins its runs there.
+
+Results come back to the harness, which yields them solution by solution in matrix
+order, as soon as every job of a solution and of all solutions before it has finished.
+The records written from them are the same, in the same order, as in the sequential mode.
+
+Spawn overhead is calibrated on a pool set up the same way (pool_runs), so the baseline
+subtracted in the workers was measured under the same contention as their runs.
+"""
+import os
+import multiprocessing
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+from src.runner import run_code
+from src.benchmark import get_benchmark_settings
+from src.calibration import get_spawn_baselines, set_spawn_baselines, run_noop
+from src.runtimes import runtime_id_of
+from src.workers import configure_workers, shutdown_workers
+from src.subinterpreters import configure_subinterpreters, shutdown_subinterpreters
+from src.go_suite import configure_go_suite, shutdown_go_suite
+from src.isolation import assign_worker_cpus
+from src.transport import configure_transport, clear_shared_inputs
+from src.eval_cache import configure_eval_cache, cell_key, lookup_records, store_records
+from src.test_manager import (
+    load_case_bundle, get_task_components, build_execution_result, extract_key_error,
+    evaluate_case, evaluate_batch
+)
+
+DEFAULT_PARALLEL = {
+    'enabled': False,
+    'workers': None,
+    'language_limits': {}
+}
+
+
+def get_parallel_settings(parallel: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge the configured parallel section over the defaults; null entries keep the default.
+
+    'workers' defaults to the number of CPUs, and languages with a null limit are only
+    bounded by 'workers'.
+    """
+    settings = dict(DEFAULT_PARALLEL)
+    settings.update({key: value for key, value in (parallel or {}).items() if value is not None})
+    settings['workers'] = max(1, int(settings['workers'] or os.cpu_count() or 1))
+    settings['language_limits'] = {
+        language: max(1, int(limit)) for language, limit in settings['language_limits'].items() if limit is not None
+    }
+    return settings
+
+
+def _shutdown_worker():
+    shutdown_workers()
+    shutdown_subinterpreters()
+    shutdown_go_suite()
+    clear_shared_inputs()
+
+
+def _init_worker(runner_config: Dict[str, Any], suite_files: List[str], baselines: Dict[str, float], cpus):
+    configure_workers(
+        max_calls=runner_config.get('worker_max_calls'),
+        max_rss_mb=runner_config.get('worker_max_rss_mb')
+    )
+    configure_transport(runner_config.get('input_transport'))
+    if runner_config.get('executor') == 'subinterpreter':
+        configure_subinterpreters(runner_config.get('subinterpreters'))
+    if suite_files:
+        # The harness built the suite already, so this finds the binary in the cache
+        configure_go_suite(suite_files, runner_config.get('go_suite'))
+    configure_eval_cache(runner_config.get('eval_cache'), {'go_suite': runner_config.get('go_suite')} if suite_files else None)
+    set_spawn_baselines(baselines)
+    if cpus is not None:
+        assign_worker_cpus([cpus.get()])
+    # Pool workers leave through os._exit, which skips atexit handlers
+    Finalize(None, _shutdown_worker, exitpriority=10)
+
+
+def _make_pool(parallel: Dict[str, Any], runner_config: Dict[str, Any], suite_files: Optional[List[str]], cpus: Optional[List[int]]) -> ProcessPoolExecutor:
+    context = multiprocessing.get_context('spawn')
+    cpu_queue = None
+    if cpus is not None:
+        cpu_queue = context.Queue()
+        for cpu in cpus:
+            cpu_queue.put(cpu)
+    return ProcessPoolExecutor(
+        max_workers=parallel['workers'],
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(runner_config, list(suite_files or []), get_spawn_baselines(), cpu_queue)
+    )
+
+
+@contextmanager
+def pool_runs(parallel: Dict[str, Any], runner_config: Dict[str, Any], suite_files: Optional[List[str]] = None, cpus: Optional[List[int]] = None):
+    """Calibration engine of the parallel stage: yields a map_runs for
+    calibrate_spawn_overhead that runs the no-op program on a pool of 'workers' workers."""
+    with _make_pool(parallel, runner_config, suite_files, cpus) as pool:
+        def map_runs(noop_file: str, language: str, run_options: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+            return list(pool.map(run_noop, [noop_file] * count, [language] * count, [run_options] * count))
+
+        yield map_runs
+
+
+def _run_job(kind: str, task_name: str, language: str, file_path: str, run_options: Dict[str, Any], case_index: Optional[int], benchmark: Optional[Dict[str, Any]], profile: Optional[Dict[str, Any]], allocations: bool) -> List[Dict[str, Any]]:
+    bundle = load_case_bundle(task_name)
+    task_id = get_task_components(file_path, language)
+    if kind == 'execute':
+        key = cell_key('execution', file_path, language, bundle[0], run_options)
+        cached = lookup_records(key)
+        if cached:
+            return cached
+        try:
+            result = run_code(file_path, language, input_data=bundle[0]['input_data'], **run_options)
+            execution_result = build_execution_result(task_id, result)
+            store_records(key, [execution_result], result)
+            return [execution_result]
+        except Exception as e:
+            return [{
+                'task_id': task_id,
+                'executor': run_options.get('executor', 'process'),
+                'execution_status': 'failure',
+                'error_type': type(e).__name__,
+                'error_message': extract_key_error(str(e)),
+                'retry_count': 0,
+                'exit_code': -1,
+                'timestamp': datetime.utcnow().isoformat()
+            }]
+    settings = get_benchmark_settings(benchmark)
+    runtime_id = runtime_id_of(language, run_options.get('runtime'), run_options.get('executor'))
+    if kind == 'batch':
+        return evaluate_batch(file_path, language, task_id, bundle, run_options, settings, runtime_id, profile, allocations)
+    return [evaluate_case(file_path, language, task_id, bundle[case_index], run_options, settings, runtime_id, profile, allocations)]
+
+
+def plan_jobs(task_name: str, language: str, file_path: str, task_options: Dict[str, Any], variants: List[Dict[str, Any]]) -> List[Tuple[Any, ...]]:
+    """Arguments of _run_job for every job of one solution, in the order of its records."""
+    jobs = [('execute', task_name, language, file_path, task_options, None)]
+    case_count = len(load_case_bundle(task_name))
+    for options in variants:
+        if options.get('executor') == 'batch':
+            jobs.append(('batch', task_name, language, file_path, options, None))
+        else:
+            jobs.extend(('case', task_name, language, file_path, options, index) for index in range(case_count))
+    return jobs
+
+
+def run_parallel(plans: List[Tuple[str, str, str, Dict[str, Any], List[Dict[str, Any]]]], parallel: Dict[str, Any], runner_config: Dict[str, Any], suite_files: Optional[List[str]] = None, cpus: Optional[List[int]] = None, benchmark: Optional[Dict[str, Any]] = None, profile: Optional[Dict[str, Any]] = None, allocations: bool = False) -> Iterator[Tuple[int, Any]]:
+    """Run the test stage of every solution on a process pool.
+
+    Args:
+        plans (List[Tuple]): (task_name, language, file_path, task_options, variants) per
+                             solution, in matrix order; variants are the run options of
+                             each runtime the solution is tested under
+        parallel (Dict[str, Any]): Settings from get_parallel_settings
+        runner_config (Dict[str, Any]): The runner section, which each worker configures
+                                        itself from
+        suite_files (List[str], optional): Go solutions of the configured Go suite
+        cpus (List[int], optional): Worker cores when isolation is enabled; each worker
+                                    takes one, so there should be at least 'workers' of them
+        benchmark, profile, allocations: As for test_task
+
+    Yields:
+        Tuple: (index into plans, outcome) in plan order, where outcome is
+               (execution_record, test_records) or the exception a job raised
+    """
+    jobs = []
+    solution_jobs = []
+    for solution_index, plan in enumerate(plans):
+        start = len(jobs)
+        jobs.extend((solution_index, job) for job in plan_jobs(*plan))
+        solution_jobs.append(range(start, len(jobs)))
+
+    pending = {}
+    for index, (_, job) in enumerate(jobs):
+        pending.setdefault(job[2], deque()).append(index)
+    limits = parallel['language_limits']
+    running = {language: 0 for language in pending}
+    outputs = {}
+    errors = {}
+    remaining = [len(indexes) for indexes in solution_jobs]
+    next_solution = 0
+
+    in_flight = {}
+    with _make_pool(parallel, runner_config, suite_files, cpus) as pool:
+        while next_solution < len(plans):
+            # Submit jobs in matrix order, skipping languages that are at their limit
+            while len(in_flight) < parallel['workers']:
+                ready = [
+                    language for language, indexes in pending.items()
+                    if indexes and running[language] < limits.get(language, parallel['workers'])
+                ]
+                if not ready:
+                    break
+                language = min(ready, key=lambda language: pending[language][0])
+                index = pending[language].popleft()
+                running[language] += 1
+                in_flight[pool.submit(_run_job, *jobs[index][1], benchmark, profile, allocations)] = index
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                solution_index, job = jobs[index]
+                running[job[2]] -= 1
+                remaining[solution_index] -= 1
+                try:
+                    outputs[index] = future.result()
+                except Exception as e:
+                    errors.setdefault(solution_index, e)
+
+            while next_solution < len(plans) and remaining[next_solution] == 0:
+                records = [outputs.pop(index, None) for index in solution_jobs[next_solution]]
+                if next_solution in errors:
+                    outcome = errors.pop(next_solution)
+                else:
+                    outcome = (records[0][0], [record for job_records in records[1:] for record in job_records])
+                yield next_solution, outcome
+                next_solution += 1
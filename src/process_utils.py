@@ -0,0 +1,102 @@
+"""
+Process Utilities:
+Helpers for starting child processes in their own process group and tearing the
+whole group down, so grandchildren spawned by `node` or a Go binary cannot outlive a run.
+"""
+import os
+import time
+import signal
+import psutil
+import subprocess
+
+KILL_GRACE_SECONDS = 0.5
+
+# Popen keyword arguments that put the child in a new session (and process group)
+if os.name == 'posix':
+    NEW_SESSION_KWARGS = {'start_new_session': True}
+else:
+    NEW_SESSION_KWARGS = {'creationflags': getattr(subprocess, 'CREATE_NEW_PROCESS_GROUP', 0)}
+
+
+def _group_alive(pgid: int) -> bool:
+    try:
+        os.killpg(pgid, 0)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+def kill_process_group(pid: int, grace: float = KILL_GRACE_SECONDS) -> None:
+    """Terminate every process in the group led by pid: SIGTERM, then SIGKILL after grace.
+
+    The caller is still responsible for reaping its direct child; members that were
+    re-parented to init are reaped there once killed.
+
+    Args:
+        pid (int): PID of a child started with start_new_session=True
+        grace (float): Seconds to wait after SIGTERM before sending SIGKILL
+    """
+    if not hasattr(os, 'killpg'):
+        _kill_process_tree(pid)
+        return
+
+    try:
+        os.killpg(pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        return
+
+    deadline = time.monotonic() + grace
+    while time.monotonic() < deadline:
+        if not _group_alive(pid):
+            return
+        time.sleep(0.01)
+
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        return
+
+    # SIGKILL cannot be ignored; wait briefly until the group has disappeared
+    deadline = time.monotonic() + 1.0
+    while time.monotonic() < deadline and _has_live_members(pid):
+        time.sleep(0.01)
+
+
+def kill_stragglers(pid: int) -> None:
+    """SIGKILL any process left in the group after its leader has exited, and wait
+    briefly until the group has disappeared."""
+    if hasattr(os, 'killpg'):
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            return
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline and _has_live_members(pid):
+            time.sleep(0.01)
+    else:
+        _kill_process_tree(pid)
+
+
+def _has_live_members(pgid: int) -> bool:
+    """True while the group has members that are not zombies."""
+    for process in psutil.process_iter(['pid', 'status']):
+        try:
+            if os.getpgid(process.pid) == pgid and process.info['status'] != psutil.STATUS_ZOMBIE:
+                return True
+        except (ProcessLookupError, PermissionError, psutil.Error):
+            continue
+    return False
+
+
+def _kill_process_tree(pid: int) -> None:
+    try:
+        root = psutil.Process(pid)
+        processes = root.children(recursive=True) + [root]
+    except psutil.Error:
+        return
+    for process in processes:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+    psutil.wait_procs(processes, timeout=1.0)
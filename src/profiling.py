@@ -0,0 +1,156 @@
+"""
+Profiling Module:
+Opt-in CPU profiling of generated solutions during the test stage. Each test case is run
+once more under the language's native profiler, so the measured run is not slowed down:
+
+    python      python -m cProfile -o {profile}
+    javascript  node --cpu-prof (V8 .cpuprofile JSON)
+    go          src/harness/go_profile.go linked into the solution, writing a pprof profile
+
+Profiles are written to results/profiles/{task_id}/{case}.prof and the top-N hotspots
+(by self time) are recorded in the test result.
+"""
+import os
+import re
+import sys
+import json
+import pstats
+import subprocess
+from collections import defaultdict
+from typing import Optional, List, Dict, Any
+from src.workers import HARNESS_DIR
+from src.runner import BASE_DIR, build_go_with_harness, run_process
+
+PROFILES_DIR = os.path.join(BASE_DIR, 'results', 'profiles')
+GO_PROFILE_HARNESS = os.path.join(HARNESS_DIR, 'go_profile.go')
+DEFAULT_TOP_N = 10
+
+PPROF_LINE_PATTERN = re.compile(r'^\s*([\d.]+)(\w+)\s+([\d.]+)%\s+[\d.]+%\s+([\d.]+)(\w+)\s+([\d.]+)%\s+(.+)$')
+PPROF_UNITS = {'ns': 1e-9, 'us': 1e-6, 'µs': 1e-6, 'ms': 1e-3, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+
+
+def get_profile_path(task_id: str, case_id: Any) -> str:
+    """Location of the profile of one test case."""
+    return os.path.join(PROFILES_DIR, task_id, f'{case_id}.prof')
+
+
+def python_hotspots(profile_path: str, top_n: int) -> List[Dict[str, Any]]:
+    """Top functions of a cProfile profile by self time."""
+    stats = pstats.Stats(profile_path)
+    entries = []
+    for (file_name, line, function), (_, calls, self_time, cumulative_time, _) in stats.stats.items():
+        entries.append({
+            'function': function,
+            'file': file_name,
+            'line': line,
+            'calls': calls,
+            'self_time': self_time,
+            'cumulative_time': cumulative_time
+        })
+    entries.sort(key=lambda entry: entry['self_time'], reverse=True)
+    return entries[:top_n]
+
+
+def node_hotspots(profile_path: str, top_n: int) -> List[Dict[str, Any]]:
+    """Top functions of a V8 CPU profile by self time.
+
+    Each sample is charged the time delta recorded with it; samples of the same
+    function (name, url, line) are summed.
+    """
+    with open(profile_path, 'r', encoding='utf-8') as f:
+        profile = json.load(f)
+    frames = {node['id']: node['callFrame'] for node in profile.get('nodes', [])}
+    self_times = defaultdict(float)
+    sample_counts = defaultdict(int)
+    for node_id, delta in zip(profile.get('samples', []), profile.get('timeDeltas', [])):
+        frame = frames.get(node_id, {})
+        key = (frame.get('functionName') or '(anonymous)', frame.get('url', ''), frame.get('lineNumber', -1) + 1)
+        self_times[key] += max(delta, 0) / 1e6
+        sample_counts[key] += 1
+    entries = [
+        {'function': function, 'file': url, 'line': line, 'samples': sample_counts[(function, url, line)], 'self_time': self_time}
+        for (function, url, line), self_time in self_times.items()
+    ]
+    entries.sort(key=lambda entry: entry['self_time'], reverse=True)
+    return entries[:top_n]
+
+
+def go_hotspots(binary: str, profile_path: str, top_n: int) -> List[Dict[str, Any]]:
+    """Top functions of a pprof profile by self time, parsed from `go tool pprof -top`."""
+    process = subprocess.run(
+        ['go', 'tool', 'pprof', '-top', f'-nodecount={top_n}', binary, profile_path],
+        capture_output=True,
+        text=True
+    )
+    entries = []
+    for line in process.stdout.splitlines():
+        match = PPROF_LINE_PATTERN.match(line)
+        if not match:
+            continue
+        flat, flat_unit, _, cumulative, cumulative_unit, _, function = match.groups()
+        entries.append({
+            'function': function.strip(),
+            'self_time': float(flat) * PPROF_UNITS.get(flat_unit, 1.0),
+            'cumulative_time': float(cumulative) * PPROF_UNITS.get(cumulative_unit, 1.0)
+        })
+    return entries[:top_n]
+
+
+def profile_case(file_path: str, language: str, input_data: str, profile_path: str, top_n: int = DEFAULT_TOP_N, timeout: int = 30, limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Run one test case under the language's profiler and summarise the profile.
+
+    Args:
+        file_path (str): Path to the code file
+        language (str): Programming language of the code
+        input_data (str): JSON input document passed via stdin
+        profile_path (str): Where to write the profile
+        top_n (int): Number of hotspots to return
+        timeout (int): Maximum execution time in seconds
+        limits (dict, optional): Kernel resource limits, as for run_code
+
+    Returns:
+        dict: 'profile_path' (None if no profile was written), 'hotspots' and 'profile_error'
+    """
+    os.makedirs(os.path.dirname(profile_path), exist_ok=True)
+    if os.path.exists(profile_path):
+        os.remove(profile_path)
+    env = None
+    binary = None
+    if language == 'python':
+        command = [sys.executable, '-m', 'cProfile', '-o', profile_path, os.path.abspath(file_path)]
+    elif language == 'javascript':
+        command = [
+            'node', '--cpu-prof',
+            f'--cpu-prof-dir={os.path.dirname(profile_path)}',
+            f'--cpu-prof-name={os.path.basename(profile_path)}',
+            os.path.abspath(file_path)
+        ]
+    elif language == 'go':
+        record = build_go_with_harness(file_path, GO_PROFILE_HARNESS)
+        if not record['success']:
+            return {'profile_path': None, 'hotspots': [], 'profile_error': record['error']}
+        binary = record['binary']
+        command = [binary]
+        env = {'GO_CPU_PROFILE': profile_path}
+    else:
+        return {'profile_path': None, 'hotspots': [], 'profile_error': f"Unsupported language: {language}"}
+
+    execution = run_process(command, input_data=input_data, timeout=timeout, limits=limits, env=env)
+    error = None
+    if execution['timed_out']:
+        error = f'Profiled run timed out after {timeout} seconds'
+    elif execution['exit_code'] != 0:
+        error = f"Profiled run exited with code {execution['exit_code']}"
+    if not os.path.exists(profile_path) or os.path.getsize(profile_path) == 0:
+        return {'profile_path': None, 'hotspots': [], 'profile_error': error or 'No profile was written'}
+
+    try:
+        if language == 'python':
+            hotspots = python_hotspots(profile_path, top_n)
+        elif language == 'javascript':
+            hotspots = node_hotspots(profile_path, top_n)
+        else:
+            hotspots = go_hotspots(binary, profile_path, top_n)
+    except Exception as e:
+        return {'profile_path': profile_path, 'hotspots': [], 'profile_error': f"{type(e).__name__}: {e}"}
+    return {'profile_path': profile_path, 'hotspots': hotspots, 'profile_error': error}
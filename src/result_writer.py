@@ -0,0 +1,193 @@
+"""
+Result Writer Module:
+Single writer for the NDJSON result files under results/. Callers put serialised records
+on one queue, and a background thread writes them through one open handle per file, so a
+test run no longer opens, flushes and closes results/test_results/{task}.ndjson once per
+case, and records from concurrent runs never interleave mid-line.
+
+Handles are flushed once `flush_records` records are pending or the oldest pending record
+is `flush_seconds` old, and with `fsync` also synced to disk. The queue is a
+multiprocessing queue: worker processes forked after the writer was started put their
+records on the same queue, and the thread in the parent writes them. Everything still
+queued is written by close_result_writer, and at exit.
+"""
+import os
+import json
+import time
+import queue
+import atexit
+import threading
+import multiprocessing
+from typing import Optional, List, Dict, Any
+
+DEFAULT_RESULT_WRITER = {
+    'flush_records': 100,
+    'flush_seconds': 1.0,
+    'fsync': False
+}
+
+_WRITER = {'writer': None, 'settings': dict(DEFAULT_RESULT_WRITER)}
+_WRITER_LOCK = threading.Lock()
+
+
+def get_result_writer_settings(result_writer: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge the configured result_writer section over the defaults; null entries keep the default."""
+    settings = dict(DEFAULT_RESULT_WRITER)
+    settings.update({key: value for key, value in (result_writer or {}).items() if value is not None})
+    return settings
+
+
+def encode_records(records: List[Dict[str, Any]]) -> str:
+    """NDJSON lines of records, encoded like jsonlines does (UTF-8, not ASCII-escaped)."""
+    return ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records)
+
+
+class ResultWriter:
+    """One writer thread fed through a queue, holding one append handle per output file."""
+
+    def __init__(self, flush_records: int = 100, flush_seconds: float = 1.0, fsync: bool = False):
+        self.flush_records = max(1, int(flush_records))
+        self.flush_seconds = flush_seconds
+        self.fsync = fsync
+        self.owner_pid = os.getpid()
+        self._queue = multiprocessing.Queue()
+        self._handles = {}
+        self._pending = 0
+        self._oldest_pending = None
+        self._flush_events = {}
+        self._next_token = 0
+        self._token_lock = threading.Lock()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        # Registered after the queue exists, so it runs before multiprocessing's own exit
+        # handler tears the queue down
+        atexit.register(self.close)
+
+    def write(self, path: str, records: List[Dict[str, Any]], truncate: bool = False):
+        """Queue records for the end of path; with truncate, the file is emptied first."""
+        self._queue.put(('write', os.path.abspath(path), encode_records(records), len(records), truncate))
+
+    def truncate(self, path: str):
+        """Queue emptying path (creating it if needed), like opening it with mode 'w'."""
+        self.write(path, [], truncate=True)
+
+    def flush(self):
+        """Write and flush everything queued so far.
+
+        In the process that started the writer this waits until the records are in the
+        files; a forked worker process can only request the flush.
+
+        Raises:
+            OSError: If the writer thread failed to write a file since the last flush
+        """
+        if os.getpid() != self.owner_pid:
+            self._queue.put(('flush', None))
+            return
+        done = threading.Event()
+        with self._token_lock:
+            self._next_token += 1
+            token = self._next_token
+            self._flush_events[token] = done
+        self._queue.put(('flush', token))
+        while not done.wait(timeout=0.1):
+            if not self._thread.is_alive():
+                break
+        self._raise_error()
+
+    def close(self):
+        """Write everything queued, then close every handle and stop the thread."""
+        if os.getpid() != self.owner_pid:
+            return
+        if self._thread.is_alive():
+            self._queue.put(('close', None))
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        error, self._error = self._error, None
+        if error is not None:
+            raise OSError(f"Result writer failed: {error}")
+
+    def _handle(self, path: str, truncate: bool):
+        handle = self._handles.get(path)
+        if handle is not None and not truncate:
+            return handle
+        if handle is not None:
+            handle.close()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle = open(path, 'w' if truncate else 'a', encoding='utf-8', buffering=1024 * 1024)
+        self._handles[path] = handle
+        return handle
+
+    def _flush_all(self):
+        for handle in self._handles.values():
+            handle.flush()
+            if self.fsync:
+                os.fsync(handle.fileno())
+        self._pending = 0
+        self._oldest_pending = None
+
+    def _run(self):
+        while True:
+            timeout = None
+            if self._oldest_pending is not None:
+                timeout = max(0.0, self._oldest_pending + self.flush_seconds - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ('flush', None)
+            try:
+                if item[0] == 'write':
+                    _, path, lines, count, truncate = item
+                    self._handle(path, truncate).write(lines)
+                    self._pending += count
+                    if self._oldest_pending is None:
+                        self._oldest_pending = time.monotonic()
+                    if self._pending >= self.flush_records:
+                        self._flush_all()
+                else:
+                    self._flush_all()
+            except OSError as e:
+                self._error = e
+            if item[0] == 'flush' and item[1] is not None:
+                with self._token_lock:
+                    done = self._flush_events.pop(item[1], None)
+                if done is not None:
+                    done.set()
+            elif item[0] == 'close':
+                for handle in self._handles.values():
+                    try:
+                        handle.close()
+                    except OSError as e:
+                        self._error = e
+                self._handles = {}
+                return
+
+
+def configure_result_writer(result_writer: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Set the flush policy of the shared writer and return it; a running writer is
+    closed first, so everything it had queued is written under the old policy."""
+    settings = get_result_writer_settings(result_writer)
+    close_result_writer()
+    with _WRITER_LOCK:
+        _WRITER['settings'] = settings
+    return settings
+
+
+def get_result_writer() -> ResultWriter:
+    """Return the shared writer, starting it on first use."""
+    with _WRITER_LOCK:
+        if _WRITER['writer'] is None:
+            _WRITER['writer'] = ResultWriter(**_WRITER['settings'])
+        return _WRITER['writer']
+
+
+def close_result_writer():
+    """Write everything queued on the shared writer and close its files."""
+    with _WRITER_LOCK:
+        writer = _WRITER['writer']
+        if writer is None or writer.owner_pid != os.getpid():
+            return
+        _WRITER['writer'] = None
+    writer.close()
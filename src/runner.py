@@ -2,53 +2,605 @@
 Runner module: Responsible for executing generated code.
 Handles runtime execution and captures outputs/errors.
 """
+import os
+import re
+import sys
 import time
 import json
+import asyncio
+import hashlib
+import threading
+import signal
 import psutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Tuple
+from src.workers import get_worker_pool
+from src.subinterpreters import get_host
+from src.go_suite import get_go_suite
+from src.process_utils import NEW_SESSION_KWARGS, kill_process_group, kill_stragglers
+from src.capture import get_capture_limits, stdout_capture, stderr_capture, drain, bound_text
+from src.isolation import pinned_cpu, spawn_affinity
+from src.transport import shared_input
 
-def get_resource_usage(process):
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GO_BUILD_CACHE_DIR = os.path.join(BASE_DIR, '.cache', 'go_build')
+GO_CACHE_DIR = os.path.join(GO_BUILD_CACHE_DIR, 'gocache')
+GO_WRAPPED_SOURCE_DIR = os.path.join(BASE_DIR, '.cache', 'go_wrapped')
+GO_MAIN_PATTERN = re.compile(r'^func\s+main\s*\(\s*\)', re.MULTILINE)
+
+# In-memory record of Go builds keyed by source hash: binary path, error and compile time
+_GO_BUILDS = {}
+_GO_BUILD_LOCKS = {}
+_GO_BUILD_LOCKS_GUARD = threading.Lock()
+_GO_VERSION = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MEMORY_LIMIT_PATTERNS = [
+    "memoryerror",
+    "javascript heap out of memory",
+    "fatal process oom",
+    "out of memory",
+    "cannot allocate memory",
+    "failed to reserve"
+]
+PROCESS_LIMIT_PATTERNS = [
+    "resource temporarily unavailable",
+    "blockingioerror",
+    "eagain",
+    "pthread_create failed"
+]
+
+def elapsed(start_ns: int) -> float:
+    """Seconds since a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+PHASES = ('compile', 'spawn', 'stdin_write', 'first_output', 'execution', 'drain', 'decode', 'parse')
+
+
+def phase_timings(**phases: Optional[float]) -> Dict[str, Optional[float]]:
+    """Seconds spent in each phase of a run; phases that did not happen are 0.0.
+    
+    first_output (time from spawn to the first byte of stdout) is None when the run
+    printed nothing. parse is filled in by the test stage once it has parsed stdout.
+    """
+    timings = {phase: 0.0 for phase in PHASES}
+    timings.update(phases)
+    return timings
+
+
+def timeline_phases(timeline: Dict[str, Optional[int]]) -> Dict[str, Optional[float]]:
+    """Turn monotonic perf_counter_ns timestamps of a fresh-process run into phase durations."""
+    def between(start, end):
+        if timeline.get(start) is None or timeline.get(end) is None:
+            return None
+        return max(0, timeline[end] - timeline[start]) / 1e9
+    
+    return {
+        'spawn': between('spawn_start', 'spawned'),
+        'stdin_write': between('spawned', 'stdin_closed') or 0.0,
+        'first_output': between('spawned', 'first_stdout'),
+        'execution': between('spawned', 'exited'),
+        'drain': between('exited', 'drained'),
+        'decode': between('drained', 'decoded')
+    }
+
+
+def empty_resources() -> Dict[str, float]:
+    """Resource record used when a run could not be measured."""
+    return {
+        'cpu_time': 0,
+        'user_cpu_time': 0,
+        'sys_cpu_time': 0,
+        'memory_usage': 0,
+        'peak_memory_usage': 0,
+        'memory_source': None,
+        'voluntary_ctx_switches': 0,
+        'involuntary_ctx_switches': 0
+    }
+
+
+def get_resource_usage(rusage, sampler: Optional['PeakRssSampler'] = None) -> Dict[str, float]:
+    """Convert the rusage of a reaped process tree into a resource record.
+    
+    Args:
+        rusage: resource.struct_rusage returned by os.wait4 for the child. It covers the
+                child and every descendant the child waited for.
+        sampler (PeakRssSampler, optional): Sampler that watched the run, the source of
+                                            its memory figures
+        
+    Returns:
+        dict: User/system CPU seconds, peak RSS in MB, context switch counts and
+              'memory_source' ('vmhwm', or 'ru_maxrss_floor' for the fallback below)
+    """
+    # On Linux the kernel carries the pre-exec high-water mark over exec into ru_maxrss,
+    # so it starts at the runner's own peak RSS, not the solution's. Memory is taken from
+    # the sampler's VmHWM readings, which start afresh at exec; ru_maxrss (kilobytes on
+    # Linux, bytes on macOS) is only used for runs that ended before the first reading,
+    # and is then no more than a floor set by the runner.
+    if sampler is not None and sampler.samples:
+        memory_mb = sampler.process_peak / (1024 * 1024)
+        peak_mb = sampler.peak_rss / (1024 * 1024)
+        memory_source = 'vmhwm'
+    else:
+        memory_mb = rusage.ru_maxrss / (1024 * 1024) if sys.platform == 'darwin' else rusage.ru_maxrss / 1024
+        peak_mb = memory_mb
+        memory_source = 'ru_maxrss_floor'
+    return {
+        'cpu_time': rusage.ru_utime + rusage.ru_stime,
+        'user_cpu_time': rusage.ru_utime,
+        'sys_cpu_time': rusage.ru_stime,
+        'memory_usage': memory_mb,
+        'peak_memory_usage': peak_mb,
+        'memory_source': memory_source,
+        'voluntary_ctx_switches': rusage.ru_nvcsw,
+        'involuntary_ctx_switches': rusage.ru_nivcsw
+    }
+
+
+class PeakRssSampler(threading.Thread):
+    """Background sampler for the peak RSS and CPU time of a process and its children.
+    
+    The high-water mark of the root process (VmHWM, which starts afresh at exec) is read
+    every interval, so memory_usage reflects the solution rather than the runner that
+    forked it. With tree=True the whole process tree is walked every TREE_SAMPLE_EVERY
+    intervals for its summed RSS and CPU time; that is also the only source of
+    measurements on platforms without os.wait4.
+    """
+    TREE_SAMPLE_EVERY = 5
+
+    def __init__(self, pid: int, interval: float = 0.001, tree: bool = False):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.tree = tree
+        self.samples = 0
+        self.process_peak = 0
+        self.peak_rss = 0
+        self.user_cpu_time = 0.0
+        self.sys_cpu_time = 0.0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        try:
+            root = psutil.Process(self.pid)
+        except psutil.Error:
+            return
+        tick = 0
+        while not self._stop_event.is_set():
+            try:
+                if self.tree and tick % self.TREE_SAMPLE_EVERY == 0:
+                    self._sample_tree(root)
+                else:
+                    rss = self._high_water_mark(root)
+                    if rss:
+                        self.samples += 1
+                        self.process_peak = max(self.process_peak, rss)
+                        self.peak_rss = max(self.peak_rss, rss)
+            except psutil.Error:
+                break
+            tick += 1
+            self._stop_event.wait(self.interval)
+
+    def _sample_tree(self, root):
+        processes = [root] + root.children(recursive=True)
+        rss, user, system = 0, 0.0, 0.0
+        for process in processes:
+            with process.oneshot():
+                process_rss = self._high_water_mark(process)
+                self.process_peak = max(self.process_peak, process_rss)
+                rss += process_rss
+                cpu_times = process.cpu_times()
+                user += cpu_times.user
+                system += cpu_times.system
+        if rss:
+            self.samples += 1
+        self.peak_rss = max(self.peak_rss, rss)
+        self.user_cpu_time = max(self.user_cpu_time, user)
+        self.sys_cpu_time = max(self.sys_cpu_time, system)
+
+    @staticmethod
+    def _high_water_mark(process) -> int:
+        """Peak RSS of a single process since exec (VmHWM on Linux, current RSS elsewhere)."""
+        try:
+            with open(f'/proc/{process.pid}/status', 'r') as f:
+                for line in f:
+                    if line.startswith('VmHWM:'):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError, IndexError):
+            pass
+        return process.memory_info().rss
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def resources(self) -> Dict[str, float]:
+        return dict(
+            empty_resources(),
+            cpu_time=self.user_cpu_time + self.sys_cpu_time,
+            user_cpu_time=self.user_cpu_time,
+            sys_cpu_time=self.sys_cpu_time,
+            memory_usage=self.process_peak / (1024 * 1024),
+            peak_memory_usage=self.peak_rss / (1024 * 1024),
+            memory_source='vmhwm' if self.samples else None
+        )
+
+
+def apply_limits(pid: int, limits: Optional[Dict[str, Any]]):
+    """Apply kernel resource limits to a just-spawned child with prlimit.
+    
+    The limits are set from the harness after Popen returns instead of in a preexec_fn,
+    which is unsafe while reader and sampler threads run and rules out vfork. The child
+    may run for a few microseconds before they apply; RLIMIT_CPU counts the CPU time used
+    in that window, the other limits only bound what it does afterwards.
+    
+    Args:
+        pid (int): Process id of the child
+        limits (dict, optional): 'memory_mb' (RLIMIT_AS), 'cpu_seconds' (RLIMIT_CPU) and
+                                 'max_processes' (RLIMIT_NPROC, counted per user). Missing
+                                 or null entries are left unlimited. Ignored on platforms
+                                 without resource.prlimit.
+    """
+    if resource is None or not limits or not hasattr(resource, 'prlimit'):
+        return
+    memory_mb = limits.get('memory_mb')
+    cpu_seconds = limits.get('cpu_seconds')
+    max_processes = limits.get('max_processes')
+    if memory_mb:
+        memory_bytes = int(memory_mb * 1024 * 1024)
+        resource.prlimit(pid, resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+    if cpu_seconds:
+        # SIGXCPU at the soft limit, SIGKILL one second later
+        resource.prlimit(pid, resource.RLIMIT_CPU, (int(cpu_seconds), int(cpu_seconds) + 1))
+    if max_processes:
+        resource.prlimit(pid, resource.RLIMIT_NPROC, (int(max_processes), int(max_processes)))
+
+
+def spawn_child(command: List[str], limits: Optional[Dict[str, Any]] = None, cpu: Optional[int] = None, **popen_kwargs) -> subprocess.Popen:
+    """Start a child in its own session, pinned to cpu in isolation mode, with its
+    resource limits applied (see apply_limits). Keyword arguments go to Popen."""
+    with spawn_affinity(cpu):
+        process = subprocess.Popen(command, **popen_kwargs, **NEW_SESSION_KWARGS)
     try:
-        with process.oneshot():
-            cpu_time = sum(process.cpu_times()[:2])  # user + system time
-            memory_info = process.memory_info()
-            return {
-                'cpu_time': cpu_time,
-                'memory_usage': memory_info.rss / (1024 * 1024),  # Convert to MB
-                'peak_memory_usage': memory_info.peak_wset / (1024 * 1024) if hasattr(memory_info, 'peak_wset') else 0
-            }
-    except:
+        apply_limits(process.pid, limits)
+    except OSError:
+        kill_process_group(process.pid)
+        process.wait()
+        raise
+    return process
+
+
+def classify_limit_breach(stderr: str, exit_code: Optional[int], limits: Optional[Dict[str, Any]], cpu_time: float = 0.0) -> Optional[str]:
+    """Detect whether a failed run was stopped by one of its resource limits.
+    
+    Args:
+        stderr (str): Error message from stderr
+        exit_code (int, optional): Exit code, negative for a terminating signal
+        limits (dict, optional): Limits the run was started with
+        cpu_time (float): CPU seconds used by the run, if known
+        
+    Returns:
+        str: 'CpuLimitExceeded', 'MemoryLimitExceeded' or 'ProcessLimitExceeded', or None
+    """
+    if not limits:
+        return None
+    stderr_lower = (stderr or '').lower()
+    
+    cpu_seconds = limits.get('cpu_seconds')
+    if cpu_seconds:
+        if exit_code == -getattr(signal, 'SIGXCPU', 24):
+            return "CpuLimitExceeded"
+        if exit_code == -getattr(signal, 'SIGKILL', 9) and cpu_time >= cpu_seconds:
+            return "CpuLimitExceeded"
+    if limits.get('memory_mb') and any(pattern in stderr_lower for pattern in MEMORY_LIMIT_PATTERNS):
+        return "MemoryLimitExceeded"
+    if limits.get('max_processes') and any(pattern in stderr_lower for pattern in PROCESS_LIMIT_PATTERNS):
+        return "ProcessLimitExceeded"
+    return None
+
+
+def run_process(command: List[str], input_data: Optional[str] = None, timeout: int = 30, sample_peak_rss: bool = False, limits: Optional[Dict[str, Any]] = None, capture_limits: Optional[Dict[str, Any]] = None, env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Run a command to completion and account for the resources of its process tree.
+    
+    Output is drained in chunks by reader threads into bounded captures (see src/capture.py)
+    and the child is reaped with os.wait4, so its CPU time and context switches (including
+    waited-for descendants) are collected at exit instead of sampled. Peak memory comes
+    from PeakRssSampler, see get_resource_usage.
+    The child leads its own process group; on timeout the whole group gets SIGTERM and
+    then SIGKILL, and any process left in the group after the child exits is killed.
+    
+    Args:
+        command (List[str]): Command line to execute
+        input_data (str, optional): Data written to the child's stdin
+        timeout (int): Maximum execution time in seconds
+        sample_peak_rss (bool): Also sample the summed RSS of the whole process tree
+        limits (dict, optional): Kernel resource limits, see apply_limits
+        capture_limits (dict, optional): Byte caps for the captured output, see
+                                         src.capture.get_capture_limits
+        env (dict, optional): Variables added to the child's environment
+        
+    Returns:
+        dict: 'stdout', 'stderr', 'stdout_truncated', 'stderr_truncated', 'exit_code',
+              'timed_out', 'resources', 'timeline' (perf_counter_ns timestamps of
+              spawn_start, spawned, stdin_closed, first_stdout, exited, drained, decoded)
+              and 'cpu_id' (the worker core in isolation mode, otherwise None)
+    """
+    with pinned_cpu() as cpu, shared_input(input_data) as payload:
+        # A large input is read straight from the shared file instead of a pipe
+        stdin_file = payload.open() if payload is not None else None
+        timeline = {'spawn_start': time.perf_counter_ns()}
+        process = spawn_child(
+            command,
+            limits,
+            cpu,
+            stdin=stdin_file or (subprocess.PIPE if input_data else None),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=dict(os.environ, **env) if env else None
+        )
+        timeline['spawned'] = time.perf_counter_ns()
+        if stdin_file is not None:
+            stdin_file.close()
+        # Popen returns once the child has exec'd, so the sampler never sees the runner's pages
+        sampler = PeakRssSampler(process.pid, tree=sample_peak_rss or not hasattr(os, 'wait4'))
+        sampler.start()
+        
+        stdout = stdout_capture(capture_limits)
+        stderr = stderr_capture(capture_limits)
+        readers = [
+            threading.Thread(target=drain, args=(process.stdout, stdout), daemon=True),
+            threading.Thread(target=drain, args=(process.stderr, stderr), daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+        if input_data and stdin_file is None:
+            try:
+                process.stdin.write(input_data.encode('utf-8'))
+            except (BrokenPipeError, OSError):
+                pass
+            finally:
+                try:
+                    process.stdin.close()
+                except (BrokenPipeError, OSError):
+                    pass
+            timeline['stdin_closed'] = time.perf_counter_ns()
+        
+        timed_out = False
+        rusage = None
+        if hasattr(os, 'wait4'):
+            reaped = []
+            
+            def reap():
+                reaped.append(os.wait4(process.pid, 0))
+                timeline['exited'] = time.perf_counter_ns()
+            
+            waiter = threading.Thread(target=reap, daemon=True)
+            waiter.start()
+            waiter.join(timeout)
+            if waiter.is_alive():
+                timed_out = True
+                kill_process_group(process.pid)
+                waiter.join()
+            _, status, rusage = reaped[0]
+            process.returncode = os.waitstatus_to_exitcode(status)
+        else:
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                timed_out = True
+                kill_process_group(process.pid)
+                process.wait()
+            timeline['exited'] = time.perf_counter_ns()
+        
+        # Grandchildren still holding the output pipes would keep the readers blocked
+        kill_stragglers(process.pid)
+        
+        for reader in readers:
+            reader.join()
+        timeline['drained'] = time.perf_counter_ns()
+        timeline['first_stdout'] = stdout.first_write_ns
+        sampler.stop()
+        
+        if rusage is not None:
+            resources = get_resource_usage(rusage, sampler)
+        else:
+            resources = sampler.resources()
+        
+        stdout_text, stderr_text = stdout.text(), stderr.text()
+        timeline['decoded'] = time.perf_counter_ns()
+        
         return {
-            'cpu_time': 0,
-            'memory_usage': 0,
-            'peak_memory_usage': 0
+            'stdout': stdout_text,
+            'stderr': stderr_text,
+            'stdout_truncated': stdout.truncated,
+            'stderr_truncated': stderr.truncated,
+            'exit_code': process.returncode,
+            'timed_out': timed_out,
+            'resources': resources,
+            'timeline': timeline,
+            'cpu_id': cpu
         }
 
 
-def compile_code(file_path: str, language: str) -> Tuple[bool, str, Optional[str]]:
-    """Compile code if needed."""
+def get_go_version() -> str:
+    """Return the `go version` string, used as part of the build cache key."""
+    global _GO_VERSION
+    if _GO_VERSION is None:
+        try:
+            _GO_VERSION = subprocess.run(['go', 'version'], capture_output=True, text=True).stdout.strip()
+        except OSError:
+            _GO_VERSION = 'unknown'
+    return _GO_VERSION
+
+
+def go_source_hash(file_path: str, build_flags: Optional[List[str]] = None, extra_sources: Optional[List[str]] = None) -> str:
+    """Content hash of Go source files, toolchain version and build flags.
+
+    A -pgo profile is hashed by its contents, since a new profile is merged to the same path.
+    """
+    digest = hashlib.sha256()
+    profiles = [flag[len('-pgo='):] for flag in build_flags or [] if flag.startswith('-pgo=')]
+    for source_file in [file_path, *(extra_sources or []), *filter(os.path.isfile, profiles)]:
+        with open(source_file, 'rb') as f:
+            digest.update(f.read())
+    digest.update(get_go_version().encode('utf-8'))
+    digest.update(json.dumps(build_flags or []).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def build_go(file_path: str, build_flags: Optional[List[str]] = None, extra_sources: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Build a Go solution once per unique source hash.
+    
+    Binaries are stored in .cache/go_build/{hash}/ and all builds share one GOCACHE,
+    so identical sources across models and prompt levels are only compiled once.
+    
+    Args:
+        file_path (str): Path to the Solution.go file
+        build_flags (List[str], optional): Extra flags passed to `go build`
+        extra_sources (List[str], optional): Further files of package main linked into
+                                             the binary (e.g. the batch wrapper)
+        
+    Returns:
+        dict: Build record with 'success', 'binary', 'error', 'compile_duration', 'cached'
+              (no build was needed for this call) and 'build_cached' (the binary came from
+              the on-disk cache of an earlier session, so compile_duration is 0.0)
+    """
+    source_hash = go_source_hash(file_path, build_flags, extra_sources)
+    with _GO_BUILD_LOCKS_GUARD:
+        lock = _GO_BUILD_LOCKS.setdefault(source_hash, threading.Lock())
+    
+    with lock:
+        if source_hash in _GO_BUILDS:
+            return dict(_GO_BUILDS[source_hash], cached=True)
+        
+        build_dir = os.path.join(GO_BUILD_CACHE_DIR, source_hash)
+        binary = os.path.join(build_dir, 'Solution.exe' if sys.platform == 'win32' else 'Solution')
+        if os.path.exists(binary):
+            record = {'success': True, 'binary': binary, 'error': None, 'compile_duration': 0.0, 'build_cached': True}
+            _GO_BUILDS[source_hash] = record
+            return dict(record, cached=True)
+        
+        os.makedirs(build_dir, exist_ok=True)
+        os.makedirs(GO_CACHE_DIR, exist_ok=True)
+        temp_binary = f"{binary}.{os.getpid()}.tmp"
+        env = dict(os.environ, GOCACHE=GO_CACHE_DIR)
+        start_time = time.perf_counter()
+        process = subprocess.run(
+            ['go', 'build', *(build_flags or []), '-o', temp_binary, os.path.abspath(file_path), *map(os.path.abspath, extra_sources or [])],
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=os.path.dirname(os.path.abspath(file_path))
+        )
+        compile_duration = time.perf_counter() - start_time
+        
+        if process.returncode == 0:
+            os.replace(temp_binary, binary)
+            record = {'success': True, 'binary': binary, 'error': None, 'compile_duration': compile_duration, 'build_cached': False}
+        else:
+            record = {'success': False, 'binary': None, 'error': process.stderr, 'compile_duration': compile_duration, 'build_cached': False}
+        _GO_BUILDS[source_hash] = record
+        return dict(record, cached=False)
+
+
+def build_go_with_harness(file_path: str, harness_file: str) -> Dict[str, Any]:
+    """Build a Go solution linked with a harness from src/harness/ that calls its main().
+    
+    The solution is copied to .cache/go_wrapped/{hash}/ with main() renamed to
+    solutionMain() and built together with the harness through build_go, so the binary
+    is cached by source hash like any other Go build.
+    
+    Args:
+        file_path (str): Path to the Solution.go file
+        harness_file (str): Go file of package main that defines main() and calls solutionMain()
+        
+    Returns:
+        dict: Build record in the format of build_go
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    with open(harness_file, 'r', encoding='utf-8') as f:
+        harness = f.read()
+    if not GO_MAIN_PATTERN.search(source):
+        return {'success': False, 'binary': None, 'error': 'function main is undeclared in the main package', 'compile_duration': 0.0, 'cached': False, 'build_cached': False}
+    
+    digest = hashlib.sha256(source.encode('utf-8'))
+    digest.update(harness.encode('utf-8'))
+    source_dir = os.path.join(GO_WRAPPED_SOURCE_DIR, digest.hexdigest())
+    solution_file = os.path.join(source_dir, 'Solution.go')
+    wrapped_harness = os.path.join(source_dir, os.path.basename(harness_file))
+    if not os.path.exists(wrapped_harness):
+        os.makedirs(source_dir, exist_ok=True)
+        with open(solution_file, 'w', encoding='utf-8') as f:
+            f.write(GO_MAIN_PATTERN.sub('func solutionMain()', source, count=1))
+        with open(wrapped_harness, 'w', encoding='utf-8') as f:
+            f.write(harness)
+    return build_go(solution_file, extra_sources=[wrapped_harness])
+
+
+def precompile_go(file_paths: List[str], max_workers: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """Build many Go solutions in parallel ahead of testing.
+    
+    Args:
+        file_paths (List[str]): Paths to Solution.go files
+        max_workers (int, optional): Number of concurrent builds (default: CPU count)
+        
+    Returns:
+        dict: Build record for each file path
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        records = list(pool.map(build_go, file_paths))
+    return dict(zip(file_paths, records))
+
+
+def compile_code(file_path: str, language: str, build_flags: Optional[List[str]] = None) -> Tuple[bool, str, Optional[str]]:
+    """Compile code if needed (Go with optional extra build flags)."""
     if language == 'python':
         return True, file_path, None
     elif language == 'javascript':
         return True, file_path, None
     elif language == 'go':
-        return True, file_path, None
+        record = build_go(file_path, build_flags)
+        return record['success'], record['binary'] or "", record['error']
     
     else:
         return False, "", f"Unsupported language: {language}"
 
 
-def parse_error_type(stderr: str, language: str) -> str:
+def get_command(executable_path: str, language: str, interpreter: Optional[str] = None) -> List[str]:
+    """Build the command line that runs a compiled or interpreted solution."""
+    if language == 'javascript':
+        return [interpreter or 'node', executable_path]
+    elif language == 'go':
+        return [executable_path]
+    else:
+        return [interpreter or sys.executable, executable_path]
+
+
+def parse_error_type(stderr: str, language: str, exit_code: Optional[int] = None, limits: Optional[Dict[str, Any]] = None, cpu_time: float = 0.0) -> str:
     """Parse error type from stderr based on language.
     
     Args:
         stderr (str): Error message from stderr
         language (str): Programming language
+        exit_code (int, optional): Exit code of the run, used to detect limit breaches
+        limits (dict, optional): Resource limits the run was started with
+        cpu_time (float): CPU seconds used by the run
         
     Returns:
         str: Error type string
     """
+    limit_breach = classify_limit_breach(stderr, exit_code, limits, cpu_time)
+    if limit_breach:
+        return limit_breach
+    
     if not stderr:
         return "RuntimeError"
         
@@ -80,7 +632,219 @@ def parse_error_type(stderr: str, language: str) -> str:
     return "RuntimeError"
 
 
-def run_code(file_path: str, language: str, args: Optional[List[str]] = None, input_data: Optional[str] = None, timeout: int = 30) -> Dict[str, Any]:
+def make_harness_request(file_path: str, language: str, input_data: Optional[str] = None, input_path: Optional[str] = None, capture_limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build the request a persistent or batch harness expects for one input.
+    
+    Every harness runs the solution as a script with the raw input on stdin. With
+    input_path (a shared file holding input_data, see src/transport.py) the harness
+    reads the input from that file instead of the request line. 'stdout_limit' is the
+    stdout cap of capture_limits; harnesses keep no more than that of a case's output.
+    """
+    request = {
+        'file_path': os.path.abspath(file_path),
+        'stdout_limit': int(get_capture_limits(capture_limits)['stdout_bytes'])
+    }
+    if input_path is not None:
+        request['input_path'] = input_path
+    else:
+        request['input'] = input_data or ''
+    return request
+
+
+def harness_result(response: Dict[str, Any], language: str, resources: Dict[str, float], limits: Optional[Dict[str, Any]] = None, capture_limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Convert a harness response into the result format of run_code.
+    
+    Harnesses collect a case's output themselves and stop keeping stdout at the
+    request's 'stdout_limit'; stderr is cut to the same caps as the output of a fresh
+    process here.
+    """
+    stdout = response.get('stdout', '')
+    stderr = response.get('stderr', '')
+    exit_code = response.get('exit_code', 1)
+    stdout_buffer = stdout_capture(capture_limits)
+    stderr_buffer = stderr_capture(capture_limits)
+    stdout = bound_text(stdout, stdout_buffer)
+    stderr = bound_text(stderr, stderr_buffer)
+    
+    return {
+        'success': exit_code == 0,
+        'error_type': parse_error_type(stderr, language, exit_code, limits, resources['cpu_time']) if exit_code != 0 else None,
+        'error_message': stderr if stderr else None,
+        'duration': response.get('duration', 0.0),
+        'stdout': stdout,
+        'stderr': stderr,
+        'stdout_truncated': stdout_buffer.truncated or bool(response.get('stdout_truncated')),
+        'stderr_truncated': stderr_buffer.truncated,
+        'exit_code': exit_code,
+        'resources': resources
+    }
+
+
+def run_code_warm(file_path: str, language: str, input_data: Optional[str] = None, timeout: int = 30, capture_limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Execute generated code in a persistent worker instead of a fresh process.
+    
+    Python workers compile the solution once and run it as a fresh __main__ module per input.
+    JavaScript workers compile the solution once and run it in a fresh vm context per input.
+    Either way the solution reads stdin and writes stdout as in a fresh process, and
+    interpreter startup is not part of the measured duration.
+    
+    Args:
+        file_path (str): Path to the code file to execute
+        language (str): Programming language of the code ('python' or 'javascript')
+        input_data (str, optional): JSON input document
+        timeout (int): Maximum execution time in seconds
+        capture_limits (dict, optional): Byte caps for the returned output
+        
+    Returns:
+        dict: Execution results in the same format as run_code
+    """
+    start_time = time.perf_counter_ns()
+    
+    try:
+        with pinned_cpu() as cpu, shared_input(input_data) as payload:
+            request = make_harness_request(file_path, language, input_data, payload.path if payload is not None else None, capture_limits)
+            response = get_worker_pool(language).call(request, timeout, cpu)
+    except subprocess.TimeoutExpired:
+        return {
+            'success': False,
+            'error_type': 'TimeoutError',
+            'error_message': f'Execution timed out after {timeout} seconds',
+            'duration': timeout,
+            'stdout': '',
+            'stderr': f'Execution timed out after {timeout} seconds',
+            'exit_code': -1,
+            'resources': empty_resources()
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error_type': type(e).__name__,
+            'error_message': str(e),
+            'duration': elapsed(start_time),
+            'stdout': '',
+            'stderr': str(e),
+            'exit_code': -1,
+            'resources': empty_resources()
+        }
+    
+    resources = dict(
+        empty_resources(),
+        cpu_time=response.get('cpu_time', 0),
+        memory_usage=response.get('rss_mb', 0)
+    )
+    round_trip = elapsed(start_time)
+    result = harness_result(dict(response, duration=response.get('duration', round_trip)), language, resources, capture_limits=capture_limits)
+    # Time outside the solution call is the pipe round trip (plus worker start-up on a fresh worker)
+    result['phase_timings'] = phase_timings(first_output=None, execution=result['duration'], drain=max(0.0, round_trip - result['duration']))
+    result['cpu_id'] = cpu
+    return result
+
+
+def run_code_subinterpreter(file_path: str, input_data: Optional[str] = None, timeout: int = 30, limits: Optional[Dict[str, Any]] = None, capture_limits: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Execute a Python solution as a script in an isolated subinterpreter (see src/subinterpreters.py).
+    
+    Args:
+        file_path (str): Path to the Solution.py file
+        input_data (str, optional): Input data passed as stdin
+        timeout (int): Maximum execution time in seconds
+        limits (dict, optional): Only used to classify errors; kernel limits cannot be
+                                 applied to a subinterpreter
+        capture_limits (dict, optional): Byte caps for the returned output
+        
+    Returns:
+        dict: Execution results in the same format as run_code, or None if the solution
+              has to run in a fresh process instead (no 3.12+ interpreter for the host,
+              or the solution uses something subinterpreters do not support)
+    """
+    start_time = time.perf_counter_ns()
+    host = get_host()
+    if host is None:
+        return None
+    
+    try:
+        with shared_input(input_data) as payload:
+            request = make_harness_request(file_path, 'python', input_data, payload.path if payload is not None else None, capture_limits)
+            response = host.call(request, timeout)
+    except subprocess.TimeoutExpired:
+        return {
+            'success': False,
+            'error_type': 'TimeoutError',
+            'error_message': f'Execution timed out after {timeout} seconds',
+            'duration': timeout,
+            'stdout': '',
+            'stderr': f'Execution timed out after {timeout} seconds',
+            'exit_code': -1,
+            'resources': empty_resources()
+        }
+    except RuntimeError:
+        return None
+    if response.get('fallback'):
+        return None
+    
+    resources = dict(empty_resources(), cpu_time=response.get('cpu_time', 0))
+    round_trip = elapsed(start_time)
+    result = harness_result(response, 'python', resources, limits, capture_limits)
+    result['phase_timings'] = phase_timings(first_output=None, execution=result['duration'], drain=max(0.0, round_trip - result['duration']))
+    result['cpu_id'] = None
+    return result
+
+
+def run_code_go_suite(file_path: str, input_data: Optional[str] = None, timeout: int = 30, limits: Optional[Dict[str, Any]] = None, capture_limits: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Execute a Go solution in the multi-solution suite binary (see src/go_suite.py).
+    
+    Args:
+        file_path (str): Path to the Solution.go file
+        input_data (str, optional): Input data passed as stdin
+        timeout (int): Maximum execution time in seconds
+        limits (dict, optional): Only used to classify errors; kernel limits cannot be
+                                 applied to a run inside the shared suite process
+        capture_limits (dict, optional): Byte caps for the returned output
+        
+    Returns:
+        dict: Execution results in the same format as run_code, plus 'go_benchmark'
+              (iterations, ns_per_op, allocs_per_op, bytes_per_op) when a benchtime is
+              configured, or None if the solution is not part of the suite or the suite
+              process failed, so it has to run in a fresh process instead
+    """
+    suite = get_go_suite(file_path)
+    if suite is None:
+        return None
+    start_time = time.perf_counter_ns()
+    
+    try:
+        with shared_input(input_data) as payload:
+            request = make_harness_request(file_path, 'go', input_data, payload.path if payload is not None else None, capture_limits)
+            request['solution'] = suite['solution']
+            if suite['benchtime']:
+                request['benchtime'] = str(suite['benchtime'])
+            response = suite['process'].call(request, timeout, capture_limits)
+    except subprocess.TimeoutExpired:
+        return {
+            'success': False,
+            'error_type': 'TimeoutError',
+            'error_message': f'Execution timed out after {timeout} seconds',
+            'duration': timeout,
+            'stdout': '',
+            'stderr': f'Execution timed out after {timeout} seconds',
+            'exit_code': -1,
+            'resources': empty_resources()
+        }
+    except (RuntimeError, OSError):
+        # The suite could not be (re)started or talked to; a fresh process still can run it
+        return None
+    
+    resources = dict(empty_resources(), **response['resources'])
+    round_trip = elapsed(start_time)
+    result = harness_result(response, 'go', resources, limits, capture_limits)
+    result['compile_duration'] = 0.0
+    result['phase_timings'] = phase_timings(first_output=None, execution=result['duration'], drain=max(0.0, round_trip - result['duration']))
+    result['cpu_id'] = None
+    if response.get('benchmark'):
+        result['go_benchmark'] = response['benchmark']
+    return result
+
+
+def run_code(file_path: str, language: str, args: Optional[List[str]] = None, input_data: Optional[str] = None, timeout: int = 30, executor: str = 'process', sample_peak_rss: bool = False, limits: Optional[Dict[str, Any]] = None, capture_limits: Optional[Dict[str, Any]] = None, runtime: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Execute generated code and capture results.
     
     Args:
@@ -89,74 +853,114 @@ def run_code(file_path: str, language: str, args: Optional[List[str]] = None, in
         args (List[str], optional): Command line arguments to pass to the program
         input_data (str, optional): Input data to pass via stdin
         timeout (int): Maximum execution time in seconds
+        executor (str): 'process' for a fresh process per run, 'warm' for a persistent worker
+                        (Python and JavaScript; other languages always use a fresh process).
+                        'batch' runs every case of a solution in one process through
+                        src.batch.run_code_batch; a single run here uses a fresh process.
+                        'subinterpreter' runs Python solutions in parallel subinterpreters
+                        of one host process, falling back to a fresh process.
+                        'suite' runs Go solutions in the multi-solution binary built by
+                        src.go_suite.configure_go_suite, falling back to a fresh process
+        sample_peak_rss (bool): Sample the summed RSS of the process tree in the background
+        limits (dict, optional): Kernel resource limits applied to the child before exec
+                                 ('memory_mb', 'cpu_seconds', 'max_processes'); ignored by
+                                 the warm executor
+        capture_limits (dict, optional): Byte caps for captured output ('stdout_bytes',
+                                         'stderr_head_bytes', 'stderr_tail_bytes'). Cut
+                                         output is flagged by 'stdout_truncated' and
+                                         'stderr_truncated' in the result
+        runtime (dict, optional): Runtime of the runtime matrix (see src/runtimes.py): the
+                                  interpreter 'executable' for Python and JavaScript, or
+                                  'build_flags' for Go. A runtime always uses a fresh process
         
     Returns:
-        dict: Basic execution results including stdout for testing purposes
+        dict: Basic execution results including stdout for testing purposes, and
+              'executor', the executor the run actually used
     """
-    start_time = time.time()
-    args = args or []
+    if executor == 'warm' and language in ('python', 'javascript') and runtime is None:
+        return dict(run_code_warm(file_path, language, input_data=input_data, timeout=timeout, capture_limits=capture_limits), executor='warm')
+    if executor == 'subinterpreter' and language == 'python' and runtime is None:
+        result = run_code_subinterpreter(file_path, input_data=input_data, timeout=timeout, limits=limits, capture_limits=capture_limits)
+        if result is not None:
+            return dict(result, executor='subinterpreter')
+    if executor == 'suite' and language == 'go' and runtime is None:
+        result = run_code_go_suite(file_path, input_data=input_data, timeout=timeout, limits=limits, capture_limits=capture_limits)
+        if result is not None:
+            return dict(result, executor='suite')
+    return dict(run_code_process(file_path, language, input_data, timeout, sample_peak_rss, limits, capture_limits, runtime), executor='process')
+
+
+def run_code_process(file_path: str, language: str, input_data: Optional[str] = None, timeout: int = 30, sample_peak_rss: bool = False, limits: Optional[Dict[str, Any]] = None, capture_limits: Optional[Dict[str, Any]] = None, runtime: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Execute generated code in a fresh process (executor 'process'); arguments as for run_code."""
+    start_time = time.perf_counter_ns()
     
     try:
-        success, executable_path, error_msg = compile_code(file_path, language)
+        runtime = runtime or {}
+        success, executable_path, error_msg = compile_code(file_path, language, runtime.get('build_flags'))
+        # Time this run spent compiling, or looking up a build that was already done
+        compile_phase = elapsed(start_time)
+        compile_duration, build_cached = compile_phase, None
+        if language == 'go':
+            # The build itself is reported once per solution, on its execution record
+            build = build_go(file_path, runtime.get('build_flags'))
+            compile_duration, build_cached = build['compile_duration'], build['build_cached']
+        start_time = time.perf_counter_ns()
         if not success:
             return {
                 'success': False,
-                'error_type': 'CompilationError',
+                'error_type': parse_error_type(error_msg, language) if language == 'go' else 'CompilationError',
                 'error_message': error_msg,
-                'duration': time.time() - start_time,
+                'duration': 0.0,
+                'compile_duration': compile_duration,
+                'build_cached': build_cached,
                 'stdout': '',
-                'stderr': error_msg
+                'stderr': error_msg,
+                'exit_code': 1,
+                'resources': empty_resources(),
+                'phase_timings': phase_timings(compile=compile_phase)
             }
         
-        if language == 'javascript':
-            process = subprocess.Popen(
-                ['node', executable_path],
-                stdin=subprocess.PIPE if input_data else None,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-        elif language == 'go':
-            process = subprocess.Popen(
-                ['go', 'run', executable_path],
-                stdin=subprocess.PIPE if input_data else None,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-        else: 
-            process = subprocess.Popen(
-                ['python', executable_path],
-                stdin=subprocess.PIPE if input_data else None,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+        command = get_command(executable_path, language, runtime.get('executable'))
+        execution = run_process(command, input_data=input_data, timeout=timeout, sample_peak_rss=sample_peak_rss, limits=limits, capture_limits=capture_limits)
+        phases = phase_timings(compile=compile_phase, **timeline_phases(execution['timeline']))
         
-        try:
-            resources = get_resource_usage(psutil.Process(process.pid))
-        except:
-            resources = {
-                'cpu_time': 0,
-                'memory_usage': 0,
-                'peak_memory_usage': 0
+        if execution['timed_out']:
+            # The run was reaped after the kill, so its resources and phases are still known
+            return {
+                'success': False,
+                'error_type': 'TimeoutError',
+                'error_message': f'Execution timed out after {timeout} seconds',
+                'duration': elapsed(start_time),
+                'compile_duration': compile_duration,
+                'build_cached': build_cached,
+                'stdout': '',
+                'stderr': f'Execution timed out after {timeout} seconds',
+                'exit_code': -1,
+                'resources': execution['resources'],
+                'phase_timings': phases,
+                'cpu_id': execution['cpu_id']
             }
         
-        stdout, stderr = process.communicate(input=input_data, timeout=timeout)
-            
+        stdout, stderr = execution['stdout'], execution['stderr']
         error_type = None
-        if process.returncode != 0:
-            error_type = parse_error_type(stderr, language)
+        if execution['exit_code'] != 0:
+            error_type = parse_error_type(stderr, language, execution['exit_code'], limits, execution['resources']['cpu_time'])
             
         return {
-            'success': process.returncode == 0,
+            'success': execution['exit_code'] == 0,
             'error_type': error_type,
             'error_message': stderr if stderr else None,
-            'duration': time.time() - start_time,
+            'duration': elapsed(start_time),
+            'compile_duration': compile_duration,
+            'build_cached': build_cached,
             'stdout': stdout,
             'stderr': stderr,
-            'exit_code': process.returncode,
-            'resources': resources
+            'stdout_truncated': execution['stdout_truncated'],
+            'stderr_truncated': execution['stderr_truncated'],
+            'exit_code': execution['exit_code'],
+            'resources': execution['resources'],
+            'phase_timings': phases,
+            'cpu_id': execution['cpu_id']
         }
         
     except subprocess.TimeoutExpired:
@@ -168,7 +972,7 @@ def run_code(file_path: str, language: str, args: Optional[List[str]] = None, in
             'stdout': '',
             'stderr': f'Execution timed out after {timeout} seconds',
             'exit_code': -1,
-            'resources': {'cpu_time': 0, 'memory_usage': 0, 'peak_memory_usage': 0}
+            'resources': empty_resources()
         }
     
     except Exception as e:
@@ -176,14 +980,32 @@ def run_code(file_path: str, language: str, args: Optional[List[str]] = None, in
             'success': False,
             'error_type': type(e).__name__,
             'error_message': str(e),
-            'duration': time.time() - start_time,
+            'duration': elapsed(start_time),
             'stdout': '',
             'stderr': str(e),
             'exit_code': -1,
-            'resources': {'cpu_time': 0, 'memory_usage': 0, 'peak_memory_usage': 0}
+            'resources': empty_resources()
         }
 
 
+async def run_code_async(file_path: str, language: str, args: Optional[List[str]] = None, input_data: Optional[str] = None, timeout: int = 30, executor: str = 'process', sample_peak_rss: bool = False, limits: Optional[Dict[str, Any]] = None, capture_limits: Optional[Dict[str, Any]] = None, runtime: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Asynchronous counterpart of run_code for the concurrent test stage.
+    
+    The run happens in run_code itself, on a thread of the event loop's default executor:
+    its child is spawned, reaped with wait4 and measured exactly as in the sequential mode,
+    so records from max_concurrency > 1 compare with sequential ones. The caller bounds
+    the number of runs in flight (e.g. with a semaphore) and sizes the default executor
+    to match.
+    
+    Args:
+        As for run_code
+        
+    Returns:
+        dict: Execution results in the same format as run_code
+    """
+    return await asyncio.to_thread(run_code, file_path, language, args, input_data, timeout, executor, sample_peak_rss, limits, capture_limits, runtime)
+
+
 if __name__ == '__main__':
     # test usage with input data
     test_input = {
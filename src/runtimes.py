@@ -0,0 +1,174 @@
+"""
+Runtimes Module:
+Runtime matrix for the test stage. Each solution can be tested under every locally
+installed interpreter of its language and under several Go build configurations, so
+the share of a timing that comes from the runtime can be separated from the code.
+
+A runtime is a dict passed to run_code:
+
+    {'runtime_id': 'cpython-3.12.1', 'language': 'python', 'executable': '/usr/bin/python3.12'}
+    {'runtime_id': 'node-20.19.5', 'language': 'javascript', 'executable': '/usr/bin/node'}
+    {'runtime_id': 'go1.21.6-noinline', 'language': 'go', 'build_flags': ['-gcflags=all=-l']}
+
+The Go variant named 'pgo' is built with -pgo from the CPU profiles that profile mode
+wrote to results/profiles/{task_id}/ in a previous run.
+"""
+import os
+import glob
+import hashlib
+import sys
+import shutil
+import subprocess
+from typing import Optional, List, Dict, Any
+from src.runner import BASE_DIR
+from src.profiling import PROFILES_DIR
+from src.subinterpreters import host_interpreter
+
+PGO_PROFILE_DIR = os.path.join(BASE_DIR, '.cache', 'pgo')
+PGO_VARIANT = 'pgo'
+# The interpreters the warm, batch, profiling and allocation harnesses launch as well
+DEFAULT_INTERPRETERS = {'python': sys.executable, 'javascript': 'node'}
+
+DEFAULT_RUNTIME_MATRIX = {
+    'enabled': False,
+    'python': ['python3.10', 'python3.11', 'python3.12', 'python3.13', 'pypy3'],
+    'javascript': ['node', '~/.nvm/versions/node/*/bin/node'],
+    'go': {'default': [], PGO_VARIANT: []}
+}
+
+_VERSIONS = {}
+
+
+def get_runtime_matrix_settings(runtime_matrix: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge configured runtime matrix settings over the defaults; null entries keep the default."""
+    settings = dict(DEFAULT_RUNTIME_MATRIX)
+    settings.update({key: value for key, value in (runtime_matrix or {}).items() if value is not None})
+    return settings
+
+
+def _probe(command: List[str]) -> Optional[str]:
+    try:
+        process = subprocess.run(command, capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    output = process.stdout.strip()
+    return output if process.returncode == 0 and output else None
+
+
+def interpreter_version(language: str, executable: str) -> Optional[str]:
+    """Runtime id of an interpreter, e.g. 'cpython-3.12.1', 'pypy-3.10.14' or 'node-20.19.5'."""
+    key = (language, executable)
+    if key not in _VERSIONS:
+        if language == 'python':
+            _VERSIONS[key] = _probe([executable, '-c', 'import platform; print(platform.python_implementation().lower() + "-" + platform.python_version())'])
+        elif language == 'javascript':
+            version = _probe([executable, '--version'])
+            _VERSIONS[key] = f"node-{version.lstrip('v')}" if version else None
+        else:
+            _VERSIONS[key] = _probe(['go', 'env', 'GOVERSION'])
+    return _VERSIONS[key]
+
+
+def interpreter_of(language: str, runtime: Optional[Dict[str, Any]] = None, executor: Optional[str] = None) -> Optional[str]:
+    """Interpreter that runs a solution: the runtime's executable, the host of the
+    subinterpreter executor, or the default one (None for Go)."""
+    if runtime:
+        return runtime.get('executable')
+    if executor == 'subinterpreter' and language == 'python':
+        # Without a 3.12+ host every run falls back to a fresh process
+        return host_interpreter() or DEFAULT_INTERPRETERS['python']
+    return DEFAULT_INTERPRETERS.get(language)
+
+
+def default_runtime_id(language: str, executor: Optional[str] = None) -> Optional[str]:
+    """Runtime id of what run_code uses without a runtime (this Python, 'node', plain go
+    build, or the subinterpreter host)."""
+    return interpreter_version(language, interpreter_of(language, executor=executor) or 'go')
+
+
+def _candidates(pattern: str) -> List[str]:
+    pattern = os.path.expanduser(pattern)
+    if os.sep in pattern:
+        return sorted(glob.glob(pattern))
+    executable = shutil.which(pattern)
+    return [executable] if executable else []
+
+
+def discover_runtimes(languages: List[str], runtime_matrix: Optional[Dict[str, Any]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """List the runtimes of each language that are installed on this machine.
+
+    Args:
+        languages (List[str]): Languages to discover runtimes for
+        runtime_matrix (Dict[str, Any], optional): Interpreter names or glob patterns per
+                                                   language, and Go build flag variants
+                                                   by name
+
+    Returns:
+        dict: Runtimes per language, one per distinct runtime id
+    """
+    settings = get_runtime_matrix_settings(runtime_matrix)
+    runtimes = {}
+    for language in languages:
+        found = {}
+        if language == 'go':
+            version = interpreter_version('go', 'go')
+            if version:
+                for name, flags in settings.get('go', {}).items():
+                    runtime_id = version if name == 'default' else f"{version}-{name}"
+                    found[runtime_id] = {'runtime_id': runtime_id, 'language': 'go', 'build_flags': list(flags or []), 'pgo': name == PGO_VARIANT}
+        else:
+            for pattern in settings.get(language, []):
+                for executable in _candidates(pattern):
+                    runtime_id = interpreter_version(language, executable)
+                    # Shims and symlinks of the same interpreter collapse into one runtime
+                    if runtime_id and runtime_id not in found:
+                        found[runtime_id] = {'runtime_id': runtime_id, 'language': language, 'executable': executable}
+        runtimes[language] = list(found.values())
+    return runtimes
+
+
+def merge_pgo_profile(task_id: str) -> Optional[str]:
+    """Merge the CPU profiles of one Go solution into a single profile for -pgo.
+
+    Returns:
+        str: Path of the merged profile, or None if profile mode left no profiles
+    """
+    profiles = sorted(
+        path for path in glob.glob(os.path.join(PROFILES_DIR, task_id, '*.prof'))
+        if os.path.getsize(path) > 0
+    )
+    if not profiles:
+        return None
+    os.makedirs(PGO_PROFILE_DIR, exist_ok=True)
+    merged = os.path.join(PGO_PROFILE_DIR, f'{task_id}.pprof')
+    if os.path.exists(merged) and os.path.getmtime(merged) >= max(os.path.getmtime(path) for path in profiles):
+        return merged
+    process = subprocess.run(['go', 'tool', 'pprof', '-proto', *profiles], capture_output=True)
+    if process.returncode != 0 or not process.stdout:
+        return None
+    with open(merged, 'wb') as f:
+        f.write(process.stdout)
+    return merged
+
+
+def resolve_runtime(runtime: Dict[str, Any], task_id: str) -> Optional[Dict[str, Any]]:
+    """The runtime to use for one solution, or None if it cannot be built for it
+    (a PGO variant without profiles).
+
+    A PGO runtime carries 'pgo_digest', the hash of the merged profile, since the -pgo
+    flag only names its path and the profile is rewritten there when new profiles arrive.
+    """
+    if not runtime.get('pgo'):
+        return runtime
+    profile = merge_pgo_profile(task_id)
+    if profile is None:
+        return None
+    with open(profile, 'rb') as f:
+        pgo_digest = hashlib.sha256(f.read()).hexdigest()
+    return dict(runtime, build_flags=[*runtime.get('build_flags', []), f'-pgo={profile}'], pgo_digest=pgo_digest)
+
+
+def runtime_id_of(language: str, runtime: Optional[Dict[str, Any]] = None, executor: Optional[str] = None) -> Optional[str]:
+    """Runtime id recorded for a run with the given runtime, or with none under executor
+    (the one the run actually used, as it may fall back to 'process')."""
+    return runtime['runtime_id'] if runtime else default_runtime_id(language, executor)
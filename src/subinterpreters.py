@@ -0,0 +1,187 @@
+"""
+Subinterpreters Module:
+Execution backend that runs Python solutions in isolated subinterpreters with a
+per-interpreter GIL (PEP 684), hosted by src/harness/python_subinterpreters.py. Up to
+`threads` solutions run in parallel inside one host process, each in its own interpreter
+with its own module state, and the run is reported in the result format of run_code.
+
+The host needs Python 3.12+. When the harness itself runs on an older Python, the host
+is started with the configured `python`, or the first python3.13 / python3.12 on PATH.
+
+A running subinterpreter cannot be interrupted from outside, so a timed-out run retires
+its host: new runs go to a fresh host, and the old one is killed as soon as its other
+in-flight runs have answered.
+"""
+import os
+import sys
+import json
+import queue
+import shutil
+import threading
+import subprocess
+from typing import Optional, Dict, Any
+from src.process_utils import NEW_SESSION_KWARGS, kill_process_group
+from src.workers import BASE_DIR, HARNESS_DIR
+
+SUBINTERPRETER_HARNESS = os.path.join(HARNESS_DIR, 'python_subinterpreters.py')
+HOST_CANDIDATES = ['python3.13', 'python3.12']
+
+DEFAULT_SUBINTERPRETERS = {
+    'python': None,
+    'threads': None
+}
+
+_SETTINGS = {'python': None, 'threads': None, 'configured': False}
+_HOSTS = {'current': None}
+_HOSTS_LOCK = threading.Lock()
+
+
+def find_host_interpreter(python: Optional[str] = None) -> Optional[str]:
+    """Interpreter for the host process: the configured one, this one if it is 3.12+, or
+    the first python3.13 / python3.12 on PATH."""
+    if python:
+        return shutil.which(os.path.expanduser(python))
+    if sys.version_info >= (3, 12):
+        return sys.executable
+    for candidate in HOST_CANDIDATES:
+        executable = shutil.which(candidate)
+        if executable:
+            return executable
+    return None
+
+
+def configure_subinterpreters(subinterpreters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Set the host interpreter and thread count used from now on and return them.
+
+    Returns:
+        dict: 'python' (None if no 3.12+ interpreter was found; every run then falls back
+              to a fresh process) and 'threads'
+    """
+    settings = dict(DEFAULT_SUBINTERPRETERS)
+    settings.update({key: value for key, value in (subinterpreters or {}).items() if value is not None})
+    shutdown_subinterpreters()
+    _SETTINGS.update(
+        python=find_host_interpreter(settings['python']),
+        threads=int(settings['threads'] or os.cpu_count() or 1),
+        configured=True
+    )
+    return {'python': _SETTINGS['python'], 'threads': _SETTINGS['threads']}
+
+
+class SubinterpreterHost:
+    """A host process answering concurrent requests, matched to callers by id."""
+
+    def __init__(self, command):
+        self.command = command
+        self.retired = False
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            cwd=BASE_DIR,
+            **NEW_SESSION_KWARGS
+        )
+        threading.Thread(target=self._read_responses, daemon=True).start()
+
+    def _read_responses(self):
+        for line in self.process.stdout:
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            with self._lock:
+                waiter = self._pending.get(response.get('id'))
+            if waiter is not None:
+                waiter.put(response)
+        with self._lock:
+            waiters = list(self._pending.values())
+        for waiter in waiters:
+            waiter.put(None)
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def call(self, request: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one request and wait for its response.
+
+        Raises:
+            subprocess.TimeoutExpired: If no response arrives within timeout
+            RuntimeError: If the host exits before responding
+        """
+        waiter = queue.Queue(maxsize=1)
+        with self._lock:
+            self._next_id += 1
+            request = dict(request, id=self._next_id)
+            self._pending[request['id']] = waiter
+            try:
+                self.process.stdin.write(json.dumps(request) + '\n')
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError, ValueError):
+                del self._pending[request['id']]
+                raise RuntimeError("Subinterpreter host exited unexpectedly")
+        try:
+            response = waiter.get(timeout=timeout)
+        except queue.Empty:
+            self.retire()
+            raise subprocess.TimeoutExpired(self.command, timeout)
+        finally:
+            with self._lock:
+                del self._pending[request['id']]
+                drained = self.retired and not self._pending
+            if drained:
+                self.stop()
+        if response is None:
+            raise RuntimeError(f"Subinterpreter host exited unexpectedly with code {self.process.wait()}")
+        return response
+
+    def retire(self):
+        """Take no new requests; stop once the requests in flight have answered."""
+        with self._lock:
+            self.retired = True
+
+    def stop(self):
+        if self.process.poll() is None:
+            kill_process_group(self.process.pid)
+        self.process.wait()
+
+
+def host_interpreter() -> Optional[str]:
+    """Interpreter the host process runs under; None without a 3.12+ interpreter."""
+    if not _SETTINGS['configured']:
+        configure_subinterpreters()
+    return _SETTINGS['python']
+
+
+def get_host() -> Optional[SubinterpreterHost]:
+    """Return the current host, starting one if needed; None without a 3.12+ interpreter."""
+    if not _SETTINGS['configured']:
+        configure_subinterpreters()
+    if _SETTINGS['python'] is None:
+        return None
+    with _HOSTS_LOCK:
+        host = _HOSTS['current']
+        if host is None or host.retired or not host.is_alive():
+            host = SubinterpreterHost([_SETTINGS['python'], SUBINTERPRETER_HARNESS, str(_SETTINGS['threads'])])
+            _HOSTS['current'] = host
+        return host
+
+
+def shutdown_subinterpreters():
+    """Stop the current host; retired hosts stop on their own."""
+    with _HOSTS_LOCK:
+        host, _HOSTS['current'] = _HOSTS['current'], None
+    if host is not None:
+        try:
+            host.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            host.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            host.stop()
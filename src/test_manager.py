@@ -3,20 +3,117 @@ Test Manager Module:
 Manages test execution and evaluation of generated code.
 """
 import os
+import ast
 import json
-import jsonlines
+import hashlib
+import asyncio
 import time
+from functools import partial
 from datetime import datetime
-from typing import Dict, Any
-from src.runner import run_code
+from typing import Dict, Any, List, Optional, Tuple
+from src.runner import run_code, run_code_async
+from src.batch import run_code_batch
+from src.calibration import get_spawn_baseline, net_duration
+from src.benchmark import get_benchmark_settings, summarize_repetitions
+from src.profiling import DEFAULT_TOP_N, get_profile_path, profile_case
+from src.allocation import measure_allocations
+from src.isolation import host_conditions
+from src.runtimes import runtime_id_of
+from src.result_writer import get_result_writer
+from src.eval_cache import cell_key, lookup_records, store_records
+
+TEST_CASES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test_cases')
+INPUT_TEMPLATES_FILE = os.path.join(TEST_CASES_DIR, 'input_data.json')
+TEMPLATE_SCOPES = ('case', 'test_cases')
+
+# Parsed JSON files by path, with the stat they were read at and the hash of their contents
+_JSON_FILES = {}
+# Compiled accessors of input_data.json, by content hash
+_COMPILED_TEMPLATES = {}
+# Serialised inputs of every case of a task, with the content hashes they were built from
+_CASE_BUNDLES = {}
+
+
+def _load_json_file(path: str) -> Tuple[str, Any]:
+    """Return the content hash and parsed contents of a JSON file, re-read only when it changes."""
+    stat = os.stat(path)
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    cached = _JSON_FILES.get(path)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1], cached[2]
+    
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+    value = json.loads(data)
+    _JSON_FILES[path] = (stat_key, digest, value)
+    return digest, value
+
+
+def parse_template_path(expression: str) -> Tuple[str, Tuple[Any, ...]]:
+    """Split a template expression such as "case['input']['patients']" into its scope
+    name and key path.
+    
+    Raises:
+        ValueError: If the expression is not a chain of constant subscripts on 'case' or
+                    'test_cases'
+    """
+    try:
+        node = ast.parse(expression.strip(), mode='eval').body
+    except SyntaxError as e:
+        raise ValueError(f"Invalid template expression {expression!r}: {e}")
+    path = []
+    while isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Constant):
+        path.append(node.slice.value)
+        node = node.value
+    if not isinstance(node, ast.Name) or node.id not in TEMPLATE_SCOPES:
+        raise ValueError(f"Unsupported template expression {expression!r}")
+    return node.id, tuple(reversed(path))
+
+
+def compile_template_value(value: Any):
+    """Compile one value of input_data.json into an accessor of {'case': ..., 'test_cases': ...}.
+    
+    Expressions are resolved by plain indexing instead of eval. As before, a value that is
+    not an expression, or whose keys are missing, is passed through unchanged.
+    """
+    if not isinstance(value, str) or not ('case' in value or 'test_cases' in value):
+        return lambda scopes: value
+    try:
+        scope, path = parse_template_path(value)
+    except ValueError:
+        return lambda scopes: value
+    
+    def access(scopes):
+        try:
+            current = scopes[scope]
+            for key in path:
+                current = current[key]
+            return current
+        except (KeyError, IndexError, TypeError):
+            return value
+    return access
+
+
+def get_compiled_templates() -> Dict[str, List[Tuple[str, Any]]]:
+    """Accessors of every task in input_data.json, compiled once per version of the file."""
+    digest, templates = _load_json_file(INPUT_TEMPLATES_FILE)
+    if digest not in _COMPILED_TEMPLATES:
+        _COMPILED_TEMPLATES.clear()
+        _COMPILED_TEMPLATES[digest] = {
+            task_name: [(key, compile_template_value(value)) for key, value in template.items()]
+            for task_name, template in templates.items()
+        }
+    return _COMPILED_TEMPLATES[digest]
 
 
 def load_test_cases(task_name: str) -> Dict[str, Any]:
-    """Load test cases for a specific task."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    test_file = os.path.join(base_dir, 'test_cases', f'{task_name}_test_cases.json')
-    with open(test_file, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Load test cases for a specific task.
+    
+    The file is parsed once and shared by every caller until it changes on disk, so the
+    returned document must not be modified.
+    """
+    return _load_json_file(os.path.join(TEST_CASES_DIR, f'{task_name}_test_cases.json'))[1]
 
 def load_input_data(task_name: str, case: Dict[str, Any] = None, test_cases_data: Dict[str, Any] = None) -> Dict[str, Any]:
     """Load and process input data for a specific task.
@@ -29,36 +126,35 @@ def load_input_data(task_name: str, case: Dict[str, Any] = None, test_cases_data
     Returns:
         Dict[str, Any]: Processed input data ready for use
     """
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    input_file = os.path.join(base_dir, 'test_cases', 'input_data.json')
-    
-    with open(input_file, 'r', encoding='utf-8') as f:
-        input_templates = json.load(f)
-    
     if case is None and test_cases_data is None:
-        return input_templates
+        return _load_json_file(INPUT_TEMPLATES_FILE)[1]
     
-    template = input_templates.get(task_name, {})
+    scopes = {'case': case or None, 'test_cases': test_cases_data or None}
+    return {key: access(scopes) for key, access in get_compiled_templates().get(task_name, [])}
+
+def load_case_bundle(task_name: str) -> List[Dict[str, Any]]:
+    """Every test case of a task with its stdin payload serialised once.
     
-    # eval input_data.json
-    local_vars = {}
-    if case:
-        local_vars['case'] = case
-    if test_cases_data:
-        local_vars['test_cases'] = test_cases_data
+    Bundles are kept in memory by the content hashes of the task's test cases and of
+    input_data.json, and rebuilt only when either file changes.
     
-
-    result = {}
-    for key, value in template.items():
-        if isinstance(value, str) and ('case' in value or 'test_cases' in value):
-            try:
-                result[key] = eval(value, {"__builtins__": {}}, local_vars)
-            except:
-                result[key] = value
-        else:
-            result[key] = value
+    Returns:
+        List[Dict[str, Any]]: {'case': test case, 'input_data': JSON input document} in file order
+    """
+    test_cases_file = os.path.join(TEST_CASES_DIR, f'{task_name}_test_cases.json')
+    cases_digest, test_cases = _load_json_file(test_cases_file)
+    templates_digest, _ = _load_json_file(INPUT_TEMPLATES_FILE)
+    key = (cases_digest, templates_digest)
+    cached = _CASE_BUNDLES.get(task_name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
     
-    return result
+    bundle = [
+        {'case': case, 'input_data': json.dumps(load_input_data(task_name, case, test_cases))}
+        for case in test_cases['test_cases']
+    ]
+    _CASE_BUNDLES[task_name] = (key, bundle)
+    return bundle
 
 def get_task_components(file_path: str, language: str) -> str:
     """Extract task components from file path to create task_id.
@@ -113,48 +209,72 @@ def extract_key_error(error_message: str) -> str:
     return lines[-1] if lines else error_message[:200]
 
 
-def execute_task(file_path: str, language: str, task_name: str) -> Dict[str, Any]:
+def build_execution_result(task_id: str, result: Dict[str, Any], retry_count: int = 0) -> Dict[str, Any]:
+    """Turn a run_code result into an execution.ndjson record.
+    
+    The solution's build is reported here, once: compile_duration is the time its Go build
+    took, and build_cached is set when the binary came from the on-disk build cache (then
+    compile_duration is 0.0). Both are left out of the per-case test records.
+    """
+    return {
+        'task_id': task_id,
+        'executor': result.get('executor'),
+        'execution_status': 'success' if result['success'] else 'failure',
+        'error_type': result.get('error_type'),
+        'error_message': extract_key_error(result.get('error_message', '')),
+        'retry_count': retry_count,
+        'exit_code': result.get('exit_code', -1),
+        'compile_duration': result.get('compile_duration', 0.0),
+        'build_cached': result.get('build_cached'),
+        'timestamp': datetime.utcnow().isoformat()
+    }
+
+
+def save_results(subdir: str, task_name: str, records: List[Dict[str, Any]]) -> None:
+    """Append records to results/{subdir}/{task_name}.ndjson in the given order.
+    
+    Records go through the shared result writer (src/result_writer.py), which keeps the
+    file open and writes them in batches; close_result_writer flushes them to disk.
+    """
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results_file = os.path.join(base_dir, 'results', subdir, f'{task_name}.ndjson')
+    get_result_writer().write(results_file, records)
+
+
+def execute_task(file_path: str, language: str, task_name: str, run_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Execute all test cases for task 1 and record overall execution results.
     
     Args:
         file_path (str): Path to the code file
         language (str): Programming language of the code
+        run_options (Dict[str, Any], optional): Keyword arguments passed to run_code
+                                                (e.g. executor, sample_peak_rss)
         
     Returns:
         Dict[str, Any]: Execution results for execution.ndjson
     """
-    test_cases = load_test_cases(task_name)
+    bundle = load_case_bundle(task_name)
     retry_count = 0
     max_retries = 1
     task_id = get_task_components(file_path, language)
     last_error_type = None
     last_error_message = None
     
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    os.makedirs(os.path.join(base_dir, 'results', 'execution'), exist_ok=True)
+    key = cell_key('execution', file_path, language, bundle[0], run_options)
+    cached = lookup_records(key)
+    if cached:
+        save_results('execution', task_name, cached)
+        return cached[0]
     
     while retry_count < max_retries:
         try:
-            case = test_cases['test_cases'][0]
+            result = run_code(file_path, language, input_data=bundle[0]['input_data'], **(run_options or {}))
             
-            input_data = load_input_data(task_name, case, test_cases)
-                    
-            result = run_code(file_path, language, input_data=json.dumps(input_data))
-            
-            execution_result = {
-                'task_id': task_id,
-                'execution_status': 'success' if result['success'] else 'failure',
-                'error_type': result.get('error_type'),
-                'error_message': extract_key_error(result.get('error_message', '')),
-                'retry_count': retry_count,
-                'exit_code': result.get('exit_code', -1),
-                'timestamp': datetime.utcnow().isoformat()
-            }
+            execution_result = build_execution_result(task_id, result, retry_count)
+            store_records(key, [execution_result], result)
             
             # Save each attempt to execution.ndjson
-            execution_file = os.path.join(base_dir, 'results', 'execution', f'{task_name}.ndjson')
-            with jsonlines.open(execution_file, mode='a') as writer:
-                writer.write(execution_result)
+            save_results('execution', task_name, [execution_result])
             
             if result['success']:
                 return execution_result
@@ -168,6 +288,7 @@ def execute_task(file_path: str, language: str, task_name: str) -> Dict[str, Any
             
             execution_result = {
                 'task_id': task_id,
+                'executor': (run_options or {}).get('executor', 'process'),
                 'execution_status': 'failure',
                 'error_type': error_type,
                 'error_message': extract_key_error(error_message),
@@ -176,9 +297,7 @@ def execute_task(file_path: str, language: str, task_name: str) -> Dict[str, Any
                 'timestamp': datetime.utcnow().isoformat()
             }
             
-            execution_file = os.path.join(base_dir, 'results', 'execution', f'{task_name}.ndjson')
-            with jsonlines.open(execution_file, mode='a') as writer:
-                writer.write(execution_result)
+            save_results('execution', task_name, [execution_result])
             
             last_error_type = error_type
             last_error_message = error_message
@@ -190,6 +309,7 @@ def execute_task(file_path: str, language: str, task_name: str) -> Dict[str, Any
     # If all retries failed, return the last failure result
     return {
         'task_id': task_id,
+        'executor': (run_options or {}).get('executor', 'process'),
         'execution_status': 'failure',
         'error_type': last_error_type,
         'error_message': extract_key_error(last_error_message) if last_error_message else None,
@@ -199,47 +319,383 @@ def execute_task(file_path: str, language: str, task_name: str) -> Dict[str, Any
     }
 
 
-def test_task(file_path: str, language: str, task_name: str) -> None:
+def build_test_result(task_id: str, case: Dict[str, Any], result: Dict[str, Any], spawn_baseline: float = 0.0, timing_stats: Optional[Dict[str, Any]] = None, runtime_id: Optional[str] = None) -> Dict[str, Any]:
+    """Turn a run_code result for one test case into a test_results record.
+    
+    Args:
+        task_id (str): Identifier of the solution
+        case (Dict[str, Any]): Test case with 'test_case' and 'expected_result'
+        result (Dict[str, Any]): Result returned by run_code or run_code_async
+        spawn_baseline (float): Calibrated no-op duration of the language, subtracted from
+                                execution_duration to give net_execution_duration
+        timing_stats (Dict[str, Any], optional): Statistics from summarize_repetitions in
+                                                 benchmark mode; execution_duration, cpu_time
+                                                 and memory_usage then hold the medians
+        runtime_id (str, optional): Runtime the case ran under (see src/runtimes.py)
+        
+    Returns:
+        Dict[str, Any]: Record for results/test_results/{task_name}.ndjson
+    """
+    resources = result.get('resources', {})
+    duration = result.get('duration', 0.0)
+    cpu_time = resources.get('cpu_time', 0.0)
+    memory_usage = resources.get('memory_usage', 0.0)
+    if timing_stats:
+        duration = timing_stats['execution_duration_median']
+        cpu_time = timing_stats['cpu_time_median']
+        memory_usage = timing_stats['memory_usage_median']
+    
+    test_result = {
+        'task_id': task_id,
+        'test_case_id': str(case['test_case']),
+        'runtime_id': runtime_id,
+        'executor': result.get('executor'),
+        'expected_output': case['expected_result'],
+        'actual_output': extract_key_error(result.get('error_message', '')),
+        'test_passed': False,
+        'execution_duration': duration,
+        'net_execution_duration': net_duration(duration, spawn_baseline),
+        'memory_usage': memory_usage,
+        'peak_memory_usage': resources.get('peak_memory_usage', 0.0),
+        'memory_source': resources.get('memory_source'),
+        'cpu_time': cpu_time,
+        'user_cpu_time': resources.get('user_cpu_time', 0.0),
+        'sys_cpu_time': resources.get('sys_cpu_time', 0.0),
+        'voluntary_ctx_switches': resources.get('voluntary_ctx_switches', 0),
+        'involuntary_ctx_switches': resources.get('involuntary_ctx_switches', 0),
+        **host_conditions(result.get('cpu_id')),
+        'timestamp': datetime.utcnow().isoformat()
+    }
+    if timing_stats:
+        test_result.update(timing_stats)
+    if result.get('go_benchmark'):
+        # In-process testing.Benchmark timing of the go_suite executor
+        test_result.update({f'benchmark_{key}': value for key, value in result['go_benchmark'].items()})
+
+    parse_start = time.perf_counter_ns()
+    if result['success']:
+        try:
+            actual_output = json.loads(result['stdout'])
+            if not isinstance(actual_output, dict):
+                test_result['actual_output'] = f"Invalid output format: expected object, got {type(actual_output)}"
+            else:
+                test_result['actual_output'] = actual_output
+                test_result['test_passed'] = actual_output == case['expected_result']
+        except json.JSONDecodeError:
+            test_result['actual_output'] = f"Invalid JSON output: {result['stdout'][:100]}"
+    
+    if result.get('phase_timings'):
+        test_result['phase_timings'] = dict(result['phase_timings'], parse=(time.perf_counter_ns() - parse_start) / 1e9)
+    
+    return test_result
+
+
+def run_batch(file_path: str, language: str, bundle: List[Dict[str, Any]], run_options: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Run every test case of a solution in one wrapper process (executor 'batch')."""
+    run_options = run_options or {}
+    inputs = [item['input_data'] for item in bundle]
+    return run_code_batch(file_path, language, inputs, timeout=run_options.get('timeout', 30), limits=run_options.get('limits'), capture_limits=run_options.get('capture_limits'))
+
+
+def benchmark_case(file_path: str, language: str, input_data: str, run_options: Optional[Dict[str, Any]], settings: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Run one test case warmup_runs times untimed, then repetitions times measured.
+    
+    Returns:
+        Tuple: The first measured result and its timing statistics. A failing run stops
+               the repetitions and is returned without statistics.
+    """
+    for _ in range(settings['warmup_runs']):
+        result = run_code(file_path, language, input_data=input_data, **(run_options or {}))
+        if not result['success']:
+            return result, None
+    results = []
+    for _ in range(max(1, settings['repetitions'])):
+        result = run_code(file_path, language, input_data=input_data, **(run_options or {}))
+        if not result['success']:
+            return result, None
+        results.append(result)
+    return results[0], summarize_repetitions(results, settings['cv_threshold'])
+
+
+def benchmark_batch(file_path: str, language: str, bundle: List[Dict[str, Any]], run_options: Optional[Dict[str, Any]], settings: Dict[str, Any]) -> List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """Benchmark mode for the batch executor: whole batches are warmed up and repeated."""
+    for _ in range(settings['warmup_runs']):
+        run_batch(file_path, language, bundle, run_options)
+    runs = [run_batch(file_path, language, bundle, run_options) for _ in range(max(1, settings['repetitions']))]
+    outcomes = []
+    for repetitions in zip(*runs):
+        repetitions = list(repetitions)
+        if all(result['success'] for result in repetitions):
+            outcomes.append((repetitions[0], summarize_repetitions(repetitions, settings['cv_threshold'])))
+        else:
+            outcomes.append((next(result for result in repetitions if not result['success']), None))
+    return outcomes
+
+
+def attach_profile(test_result: Dict[str, Any], file_path: str, language: str, input_data: str, run_options: Optional[Dict[str, Any]], profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Profile one test case and add 'profile_path', 'hotspots' and 'profile_error' to its record."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    run_options = run_options or {}
+    outcome = profile_case(
+        file_path,
+        language,
+        input_data,
+        get_profile_path(test_result['task_id'], test_result['test_case_id']),
+        top_n=profile.get('top_n') or DEFAULT_TOP_N,
+        timeout=run_options.get('timeout', 30),
+        limits=run_options.get('limits')
+    )
+    test_result['profile_path'] = os.path.relpath(outcome['profile_path'], base_dir) if outcome['profile_path'] else None
+    test_result['hotspots'] = outcome['hotspots']
+    test_result['profile_error'] = outcome['profile_error']
+    return test_result
+
+
+def attach_allocations(test_result: Dict[str, Any], file_path: str, language: str, input_data: str, run_options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Measure the allocations of one test case and add the fields of src.allocation.measure_allocations to its record."""
+    run_options = run_options or {}
+    test_result.update(measure_allocations(
+        file_path,
+        language,
+        input_data,
+        timeout=run_options.get('timeout', 30),
+        limits=run_options.get('limits')
+    ))
+    return test_result
+
+
+def attach_instrumented_runs(test_result: Dict[str, Any], file_path: str, language: str, input_data: str, run_options: Optional[Dict[str, Any]], profile: Optional[Dict[str, Any]], allocations: bool) -> Dict[str, Any]:
+    """Run the extra profiled and allocation-measuring runs of one test case that are enabled."""
+    if profile is not None:
+        attach_profile(test_result, file_path, language, input_data, run_options, profile)
+    if allocations:
+        attach_allocations(test_result, file_path, language, input_data, run_options)
+    return test_result
+
+
+def test_cell_key(file_path: str, language: str, item: Dict[str, Any], run_options: Optional[Dict[str, Any]], settings: Dict[str, Any], profile: Optional[Dict[str, Any]] = None, allocations: bool = False) -> Optional[str]:
+    """Evaluation-cache key of one test case (see src/eval_cache.py)."""
+    return cell_key('test', file_path, language, item, run_options, {'benchmark': settings, 'profile': profile, 'allocations': allocations})
+
+
+def recorded_runtime_id(language: str, run_options: Optional[Dict[str, Any]], result: Dict[str, Any]) -> Optional[str]:
+    """Runtime id of the interpreter that produced result, which may have fallen back
+    from the configured executor to a fresh process."""
+    return runtime_id_of(language, (run_options or {}).get('runtime'), result.get('executor'))
+
+
+def evaluate_case(file_path: str, language: str, task_id: str, item: Dict[str, Any], run_options: Optional[Dict[str, Any]], settings: Dict[str, Any], runtime_id: Optional[str] = None, profile: Optional[Dict[str, Any]] = None, allocations: bool = False) -> Dict[str, Any]:
+    """Run one entry of a case bundle (benchmarked and instrumented as configured) and build
+    its record, or re-emit the cached record of an unchanged case."""
+    key = test_cell_key(file_path, language, item, run_options, settings, profile, allocations)
+    cached = lookup_records(key)
+    if cached:
+        return cached[0]
+    
+    if settings['enabled']:
+        result, stats = benchmark_case(file_path, language, item['input_data'], run_options, settings)
+    else:
+        result = run_code(file_path, language, input_data=item['input_data'], **(run_options or {}))
+        stats = None
+    
+    test_result = build_test_result(task_id, item['case'], result, get_spawn_baseline(language, runtime_id), stats, recorded_runtime_id(language, run_options, result))
+    if profile is not None or allocations:
+        attach_instrumented_runs(test_result, file_path, language, item['input_data'], run_options, profile, allocations)
+    store_records(key, [test_result], result)
+    return test_result
+
+
+def evaluate_batch(file_path: str, language: str, task_id: str, bundle: List[Dict[str, Any]], run_options: Optional[Dict[str, Any]], settings: Dict[str, Any], runtime_id: Optional[str] = None, profile: Optional[Dict[str, Any]] = None, allocations: bool = False) -> List[Dict[str, Any]]:
+    """Counterpart of evaluate_case for the batch executor: every case of the bundle that is
+    not cached runs in one process."""
+    keys = [test_cell_key(file_path, language, item, run_options, settings, profile, allocations) for item in bundle]
+    cached = [lookup_records(key) for key in keys]
+    missing = [index for index, records in enumerate(cached) if not records]
+    if not missing:
+        return [records[0] for records in cached]
+    
+    bundle = [bundle[index] for index in missing]
+    if settings['enabled']:
+        outcomes = benchmark_batch(file_path, language, bundle, run_options, settings)
+    else:
+        outcomes = [(result, None) for result in run_batch(file_path, language, bundle, run_options)]
+    records = [
+        build_test_result(task_id, item['case'], result, get_spawn_baseline(language, runtime_id), stats, recorded_runtime_id(language, run_options, result))
+        for item, (result, stats) in zip(bundle, outcomes)
+    ]
+    if profile is not None or allocations:
+        for item, record in zip(bundle, records):
+            attach_instrumented_runs(record, file_path, language, item['input_data'], run_options, profile, allocations)
+    for index, record, (result, _) in zip(missing, records, outcomes):
+        store_records(keys[index], [record], result)
+        cached[index] = [record]
+    return [records[0] for records in cached]
+
+
+def test_task(file_path: str, language: str, task_name: str, run_options: Optional[Dict[str, Any]] = None, benchmark: Optional[Dict[str, Any]] = None, profile: Optional[Dict[str, Any]] = None, allocations: bool = False) -> List[Dict[str, Any]]:
     """Run all test cases for task 1 and record test results.
     
     Args:
         file_path (str): Path to the code file
         language (str): Programming language of the code
         task_name (str): Name of the task
+        run_options (Dict[str, Any], optional): Keyword arguments passed to run_code
+                                                (e.g. executor, sample_peak_rss). With
+                                                executor 'batch', all cases run in one process.
+                                                The id of a 'runtime' from the runtime matrix
+                                                is recorded as runtime_id
+        benchmark (Dict[str, Any], optional): Repeated-run timing mode ('enabled',
+                                              'warmup_runs', 'repetitions', 'cv_threshold')
+        profile (Dict[str, Any], optional): When given, each case is run once more under the
+                                            language's profiler ('top_n' hotspots are kept)
+        allocations (bool): Run each case once more under an allocation harness and record
+                            its allocation fields (see src/allocation.py)
+    
+    Returns:
+        List[Dict[str, Any]]: The records saved to test_results, in case order
     """
-    test_cases = load_test_cases(task_name=task_name)
+    bundle = load_case_bundle(task_name)
     task_id = get_task_components(file_path, language)
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    settings = get_benchmark_settings(benchmark)
+    runtime_id = runtime_id_of(language, (run_options or {}).get('runtime'), (run_options or {}).get('executor'))
     
-    for case in test_cases['test_cases']:
-        input_data = load_input_data(task_name, case, test_cases)
-        
-        result = run_code(file_path, language, input_data=json.dumps(input_data))
+    if (run_options or {}).get('executor') == 'batch':
+        records = evaluate_batch(file_path, language, task_id, bundle, run_options, settings, runtime_id, profile, allocations)
+        save_results('test_results', task_name, records)
+        return records
+    
+    records = []
+    for item in bundle:
+        test_result = evaluate_case(file_path, language, task_id, item, run_options, settings, runtime_id, profile, allocations)
+        save_results('test_results', task_name, [test_result])
+        records.append(test_result)
+    return records
+
+
+async def _run_case_async(semaphore: Optional[asyncio.Semaphore], file_path: str, language: str, input_data: str, run_options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if semaphore is None:
+        return await run_code_async(file_path, language, input_data=input_data, **(run_options or {}))
+    async with semaphore:
+        return await run_code_async(file_path, language, input_data=input_data, **(run_options or {}))
+
+
+async def _benchmark_case_async(semaphore: Optional[asyncio.Semaphore], file_path: str, language: str, input_data: str, run_options: Optional[Dict[str, Any]], settings: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Asynchronous counterpart of benchmark_case; repetitions of a case run one after another."""
+    for _ in range(settings['warmup_runs']):
+        result = await _run_case_async(semaphore, file_path, language, input_data, run_options)
+        if not result['success']:
+            return result, None
+    results = []
+    for _ in range(max(1, settings['repetitions'])):
+        result = await _run_case_async(semaphore, file_path, language, input_data, run_options)
+        if not result['success']:
+            return result, None
+        results.append(result)
+    return results[0], summarize_repetitions(results, settings['cv_threshold'])
+
+
+async def execute_task_async(file_path: str, language: str, task_name: str, run_options: Optional[Dict[str, Any]] = None, semaphore: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+    """Asynchronous counterpart of execute_task that returns the record instead of saving it.
+    
+    Args:
+        file_path (str): Path to the code file
+        language (str): Programming language of the code
+        task_name (str): Name of the task
+        run_options (Dict[str, Any], optional): Keyword arguments passed to run_code_async
+        semaphore (asyncio.Semaphore, optional): Bounds the number of concurrent runs
         
-        test_result = {
+    Returns:
+        Dict[str, Any]: Execution record for execution.ndjson
+    """
+    bundle = load_case_bundle(task_name)
+    task_id = get_task_components(file_path, language)
+    key = cell_key('execution', file_path, language, bundle[0], run_options)
+    cached = lookup_records(key)
+    if cached:
+        return cached[0]
+    try:
+        result = await _run_case_async(semaphore, file_path, language, bundle[0]['input_data'], run_options)
+        execution_result = build_execution_result(task_id, result)
+        store_records(key, [execution_result], result)
+        return execution_result
+    except Exception as e:
+        return {
             'task_id': task_id,
-            'test_case_id': str(case['test_case']),
-            'expected_output': case['expected_result'],
-            'actual_output': extract_key_error(result.get('error_message', '')),
-            'test_passed': False,
-            'execution_duration': result.get('duration', 0.0),
-            'memory_usage': result.get('resources', {}).get('memory_usage', 0.0),
-            'cpu_time': result.get('resources', {}).get('cpu_time', 0.0),
+            'executor': (run_options or {}).get('executor', 'process'),
+            'execution_status': 'failure',
+            'error_type': type(e).__name__,
+            'error_message': extract_key_error(str(e)),
+            'retry_count': 0,
+            'exit_code': -1,
             'timestamp': datetime.utcnow().isoformat()
         }
+
+
+async def _attach_instrumented_runs_async(semaphore: Optional[asyncio.Semaphore], records: List[Dict[str, Any]], file_path: str, language: str, bundle: List[Dict[str, Any]], run_options: Optional[Dict[str, Any]], profile: Optional[Dict[str, Any]], allocations: bool) -> List[Dict[str, Any]]:
+    async def attach(input_data, record):
+        if semaphore is None:
+            return await asyncio.to_thread(attach_instrumented_runs, record, file_path, language, input_data, run_options, profile, allocations)
+        async with semaphore:
+            return await asyncio.to_thread(attach_instrumented_runs, record, file_path, language, input_data, run_options, profile, allocations)
+    
+    return list(await asyncio.gather(*(attach(item['input_data'], record) for item, record in zip(bundle, records))))
+
+
+async def test_task_async(file_path: str, language: str, task_name: str, run_options: Optional[Dict[str, Any]] = None, semaphore: Optional[asyncio.Semaphore] = None, benchmark: Optional[Dict[str, Any]] = None, profile: Optional[Dict[str, Any]] = None, allocations: bool = False) -> List[Dict[str, Any]]:
+    """Run all test cases of a solution concurrently and return records in case order.
+    
+    Args:
+        file_path (str): Path to the code file
+        language (str): Programming language of the code
+        task_name (str): Name of the task
+        run_options (Dict[str, Any], optional): Keyword arguments passed to run_code_async
+        semaphore (asyncio.Semaphore, optional): Bounds the number of concurrent runs
+        benchmark (Dict[str, Any], optional): Repeated-run timing mode, as for test_task
+        profile (Dict[str, Any], optional): Profiling mode, as for test_task
+        allocations (bool): Allocation profiling mode, as for test_task
         
-        if result['success']:
-            try:
-                actual_output = json.loads(result['stdout'])
-                if not isinstance(actual_output, dict):
-                    test_result['actual_output'] = f"Invalid output format: expected object, got {type(actual_output)}"
-                else:
-                    test_result['actual_output'] = actual_output
-                    test_result['test_passed'] = actual_output == case['expected_result']
-            except json.JSONDecodeError:
-                test_result['actual_output'] = f"Invalid JSON output: {result['stdout'][:100]}"
-        
-        os.makedirs(os.path.join(base_dir, 'results', 'test_results'), exist_ok=True)
-        test_results_file = os.path.join(base_dir, 'results', 'test_results', f'{task_name}.ndjson')
-        with jsonlines.open(test_results_file, mode='a') as writer:
-            writer.write(test_result)
+    Returns:
+        List[Dict[str, Any]]: Records for test_results, one per test case, in file order
+    """
+    bundle = load_case_bundle(task_name)
+    task_id = get_task_components(file_path, language)
+    settings = get_benchmark_settings(benchmark)
+    runtime_id = runtime_id_of(language, (run_options or {}).get('runtime'), (run_options or {}).get('executor'))
+    baseline = get_spawn_baseline(language, runtime_id)
+    
+    keys = [test_cell_key(file_path, language, item, run_options, settings, profile, allocations) for item in bundle]
+    cached = [lookup_records(key) for key in keys]
+    missing = [index for index, records in enumerate(cached) if not records]
+    if not missing:
+        return [records[0] for records in cached]
+    bundle = [bundle[index] for index in missing]
+    
+    if (run_options or {}).get('executor') == 'batch':
+        if settings['enabled']:
+            run = partial(benchmark_batch, file_path, language, bundle, run_options, settings)
+        else:
+            run = lambda: [(result, None) for result in run_batch(file_path, language, bundle, run_options)]
+        if semaphore is None:
+            outcomes = await asyncio.to_thread(run)
+        else:
+            async with semaphore:
+                outcomes = await asyncio.to_thread(run)
+    elif settings['enabled']:
+        outcomes = await asyncio.gather(*(
+            _benchmark_case_async(semaphore, file_path, language, item['input_data'], run_options, settings)
+            for item in bundle
+        ))
+    else:
+        results = await asyncio.gather(*(
+            _run_case_async(semaphore, file_path, language, item['input_data'], run_options)
+            for item in bundle
+        ))
+        outcomes = [(result, None) for result in results]
+    
+    records = [build_test_result(task_id, item['case'], result, baseline, stats, recorded_runtime_id(language, run_options, result)) for item, (result, stats) in zip(bundle, outcomes)]
+    if profile is not None or allocations:
+        records = await _attach_instrumented_runs_async(semaphore, records, file_path, language, bundle, run_options, profile, allocations)
+    for index, record, (result, _) in zip(missing, records, outcomes):
+        store_records(keys[index], [record], result)
+        cached[index] = [record]
+    return [records[0] for records in cached]
@@ -0,0 +1,191 @@
+"""
+Transport Module:
+Shared-file transport for large solution inputs. Instead of pushing the same JSON
+document through a stdin pipe for every run, the runner writes it once into an
+in-memory file (a sealed memfd, or a file on tmpfs) and hands each child its own
+read-only descriptor of that file as stdin. Warm and batch harnesses get the file's
+path in the request instead of the inline input.
+
+Payloads are keyed by content hash, so concurrent runs of the same input share one
+copy. Inputs below `min_bytes` (of UTF-8) keep using the pipe, where the copy is cheap.
+The default mode is 'pipe', so the shared file is opt-in.
+"""
+import os
+import atexit
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Dict, Any
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+TRANSPORT_MODES = ('pipe', 'memfd', 'tmpfs')
+TMPFS_DIR = '/dev/shm'
+
+DEFAULT_TRANSPORT = {
+    'mode': 'pipe',
+    'min_bytes': 64 * 1024,
+    'max_cached_mb': 512
+}
+
+_SETTINGS = dict(DEFAULT_TRANSPORT)
+
+
+def get_transport_settings(transport: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Merge configured transport settings over the defaults; null entries keep the default."""
+    settings = dict(DEFAULT_TRANSPORT)
+    settings.update({key: value for key, value in (transport or {}).items() if value is not None})
+    if settings['mode'] not in TRANSPORT_MODES:
+        raise ValueError(f"Unknown input transport: {settings['mode']}")
+    if settings['mode'] == 'memfd' and not hasattr(os, 'memfd_create'):
+        settings['mode'] = 'tmpfs'
+    return settings
+
+
+class SharedPayload:
+    """One input document stored once in a memfd or tmpfs file."""
+
+    def __init__(self, data: bytes, mode: str):
+        self.size = len(data)
+        self.mode = mode
+        self.leases = 0
+        self._fd = None
+        self._file = None
+        if mode == 'memfd':
+            self._fd = os.memfd_create('solution-input', os.MFD_CLOEXEC | getattr(os, 'MFD_ALLOW_SEALING', 0))
+            self._write(self._fd, data)
+            self._seal()
+            self.path = f'/proc/{os.getpid()}/fd/{self._fd}'
+        else:
+            directory = TMPFS_DIR if os.path.isdir(TMPFS_DIR) else tempfile.gettempdir()
+            fd, self._file = tempfile.mkstemp(prefix='solution-input-', suffix='.json', dir=directory)
+            try:
+                self._write(fd, data)
+            finally:
+                os.close(fd)
+            os.chmod(self._file, 0o400)
+            self.path = self._file
+
+    @staticmethod
+    def _write(fd: int, data: bytes):
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+    def _seal(self):
+        if fcntl is None or not hasattr(fcntl, 'F_ADD_SEALS'):
+            return
+        try:
+            fcntl.fcntl(self._fd, fcntl.F_ADD_SEALS, fcntl.F_SEAL_SEAL | fcntl.F_SEAL_SHRINK | fcntl.F_SEAL_GROW | fcntl.F_SEAL_WRITE)
+        except OSError:
+            pass
+
+    def open(self):
+        """A new read-only file positioned at the start, e.g. for a child's stdin.
+
+        Each call gets its own open file description, so concurrent readers do not share
+        an offset.
+        """
+        return open(self.path, 'rb')
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if self._file is not None:
+            try:
+                os.remove(self._file)
+            except OSError:
+                pass
+            self._file = None
+
+
+class PayloadStore:
+    """Thread-safe cache of shared payloads by content hash, bounded in total bytes.
+
+    A payload is leased while a run may still open it by path; only payloads without
+    leases are evicted.
+    """
+
+    def __init__(self):
+        self._payloads = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def lease(self, data: bytes, mode: str, max_bytes: int) -> SharedPayload:
+        key = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            payload = self._payloads.get(key)
+            if payload is None:
+                payload = SharedPayload(data, mode)
+                self._payloads[key] = payload
+                self._bytes += payload.size
+            self._payloads.move_to_end(key)
+            payload.leases += 1
+            self._evict(max_bytes)
+            return payload
+
+    def release(self, payload: SharedPayload):
+        with self._lock:
+            payload.leases -= 1
+
+    def _evict(self, max_bytes: int):
+        # An evicted payload may still be open as a child's stdin; the kernel keeps its
+        # contents until the last descriptor is closed
+        for key in list(self._payloads):
+            if self._bytes <= max_bytes:
+                break
+            payload = self._payloads[key]
+            if payload.leases == 0:
+                del self._payloads[key]
+                self._bytes -= payload.size
+                payload.close()
+
+    def clear(self):
+        with self._lock:
+            payloads, self._payloads, self._bytes = list(self._payloads.values()), OrderedDict(), 0
+        for payload in payloads:
+            payload.close()
+
+
+_STORE = PayloadStore()
+atexit.register(_STORE.clear)
+
+
+def configure_transport(transport: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Set the input transport used from now on and return the effective settings."""
+    _SETTINGS.clear()
+    _SETTINGS.update(get_transport_settings(transport))
+    return dict(_SETTINGS)
+
+
+def clear_shared_inputs():
+    """Close every cached payload now, e.g. in a worker process that exits without atexit."""
+    _STORE.clear()
+
+
+@contextmanager
+def shared_input(input_data: Optional[str]):
+    """Lease the shared file holding input_data for the duration of the block.
+
+    Yields None when the input should go through a pipe instead (pipe mode, or an
+    input smaller than min_bytes).
+    """
+    if not input_data or _SETTINGS['mode'] == 'pipe':
+        yield None
+        return
+    data = input_data.encode('utf-8')
+    # min_bytes is a size in bytes; non-ASCII input takes more bytes than characters
+    if len(data) < _SETTINGS['min_bytes']:
+        yield None
+        return
+    payload = _STORE.lease(data, _SETTINGS['mode'], int(_SETTINGS['max_cached_mb'] * 1024 * 1024))
+    try:
+        yield payload
+    finally:
+        _STORE.release(payload)
@@ -0,0 +1,224 @@
+"""
+Workers Module:
+Long-lived harness processes that load each generated solution once and serve many test cases.
+Python solutions are compiled once by src/harness/python_worker.py and run as scripts;
+JavaScript solutions are compiled once by src/harness/node_harness.js, which keeps V8's
+code cache in .cache/v8/.
+Workers are recycled after a number of calls or when their RSS grows past a threshold,
+so a leaky solution cannot affect later runs.
+"""
+import os
+import re
+import sys
+import json
+import queue
+import threading
+import subprocess
+import psutil
+from typing import Optional, List, Dict, Any
+from src.process_utils import NEW_SESSION_KWARGS, kill_process_group
+from src.isolation import pin_process
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HARNESS_DIR = os.path.join(BASE_DIR, 'src', 'harness')
+V8_CODE_CACHE_DIR = os.path.join(BASE_DIR, '.cache', 'v8')
+LANGUAGE_TEMPLATES_DIR = os.path.join(BASE_DIR, 'prompt_templates', 'languages')
+
+DEFAULT_MAX_CALLS = 200
+DEFAULT_MAX_RSS_MB = 512
+
+_ENTRY_POINTS = {}
+
+
+def get_entry_point(language: str, task_name: str) -> Optional[str]:
+    """Look up the task entry point name from prompt_templates/languages/{language}.json.
+
+    Args:
+        language (str): Programming language
+        task_name (str): Name of the task (e.g. 'task_1')
+
+    Returns:
+        str: Function name such as 'allocate_bed', or None if the task is unknown
+    """
+    if language not in _ENTRY_POINTS:
+        template_file = os.path.join(LANGUAGE_TEMPLATES_DIR, f'{language}.json')
+        with open(template_file, 'r', encoding='utf-8') as f:
+            template = json.load(f)
+        entry_points = {}
+        for item in template.get('function_signatures', []):
+            match = re.search(r'(?:def|function|func)\s+(\w+)\s*\(', item['signature'])
+            if match:
+                entry_points[item['task_id']] = match.group(1)
+        _ENTRY_POINTS[language] = entry_points
+    return _ENTRY_POINTS[language].get(task_name)
+
+
+class PersistentWorker:
+    """A harness child process speaking line-delimited JSON over stdin/stdout."""
+
+    def __init__(self, command: List[str], max_calls: int = DEFAULT_MAX_CALLS, max_rss_mb: float = DEFAULT_MAX_RSS_MB):
+        self.command = command
+        self.max_calls = max_calls
+        self.max_rss_mb = max_rss_mb
+        self.calls = 0
+        self.process = None
+        self._responses = None
+        self._next_id = 0
+
+    def start(self):
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            cwd=BASE_DIR,
+            **NEW_SESSION_KWARGS
+        )
+        self.calls = 0
+        self._responses = queue.Queue()
+        reader = threading.Thread(target=self._read_responses, args=(self.process, self._responses), daemon=True)
+        reader.start()
+
+    @staticmethod
+    def _read_responses(process, responses):
+        for line in process.stdout:
+            try:
+                responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        responses.put(None)
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def rss_mb(self) -> float:
+        try:
+            return psutil.Process(self.process.pid).memory_info().rss / (1024 * 1024)
+        except (psutil.Error, AttributeError):
+            return 0.0
+
+    def call(self, request: Dict[str, Any], timeout: float, cpu: Optional[int] = None) -> Dict[str, Any]:
+        """Send one request and wait for its response.
+
+        In isolation mode the worker is first pinned to the core `cpu` held for this call.
+
+        Raises:
+            subprocess.TimeoutExpired: If no response arrives within timeout
+            RuntimeError: If the worker exits before responding
+        """
+        if not self.is_alive():
+            self.start()
+        pin_process(self.process.pid, cpu)
+        self._next_id += 1
+        request = dict(request, id=self._next_id)
+        try:
+            self.process.stdin.write(json.dumps(request) + '\n')
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            self.stop()
+            raise RuntimeError("Worker process exited unexpectedly")
+
+        while True:
+            try:
+                response = self._responses.get(timeout=timeout)
+            except queue.Empty:
+                kill_process_group(self.process.pid)
+                self.stop()
+                raise subprocess.TimeoutExpired(self.command, timeout)
+            if response is None:
+                exit_code = self.process.wait()
+                self.process = None
+                raise RuntimeError(f"Worker process exited unexpectedly with code {exit_code}")
+            if response.get('id') == request['id']:
+                break
+
+        self.calls += 1
+        response['rss_mb'] = self.rss_mb()
+        if self.calls >= self.max_calls or response['rss_mb'] >= self.max_rss_mb:
+            self.stop()
+        return response
+
+    def stop(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            kill_process_group(self.process.pid)
+            self.process.wait()
+        self.process = None
+
+
+class WorkerPool:
+    """Thread-safe pool of persistent workers for a single language."""
+
+    def __init__(self, command: List[str], max_calls: int = DEFAULT_MAX_CALLS, max_rss_mb: float = DEFAULT_MAX_RSS_MB):
+        self.command = command
+        self.max_calls = max_calls
+        self.max_rss_mb = max_rss_mb
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> PersistentWorker:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return PersistentWorker(self.command, self.max_calls, self.max_rss_mb)
+
+    def release(self, worker: PersistentWorker):
+        with self._lock:
+            self._idle.append(worker)
+
+    def call(self, request: Dict[str, Any], timeout: float, cpu: Optional[int] = None) -> Dict[str, Any]:
+        worker = self.acquire()
+        try:
+            return worker.call(request, timeout, cpu)
+        finally:
+            self.release(worker)
+
+    def shutdown(self):
+        with self._lock:
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.stop()
+
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+_POOL_SETTINGS = {'max_calls': DEFAULT_MAX_CALLS, 'max_rss_mb': DEFAULT_MAX_RSS_MB}
+
+
+def configure_workers(max_calls: Optional[int] = None, max_rss_mb: Optional[float] = None):
+    """Set recycling thresholds for worker pools created from now on."""
+    if max_calls is not None:
+        _POOL_SETTINGS['max_calls'] = max_calls
+    if max_rss_mb is not None:
+        _POOL_SETTINGS['max_rss_mb'] = max_rss_mb
+
+
+def get_worker_pool(language: str) -> WorkerPool:
+    """Return the shared worker pool for a language, creating it on first use."""
+    with _POOLS_LOCK:
+        if language not in _POOLS:
+            if language == 'python':
+                command = [sys.executable, os.path.join(HARNESS_DIR, 'python_worker.py')]
+            elif language == 'javascript':
+                command = ['node', os.path.join(HARNESS_DIR, 'node_harness.js'), V8_CODE_CACHE_DIR]
+            else:
+                raise ValueError(f"No persistent worker available for language: {language}")
+            _POOLS[language] = WorkerPool(command, **_POOL_SETTINGS)
+        return _POOLS[language]
+
+
+def shutdown_workers():
+    """Stop every idle worker in every pool."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    for pool in pools:
+        pool.shutdown()
@@ -0,0 +1,97 @@
+"""
+Behavioural tests for the keys of cached work: a Go build and an evaluation-cache cell
+must change whenever something that changes the result does, and only then.
+"""
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import runtimes
+from src.runner import go_source_hash
+from src.eval_cache import configure_eval_cache, cell_key
+
+GO_SOURCE = 'package main\n\nfunc main() {}\n'
+ITEM = {'case': {'test_case': 1, 'expected_result': '1'}, 'input_data': '1\n'}
+
+
+@pytest.fixture
+def solution(tmp_path):
+    file_path = tmp_path / 'Solution.go'
+    file_path.write_text(GO_SOURCE, encoding='utf-8')
+    return str(file_path)
+
+
+@pytest.fixture
+def eval_cache():
+    configure_eval_cache({'enabled': True})
+    yield
+    configure_eval_cache()
+
+
+def pgo_runtime(profile):
+    return {'runtime_id': 'go-pgo', 'language': 'go', 'build_flags': [f'-pgo={profile}'], 'pgo': True}
+
+
+def test_go_build_key_follows_the_pgo_profile_contents(tmp_path, solution):
+    profile = tmp_path / 'task.pprof'
+    profile.write_bytes(b'first')
+    flags = [f'-pgo={profile}']
+    before = go_source_hash(solution, flags)
+    assert go_source_hash(solution, flags) == before
+
+    profile.write_bytes(b'second')
+    assert go_source_hash(solution, flags) != before
+
+
+def test_go_build_key_follows_source_and_flags(solution):
+    key = go_source_hash(solution)
+    assert go_source_hash(solution, ['-gcflags=all=-l']) != key
+    with open(solution, 'a', encoding='utf-8') as f:
+        f.write('\n// changed\n')
+    assert go_source_hash(solution) != key
+
+
+def test_resolved_pgo_runtime_carries_the_profile_digest(tmp_path, monkeypatch):
+    profile = tmp_path / 'task.pprof'
+    monkeypatch.setattr(runtimes, 'merge_pgo_profile', lambda task_id: str(profile))
+    runtime = {'runtime_id': 'go-pgo', 'language': 'go', 'build_flags': [], 'pgo': True}
+
+    profile.write_bytes(b'first')
+    first = runtimes.resolve_runtime(runtime, 'task')
+    profile.write_bytes(b'second')
+    second = runtimes.resolve_runtime(runtime, 'task')
+    assert first['build_flags'] == second['build_flags'] == [f'-pgo={profile}']
+    assert first['pgo_digest'] != second['pgo_digest']
+
+
+def test_cell_key_is_none_while_the_cache_is_disabled(solution):
+    configure_eval_cache()
+    assert cell_key('test', solution, 'go', ITEM) is None
+
+
+def test_cell_key_follows_the_pgo_digest(eval_cache, solution):
+    runtime = pgo_runtime('/profiles/task.pprof')
+    first = cell_key('test', solution, 'go', ITEM, {'runtime': dict(runtime, pgo_digest='a')})
+    assert cell_key('test', solution, 'go', ITEM, {'runtime': dict(runtime, pgo_digest='a')}) == first
+    assert cell_key('test', solution, 'go', ITEM, {'runtime': dict(runtime, pgo_digest='b')}) != first
+
+
+def test_cell_key_follows_the_interpreter(eval_cache, solution, monkeypatch):
+    runtime = {'runtime_id': 'cpython-3.12.1', 'language': 'python', 'executable': '/usr/bin/python3.12'}
+    first = cell_key('test', solution, 'python', ITEM, {'runtime': runtime})
+    moved = cell_key('test', solution, 'python', ITEM, {'runtime': dict(runtime, executable='/opt/python3.12')})
+    assert moved != first
+
+    monkeypatch.setattr(runtimes, 'host_interpreter', lambda: '/opt/host/python3.13')
+    assert runtimes.interpreter_of('python', executor='subinterpreter') == '/opt/host/python3.13'
+    assert runtimes.interpreter_of('python', executor='process') == sys.executable
+    process = cell_key('test', solution, 'python', ITEM, {'executor': 'process'})
+    assert cell_key('test', solution, 'python', ITEM, {'executor': 'subinterpreter'}) != process
+
+
+def test_cell_key_follows_the_input(eval_cache, solution):
+    first = cell_key('test', solution, 'go', ITEM)
+    assert cell_key('test', solution, 'go', dict(ITEM, input_data='2\n')) != first
+    assert cell_key('execution', solution, 'go', ITEM) != first
@@ -0,0 +1,59 @@
+"""
+Behavioural tests for the dedup canonicaliser: solutions that differ only in what cannot
+change their output share a fingerprint, and nothing else does.
+"""
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.dedup import behaviour_fingerprint, python_fingerprint, token_fingerprint
+
+
+@pytest.mark.parametrize('first, second', [
+    ('x = 1\nprint(x)\n', 'total = 1\nprint(total)\n'),
+    ('def f(a):\n    """Doc."""\n    return a + 1\n', 'def g(b):\n    # comment\n    return b+1\n')
+], ids=['variable', 'function_and_docstring'])
+def test_renamed_bindings_share_a_fingerprint(first, second):
+    assert python_fingerprint(first) == python_fingerprint(second)
+
+
+def test_placeholder_cannot_collide_with_a_free_name():
+    assert python_fingerprint('x = 1\nprint(_v0)\n') != python_fingerprint('_v0 = 1\nprint(_v0)\n')
+
+
+@pytest.mark.parametrize('source', [
+    'import sys\nvalue = 1\nprint(sys.argv, value)\n',
+    'print(getattr(__builtins__, "len")("ab"))\n'
+], ids=['imports', 'getattr'])
+def test_free_names_are_kept(source):
+    canonical = python_fingerprint(source)
+    assert "'print'" in canonical
+
+
+def test_entry_point_keeps_its_name():
+    first = 'def allocate_bed(beds):\n    return beds\n'
+    second = 'def assign_bed(beds):\n    return beds\n'
+    assert behaviour_fingerprint(first, 'python') == behaviour_fingerprint(second, 'python')
+    assert behaviour_fingerprint(first, 'python', 'task_1') != behaviour_fingerprint(second, 'python', 'task_1')
+
+
+def test_unparsable_python_falls_back_to_the_source():
+    assert behaviour_fingerprint('def f(:\n', 'python') != behaviour_fingerprint('def f( :\n', 'python')
+
+
+@pytest.mark.parametrize('first, second', [
+    ('a = b++ + c;', 'a = b + ++c;'),
+    ('x := <-ch', 'x := < -ch'),
+    ('a = b - -c;', 'a = b--c;')
+], ids=['increment', 'receive', 'decrement'])
+def test_operators_are_tokenized_whole(first, second):
+    assert token_fingerprint(first) != token_fingerprint(second)
+
+
+def test_layout_and_comments_do_not_count():
+    first = 'function f(a) {\n    return a + 1; // one\n}\n'
+    second = 'function f(a) {\n  /* one */ return a+1;\n}'
+    assert token_fingerprint(first) == token_fingerprint(second)
+    assert behaviour_fingerprint(first, 'javascript') != behaviour_fingerprint(first, 'go')
@@ -0,0 +1,76 @@
+"""
+Regression tests for process-group teardown: no process started by a solution may
+outlive its run, whether the run times out or the solution exits and leaves a
+grandchild behind.
+"""
+import os
+import sys
+import asyncio
+import psutil
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.runner import run_code, run_code_async
+
+SOLUTION_TEMPLATE = '''import os
+import subprocess
+import time
+
+grandchild = subprocess.Popen(['sleep', '30'])
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pids.txt'), 'w') as f:
+    f.write(f'{{os.getpgid(0)}} {{grandchild.pid}}')
+{ending}
+'''
+
+ENDINGS = {
+    'timeout': 'time.sleep(30)',
+    'early_exit': 'print("done")'
+}
+
+
+def live_group_members(pgid):
+    """Processes of the group that are still running (zombies have already exited)."""
+    members = []
+    for process in psutil.process_iter(['pid', 'status']):
+        try:
+            if os.getpgid(process.pid) == pgid and process.info['status'] != psutil.STATUS_ZOMBIE:
+                members.append(process.pid)
+        except (ProcessLookupError, PermissionError, psutil.Error):
+            continue
+    return members
+
+
+def write_solution(tmp_path, ending):
+    file_path = tmp_path / 'Solution.py'
+    file_path.write_text(SOLUTION_TEMPLATE.format(ending=ENDINGS[ending]), encoding='utf-8')
+    return str(file_path)
+
+
+def read_pids(tmp_path):
+    pgid, grandchild = (tmp_path / 'pids.txt').read_text(encoding='utf-8').split()
+    return int(pgid), int(grandchild)
+
+
+def run_sync(file_path):
+    return run_code(file_path, 'python', input_data='', timeout=1)
+
+
+def run_async(file_path):
+    return asyncio.run(run_code_async(file_path, 'python', input_data='', timeout=1))
+
+
+@pytest.mark.skipif(not hasattr(os, 'killpg'), reason='process groups are POSIX only')
+@pytest.mark.parametrize('run', [run_sync, run_async], ids=['run_code', 'run_code_async'])
+@pytest.mark.parametrize('ending', sorted(ENDINGS))
+def test_no_process_outlives_its_run(tmp_path, run, ending):
+    result = run(write_solution(tmp_path, ending))
+
+    pgid, grandchild = read_pids(tmp_path)
+    assert live_group_members(pgid) == []
+    assert not psutil.pid_exists(grandchild) or psutil.Process(grandchild).status() == psutil.STATUS_ZOMBIE
+    if ending == 'timeout':
+        assert result['error_type'] == 'TimeoutError'
+    else:
+        assert result['success']
+        assert result['stdout'].strip() == 'done'